@@ -0,0 +1,112 @@
+"""
+Measure how map loading, platform lookups, bullet collisions and level updates scale with the map size
+and the number of enemies. Maps and levels are generated by LevelGenerator, so every run with the same
+seed measures the same content.
+
+Run from the repository root:
+
+    python -m benchmarks.level_scaling --sizes 20x15 40x30 64x48 --enemies 1 50 200
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Tuple
+
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.utils.level_compiler import LevelCompiler
+from src.utils.level_generator import LevelGenerator
+from src.utils.map_loader import MapLoader
+
+TILE_PIXELS = 64
+LOOKUPS = 100_000
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def measure_map_load(map_path: str, resolution: Tuple[int, int]) -> float:
+    MapLoader._cache.clear()
+    start = time.perf_counter()
+    MapLoader.load_map(map_path, *resolution)
+    return time.perf_counter() - start
+
+
+def measure_lookups(scene: HeadlessLevelScene) -> float:
+    """
+    Mean time of one platform lookup and landing test of the player at random positions.
+    """
+    player = scene.player
+    positions = [random.randrange(scene.map_data.width) for _ in range(LOOKUPS)]
+    bottom = player.rect.bottom
+    start = time.perf_counter()
+    for x in positions:
+        player.rect.centerx = x
+        player._check_landing(bottom)
+    return (time.perf_counter() - start) / LOOKUPS
+
+
+def measure_frames(scene: HeadlessLevelScene, frames: int) -> Tuple[float, float]:
+    """
+    Mean time of a whole update and of the bullet collision part of it.
+    """
+    check_bullet_collisions = scene._check_bullet_collisions
+    collisions = 0.0
+
+    def timed_collisions():
+        nonlocal collisions
+        collision_start = time.perf_counter()
+        check_bullet_collisions()
+        collisions += time.perf_counter() - collision_start
+
+    scene._check_bullet_collisions = timed_collisions
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.update()
+    total = time.perf_counter() - start
+    del scene._check_bullet_collisions
+    return total / frames, collisions / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure level code over generated maps and levels.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[(20, 15), (40, 30), (64, 48)],
+                        help="map sizes in tiles, e.g. 40x30")
+    parser.add_argument("--enemies", nargs="+", type=int, default=[1, 50, 200])
+    parser.add_argument("--density", type=float, default=0.5)
+    parser.add_argument("--layers", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    HeadlessLevelScene.init_display()
+    game_manager, level_manager = GameManager(audio_enabled=False), LevelManager()
+    random.seed(args.seed)
+
+    print(f"{'map':>8} {'enemies':>8} {'load ms':>9} {'lookup us':>10} {'update ms':>10} {'collide ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for cols, rows in args.sizes:
+            for enemies in args.enemies:
+                name = f"map_{cols}x{rows}_{enemies}"
+                generator = LevelGenerator(args.seed)
+                map_path, level_path = generator.write(directory, name, cols, rows, args.density, args.layers, enemies)
+                resolution = (cols * TILE_PIXELS, rows * TILE_PIXELS)
+
+                load = measure_map_load(map_path, resolution)
+                scene = HeadlessLevelScene(LevelCompiler.load_level(level_path), game_manager, level_manager, resolution)
+                scene.initialize()
+                lookup = measure_lookups(scene)
+                scene.initialize()
+                update, collide = measure_frames(scene, args.frames)
+                print(f"{cols}x{rows:<5} {enemies:>8} {1000 * load:>9.1f} {1e6 * lookup:>10.2f} "
+                      f"{1000 * update:>10.3f} {1000 * collide:>11.3f}")
+                os.remove(map_path)
+
+
+if __name__ == "__main__":
+    main()
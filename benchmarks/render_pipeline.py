@@ -0,0 +1,104 @@
+"""
+Measure the throughput of the level loop (update and draw of every frame) with drawing on the same
+thread and with drawing pipelined on the render thread (RenderPipeline). The gain depends on the
+number of cores and on how much of the drawing releases the GIL, so it is worth measuring on the
+target machine. The render surface is presented by scaling it to the screen size, as the game does
+with a lower render resolution.
+
+Run from the repository root:
+
+    python -m benchmarks.render_pipeline --size 40x30 --enemies 100 --resolution 2560x1600
+"""
+import argparse
+import tempfile
+import time
+
+import pygame
+
+from benchmarks.level_scaling import parse_size
+from src.entities.player_bot import PlayerBot
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.managers.render_pipeline import RenderPipeline
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.utils.level_compiler import LevelCompiler
+from src.utils.level_generator import LevelGenerator
+
+
+class Presenter:
+    """
+    Scale the render surface to an off-screen "screen", which stands for the upscale and flip.
+    """
+
+    def __init__(self, surface: pygame.Surface, screen_size):
+        self.surface = surface
+        self.screen = pygame.Surface(screen_size)
+
+    def __call__(self):
+        pygame.transform.scale(self.surface, self.screen.get_size(), self.screen)
+
+
+def create_scene(level_path: str, resolution) -> HeadlessLevelScene:
+    scene = HeadlessLevelScene(LevelCompiler.load_level(level_path), GameManager(audio_enabled=False),
+                               LevelManager(), resolution)
+    scene.initialize()
+    scene.player.input_source = PlayerBot(scene)
+    return scene
+
+
+def step(scene: HeadlessLevelScene):
+    scene.update()
+    if scene.finished:
+        scene.initialize()
+        scene.player.input_source = PlayerBot(scene)
+
+
+def measure_sequential(scene: HeadlessLevelScene, present: Presenter, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        step(scene)
+        scene.draw()
+        present()
+    return frames / (time.perf_counter() - start)
+
+
+def measure_pipelined(scene: HeadlessLevelScene, present: Presenter, frames: int) -> float:
+    """
+    Every frame is rendered (submit waits for the render thread instead of dropping frames), so the
+    result is comparable with the sequential loop.
+    """
+    pipeline = RenderPipeline(present)
+    start = time.perf_counter()
+    for _ in range(frames):
+        step(scene)
+        pipeline.submit(scene, scene.describe(), wait=True)
+    pipeline.stop()
+    elapsed = time.perf_counter() - start
+    assert pipeline.rendered == frames
+    return frames / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sequential and pipelined rendering of a level.")
+    parser.add_argument("--size", type=parse_size, default=(40, 30), help="map size in tiles, e.g. 40x30")
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--resolution", type=parse_size, default=(2560, 1600), help="render resolution")
+    parser.add_argument("--screen", type=parse_size, default=(2560, 1600), help="presented screen size")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    HeadlessLevelScene.init_display()
+    cols, rows = args.size
+    with tempfile.TemporaryDirectory() as directory:
+        _, level_path = LevelGenerator(args.seed).write(directory, "pipeline", cols, rows, enemies=args.enemies)
+        results = {}
+        for name, measure in (("sequential", measure_sequential), ("pipelined", measure_pipelined)):
+            scene = create_scene(level_path, args.resolution)
+            results[name] = measure(scene, Presenter(scene.surface, args.screen), args.frames)
+            print(f"{name:>10}: {results[name]:8.1f} frames/s", flush=True)
+    print(f"speedup: {results['pipelined'] / results['sequential']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Play a generated level for a long time and report frame time and memory at regular intervals. The level
+is restarted whenever it finishes, so restarts, entity pooling and bullet turnover are soaked as well.
+Growing memory or frame time between reports points to a leak.
+
+Run from the repository root:
+
+    python -m benchmarks.soak --size 40x30 --enemies 100 --duration 600
+"""
+import argparse
+import resource
+import tempfile
+import time
+
+from benchmarks.level_scaling import TILE_PIXELS, parse_size
+from src.entities.player_bot import PlayerBot
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.utils.level_compiler import LevelCompiler
+from src.utils.level_generator import LevelGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak the level simulation on a generated level.")
+    parser.add_argument("--size", type=parse_size, default=(40, 30), help="map size in tiles, e.g. 40x30")
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--density", type=float, default=0.5)
+    parser.add_argument("--layers", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between reports")
+    parser.add_argument("--draw", action="store_true", help="also draw every frame")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    HeadlessLevelScene.init_display()
+    cols, rows = args.size
+    with tempfile.TemporaryDirectory() as directory:
+        generator = LevelGenerator(args.seed)
+        _, level_path = generator.write(directory, "soak", cols, rows, args.density, args.layers, args.enemies)
+        resolution = (cols * TILE_PIXELS, rows * TILE_PIXELS)
+        scene = HeadlessLevelScene(LevelCompiler.load_level(level_path), GameManager(audio_enabled=False),
+                                   LevelManager(), resolution)
+        scene.initialize()
+        scene.player.input_source = PlayerBot(scene)
+
+        end = time.perf_counter() + args.duration
+        restarts = frames = 0
+        report_start = time.perf_counter()
+        while report_start < end:
+            scene.update()
+            if args.draw:
+                scene.draw()
+            frames += 1
+            if scene.finished:
+                scene.initialize()
+                scene.player.input_source = PlayerBot(scene)
+                restarts += 1
+
+            now = time.perf_counter()
+            if now - report_start >= args.interval:
+                max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                bullets = len(scene.player_bullets) + len(scene.enemy_bullets)
+                print(f"frame={1000 * (now - report_start) / frames:.3f} ms entities={len(scene.entities)} "
+                      f"bullets={bullets} restarts={restarts} max_rss={max_rss_mb:.1f} MB", flush=True)
+                frames = 0
+                report_start = now
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,93 @@
+import argparse
+import sys
+import time
 import pygame
 
+from typing import Optional, Tuple
+
+from src.managers.frame_pacer import FramePacer
 from src.managers.game_manager import GameManager, GameScenes
+from src.managers.hot_reloader import HotReloader
 from src.managers.level_manager import LevelManager
+from src.managers.render_pipeline import RenderPipeline
 from src.scenes.level_scene import LevelScene
 from src.scenes.menu_scene import MenuScene
 from src.scenes.pause_scene import PauseScene
+from src.scenes.survival_scene import SurvivalScene
+from src.utils.asset_pack import AssetPack
 
 
 class Game:
     """
     Main application class. Create scenes for individual game scenes and run the game loop.
+    The loop is paced by the FramePacer (see its modes).
+
+    Scenes can draw into an internal render surface with a fixed resolution instead of the screen.
+    It is presented by one scaled blit per frame (keeping the aspect ratio), so asset scaling and
+    the per-pixel work of each frame depend on the render resolution instead of the monitor.
+    Mouse positions are mapped back to the render surface before the scenes see them.
+
+    In pipelined mode scenes that can describe their frames (see Scene.describe) are rendered and
+    presented by the RenderPipeline thread while the next frame is simulated.
+
+    In dev mode the level and map files are watched by the HotReloader, changed ones are loaded
+    again the next time a level starts.
     """
-    def __init__(self):
+    TICK_RATE = 60
+    STATS_INTERVAL = 5
+
+    MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+    def __init__(self, pacing: str = "hybrid", show_frame_stats: bool = False,
+                 resolution: Optional[Tuple[int, int]] = None, pipelined: bool = False,
+                 asset_pack: bool = True, dev: bool = False, pixel_perfect_hits: bool = False):
         pygame.init()
+        if asset_pack and not dev:
+            AssetPack.activate()
         self.running = True
-        self._init_display()
+        self.pacer = FramePacer(self.TICK_RATE, pacing)
+        self.show_frame_stats = show_frame_stats
+        self._init_display(resolution)
+        self.pipeline = RenderPipeline(self._present_frame) if pipelined else None
+        self.pixel_perfect_hits = pixel_perfect_hits
         self._load_scenes()
+        self.hot_reloader = HotReloader(self.level_manager) if dev else None
         self.scene = None
+        self.pacer.reset()
+
+    def _init_display(self, resolution: Optional[Tuple[int, int]]):
+        """
+        Set up the display to fullscreen mode. Without a render resolution (or with the native one)
+        the scenes draw straight to the screen.
+        """
+        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        screen_width, screen_height = self.screen.get_size()
+        if resolution is None or resolution == (screen_width, screen_height):
+            self.surface = self.screen
+            self.viewport = self.screen.get_rect()
+            return
+
+        width, height = resolution
+        self.surface = pygame.Surface(resolution).convert()
+        scale = min(screen_width / width, screen_height / height)
+        self.viewport = pygame.Rect(0, 0, round(width * scale), round(height * scale))
+        self.viewport.center = self.screen.get_rect().center
+        self.screen.fill((0, 0, 0))
+        self._presented = self.screen.subsurface(self.viewport)
 
-    def _init_display(self):
+    def _present(self):
         """
-        Set up the display to fullscreen mode and initialize the clock.
+        Scale the render surface into the viewport of the screen (bars around it stay black).
         """
-        self.surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.clock = pygame.time.Clock()
+        if self.surface is not self.screen:
+            pygame.transform.scale(self.surface, self.viewport.size, self._presented)
+        pygame.display.flip()
+
+    def _to_render_position(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        x, y = position
+        width, height = self.surface.get_size()
+        return ((x - self.viewport.x) * width // self.viewport.width,
+                (y - self.viewport.y) * height // self.viewport.height)
 
     def _load_scenes(self):
         """
@@ -33,8 +97,11 @@ class Game:
         self.level_manager = LevelManager()
         self.scenes = {
             GameScenes.MENU: MenuScene(self.surface, self.game_manager, self.level_manager),
-            GameScenes.LEVEL: LevelScene(self.surface, self.game_manager, self.level_manager),
+            GameScenes.LEVEL: LevelScene(self.surface, self.game_manager, self.level_manager, self.TICK_RATE,
+                                         self.pixel_perfect_hits),
             GameScenes.PAUSE: PauseScene(self.surface, self.game_manager),
+            GameScenes.SURVIVAL: SurvivalScene(self.surface, self.game_manager, self.level_manager, self.TICK_RATE,
+                                               self.pixel_perfect_hits, self.pacer),
         }
 
     def _check_scene_change(self):
@@ -43,15 +110,22 @@ class Game:
         """
         new_scene = self.scenes[self.game_manager.current_scene]
         if new_scene != self.scene:
+            if self.pipeline:
+                self.pipeline.wait_idle()
             new_scene.initialize()
             self.scene = new_scene
+            self.pacer.reset()
 
     def _handle_events(self):
         """
-        Handle all pygame events like keystrokes and mouse clicks.
+        Handle all pygame events like keystrokes and mouse clicks. Pumping the events also updates
+        the key state read by the player, so it is done right before each simulation step.
         """
         for event in pygame.event.get():
+            if event.type in self.MOUSE_EVENTS and self.surface is not self.screen:
+                event = pygame.event.Event(event.type, {**event.dict, "pos": self._to_render_position(event.pos)})
             self.scene.handle_event(event)
+        self.pacer.input_sampled()
 
     def _update(self):
         """
@@ -61,23 +135,81 @@ class Game:
 
     def _draw(self):
         """
-        Draw scene and show it (by flipping the surface)
+        Draw scene and show it (by flipping the surface). In pipelined mode the frame description is
+        handed over to the render thread instead, unless the scene does not provide one.
         """
+        frame = self.scene.describe() if self.pipeline else None
+        if frame is not None:
+            self.pipeline.submit(self.scene, frame)
+            return
+
+        if self.pipeline:
+            self.pipeline.wait_idle()
         self.scene.draw()
-        pygame.display.flip()
+        self._present_frame()
+
+    def _present_frame(self):
+        self._present()
+        self.pacer.frame_presented()
+
+    def _report_frame_stats(self):
+        now = time.perf_counter()
+        if self.show_frame_stats and now - self._stats_time >= self.STATS_INTERVAL:
+            print(self.pacer.stats(), file=sys.stderr)
+            if self.pipeline:
+                print(f"[Render Pipeline] rendered={self.pipeline.rendered} dropped={self.pipeline.dropped}",
+                      file=sys.stderr)
+            self._stats_time = now
 
     def run(self):
         """
-        Main game loop.
+        Main game loop. Each iteration waits for the simulation steps that are due, samples the
+        input and updates the scene for each of them and draws once. When the game falls behind,
+        several steps run before one draw (draw skipping). In uncapped mode the loop draws even
+        when no step is due.
         """
+        self._stats_time = time.perf_counter()
         while self.running:
-            self._check_scene_change()
-            self._handle_events()
-            self._update()
-            self._draw()
-            self.clock.tick(60)
+            steps = self.pacer.wait()
+            if self.hot_reloader:
+                self.hot_reloader.poll()
+            for _ in range(steps):
+                self._check_scene_change()
+                self._handle_events()
+                self._update()
+            if steps or self.pacer.uncapped:
+                self._draw()
+            self._report_frame_stats()
+        if self.pipeline:
+            self.pipeline.stop()
+
+
+def parse_resolution(text: str) -> Tuple[int, int]:
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Gun Mayhem")
+    parser.add_argument("--pacing", choices=FramePacer.MODES, default="hybrid",
+                        help="how to wait for the next frame (see FramePacer)")
+    parser.add_argument("--frame-stats", action="store_true",
+                        help="print frame pacing and input latency statistics to stderr")
+    parser.add_argument("--resolution", type=parse_resolution,
+                        help="internal render resolution, e.g. 2560x1600 or 1280x800 (default: native)")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="render and present frames on a separate thread")
+    parser.add_argument("--loose-assets", action="store_true",
+                        help="load the loose asset files even if the asset pack is built")
+    parser.add_argument("--dev", action="store_true",
+                        help="reload changed level and map files without restarting (uses the loose files)")
+    parser.add_argument("--pixel-perfect-hits", action="store_true",
+                        help="bullets only hit the opaque pixels of entities instead of their rects")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    app = Game()
+    args = parse_args()
+    app = Game(args.pacing, args.frame_stats, args.resolution, args.pipelined, not args.loose_assets, args.dev,
+               args.pixel_perfect_hits)
     app.run()
@@ -1,11 +1,18 @@
 import os
 
 # Folders
+ASSET_PATH = "assets"
 IMAGE_PATH = os.path.join("assets", "images")
 LEVEL_PATH = os.path.join("assets", "levels")
+MIP_PATH = os.path.join("assets", "mips")
 MAP_PATH = os.path.join("assets", "maps")
+WEAPON_PATH = os.path.join("assets", "weapons")
 
 # Files
 BACKGROUND = os.path.join(IMAGE_PATH, "map", "background", "background.png")
 CONTROLS = os.path.join(IMAGE_PATH, "controls", "controls.png")
-MUSIC = os.path.join("assets", "sounds", "music.mp3")
\ No newline at end of file
+MUSIC = os.path.join("assets", "sounds", "music.mp3")
+ASSET_PACK = os.path.join("assets", "assets.pack")
+SAVE = os.path.join(os.path.expanduser("~"), ".gun_mayhem", "save.json")
+LEVEL_INDEX = os.path.join(os.path.expanduser("~"), ".gun_mayhem", "level_index.json")
+SURVIVAL = os.path.join(LEVEL_PATH, "survival.json")
\ No newline at end of file
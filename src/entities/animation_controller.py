@@ -0,0 +1,53 @@
+import math
+from typing import Dict, Tuple
+
+
+class AnimationController:
+    """
+    Animation clock driven by simulation ticks. The frame shown in each tick of an animation is read
+    from a lookup table precomputed per (number of frames, animation speed, looping), so drawing is
+    a pure lookup and the animation runs at the same speed however often (or whether at all) the
+    entity is drawn.
+
+    Looping animations (entity states) repeat their table, non-looping ones (shooting) finish after
+    the last frame was shown for its full time.
+    """
+    _tables: Dict[Tuple[int, float, bool], Tuple[int, ...]] = {}
+
+    def __init__(self, speed: float):
+        self.speed = speed
+        self.tick = 0
+        self.loop = True
+        self.table: Tuple[int, ...] = (0,)
+
+    @classmethod
+    def get_table(cls, length: int, speed: float, loop: bool) -> Tuple[int, ...]:
+        """
+        Frame index for each tick of one pass through the animation. A frame is shown for 1 / speed
+        ticks, the small epsilon keeps exact products like 5 * 0.2 from rounding down.
+        """
+        key = (length, speed, loop)
+        if key not in cls._tables:
+            ticks = max(1, math.ceil(length / speed - 1e-9))
+            cls._tables[key] = tuple(min(int(tick * speed + 1e-9), length - 1) for tick in range(ticks))
+        return cls._tables[key]
+
+    def start(self, length: int, loop: bool = True, tick: int = 0):
+        self.table = self.get_table(length, self.speed, loop)
+        self.loop = loop
+        self.tick = tick
+
+    def advance(self) -> bool:
+        """
+        Move the animation by one tick. Return True when a non-looping animation has just finished.
+        """
+        self.tick += 1
+        if self.loop:
+            if self.tick == len(self.table):
+                self.tick = 0
+            return False
+        return self.tick == len(self.table)
+
+    @property
+    def frame(self) -> int:
+        return self.table[self.tick] if self.tick < len(self.table) else self.table[-1]
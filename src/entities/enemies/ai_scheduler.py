@@ -0,0 +1,61 @@
+from typing import List, Tuple
+
+import pygame
+
+
+class AIScheduler:
+    """
+    Spread the expensive enemy decisions (navigation to the player's platform) over frames.
+
+    In each frame at most PLANS_PER_TICK enemies are allowed to replan, taken round-robin from
+    the enemy list, so the planning cost per frame does not grow with the number of enemies.
+    Enemies that are far from the player or off-screen are low-detail: they are only planned in
+    every FAR_INTERVAL-th pass over the list. Time-critical reactions (facing the player, shooting,
+    stopping at platform edges and dodging bullets) are not scheduled, enemies run them in every
+    frame.
+    """
+    PLANS_PER_TICK = 4
+    FAR_INTERVAL = 4
+    FAR_DISTANCE = 0.5
+
+    def __init__(self, viewport: pygame.Rect):
+        self.viewport = viewport
+        self.far_distance = viewport.width * self.FAR_DISTANCE
+        self._cursor = 0
+        self._passes = 0
+
+    @property
+    def state(self) -> Tuple[int, int]:
+        """
+        Position of the round-robin cursor. Stored in level snapshots to keep replays deterministic.
+        """
+        return self._cursor, self._passes
+
+    @state.setter
+    def state(self, state: Tuple[int, int]) -> None:
+        self._cursor, self._passes = state
+
+    def schedule(self, enemies: List, player_rect: pygame.Rect) -> None:
+        """
+        Mark the enemies that should replan in this frame by setting their replan_due flag.
+        """
+        count = len(enemies)
+        planned = visited = 0
+        while planned < self.PLANS_PER_TICK and visited < count:
+            if self._cursor >= count:
+                self._cursor = 0
+                self._passes += 1
+
+            enemy = enemies[self._cursor]
+            self._cursor += 1
+            visited += 1
+
+            if self._passes % self.FAR_INTERVAL and self._is_low_detail(enemy, player_rect):
+                continue
+            enemy.replan_due = True
+            planned += 1
+
+    def _is_low_detail(self, enemy, player_rect: pygame.Rect) -> bool:
+        if not self.viewport.colliderect(enemy.rect):
+            return True
+        return abs(enemy.rect.centerx - player_rect.centerx) > self.far_distance
@@ -1,7 +1,8 @@
 import os.path
-import pygame
 
 from src.constants.paths import IMAGE_PATH
+from src.entities.enemies.threat_predictor import ThreatPredictor
+from src.entities.enemies.world_perception import WorldPerception
 from src.entities.entity import Entity
 from src.model.entity_config import EntityConfig
 
@@ -10,40 +11,39 @@ class Enemy(Entity):
     def __init__(self, entity_config: EntityConfig):
         image_path = os.path.join(IMAGE_PATH, 'entity', 'enemy')
         super().__init__(entity_config, image_path)
-        self._init_vision_sprite()
 
-    def _init_vision_sprite(self):
-        """
-        Create a vision sprite to detect incoming bullets. The range is based on
-        bullet speed, jump strength and sprite size.
-        """
-        self._vision_range = abs(self.physics.bullet_speed * self.physics.jump_speed) - self.width // 2
-        self._vision_sprite = pygame.sprite.Sprite()
-        self._vision_sprite.rect = pygame.Rect(self.rect.x, self.rect.y, self.width, self.height)
+    def reset(self, config: EntityConfig):
+        super().reset(config)
+        self.replan_due = True
+        self._threat_predictor = ThreatPredictor(self.physics)
 
     def update(self, *args, **kwargs):
-        self._ai_logic(
-            player_bullets=kwargs.get('player_bullets'),
-            player_center=kwargs.get('player_center'),
-            player_platform=kwargs.get('player_platform')
-        )
+        self._ai_logic(kwargs.get('perception'))
         super().update(*args, **kwargs)
 
-    def _ai_logic(self, player_bullets, player_center, player_platform):
+    def _ai_logic(self, perception: WorldPerception):
         """
         Simple AI logic:
         - Move toward the player’s platform
         - Face the player
         - Shoot and dodge player bullets
         - Stay near platform center
+
+        Navigation to the player's platform is only decided when the AI scheduler marks the enemy
+        as due for replanning (see AIScheduler). Reactions on the player's platform (facing the
+        player, shooting, moving toward the map center and stopping at the platform edge) and
+        dodging are made in each frame. Information about the player and bullets is read from the
+        world perception shared by all enemies.
         """
-        if self.platform != player_platform:
-            self._navigate_to_platform(player_platform)
+        replan, self.replan_due = self.replan_due, False
+        if self.platform != perception.player_platform:
+            if replan:
+                self._navigate_to_platform(perception.player_platform)
         else:
-            self._face_player(player_center)
+            self._face_player(perception.player_center)
             self._shoot()
-            self._dodge_bullets(player_bullets)
             self._move_to_map_center()
+        self._dodge_bullets(perception)
 
     def _face_player(self, player_center):
         """
@@ -52,18 +52,18 @@ class Enemy(Entity):
         if not self.shooting:
             self.facing_right = player_center >= self.rect.centerx
 
-    def _dodge_bullets(self, bullets: pygame.sprite.Group):
+    def _dodge_bullets(self, perception: WorldPerception):
         """
-        Check for bullets within the vision range and jump if needed. To make AI more unfathomable
-        we could also consider skipping platforms.
+        Jump if a player bullet (coming from either side) would pass below the enemy while it is
+        in the air. See ThreatPredictor. To make AI more unfathomable we could also consider
+        skipping platforms.
         """
-        offset = self._vision_range if self.facing_right else -self._vision_range
-        self._vision_sprite.rect.topleft = (self.rect.x + offset, self.rect.y)
+        if not self.on_ground:
+            return
 
-        if pygame.sprite.spritecollide(self._vision_sprite, bullets, dokill=False):
-            if self.on_ground:
-                self.on_ground = False
-                self.vy = self.physics.jump_speed
+        if self._threat_predictor.should_jump(self.rect, perception):
+            self.on_ground = False
+            self.vy = self.physics.jump_speed
 
     def _navigate_to_platform(self, target_platform):
         """
@@ -3,22 +3,30 @@ from typing import Type
 from src.entities.enemies.enemy import Enemy
 from src.entities.enemies.shrinker import Shrinker
 from src.entities.enemies.invisible import Invisible
+from src.entities.enemies.policy_enemy import PolicyEnemy
+from src.entities.entity_pool import EntityPool
 from src.model.entity_config import EntityConfig
 
 
 class EnemyFactory:
     """
-    Create an enemy instance based on the type specified in the config.
+    Create an enemy instance of the class resolved by LevelCompiler (see EnemyDefinition).
+    Instances released to the EntityPool are reused.
     """
 
     _enemy_classes: dict[str, Type[Enemy]] = {
         "default": Enemy,
         "shrinker": Shrinker,
         "invisible": Invisible,
+        "policy": PolicyEnemy,
     }
 
     @classmethod
-    def create_enemy(cls, config: EntityConfig) -> Enemy:
-        enemy_type = config.entity_data.get("type")
-        enemy_class = cls._enemy_classes.get(enemy_type)
-        return enemy_class(config)
+    def get_enemy_class(cls, enemy_type: str) -> Type[Enemy]:
+        if enemy_type not in cls._enemy_classes:
+            raise ValueError(f"unknown enemy type '{enemy_type}' (known: {', '.join(cls._enemy_classes)})")
+        return cls._enemy_classes[enemy_type]
+
+    @staticmethod
+    def create_enemy(config: EntityConfig) -> Enemy:
+        return EntityPool.acquire(config.entity_data.enemy_class, config)
@@ -7,11 +7,8 @@ class Invisible(Enemy):
     Invisible enemy.
 
     This enemy remains invisible to the player except when shooting or being hit.
-    Making it invisible even while shooting is possible, but keep in mind that the
-    overridden draw method would need to manually advance the shooting animation's
-    frame index. Otherwise, the entity would remain stuck in the 'shooting' state.
-    This issue could also be addressed by changing the shooting logic (for example,
-    by implementing a cooldown system for individual weapons).
+    Animations are advanced by the simulation ticks, not by drawing, so skipping the
+    drawing does not affect the shooting state.
     """
     def __init__(self, entity_config: EntityConfig):
         super().__init__(entity_config)
@@ -0,0 +1,37 @@
+from src.entities.enemies.enemy import Enemy
+from src.entities.enemies.world_perception import WorldPerception
+from src.model.entity_config import EntityConfig
+
+
+class PolicyEnemy(Enemy):
+    """
+    Enemy controlled from outside (for example by a trained policy) instead of the scripted AI.
+    The action is set before each update and applied like a key press of the player.
+    """
+    NOOP, LEFT, RIGHT, JUMP, DROP, SHOOT = range(6)
+    ACTION_COUNT = 6
+
+    def reset(self, config: EntityConfig):
+        super().reset(config)
+        self.action = self.NOOP
+
+    def _ai_logic(self, perception: WorldPerception):
+        """
+        Apply the current action. As for the player, a shooting enemy can only move to the side
+        it is facing, and jumping or dropping is only possible on the ground.
+        """
+        self.vx = 0
+        if self.action == self.LEFT and not (self.shooting and self.facing_right):
+            self.vx = -self.physics.move_speed
+            self.facing_right = False
+        elif self.action == self.RIGHT and not (self.shooting and not self.facing_right):
+            self.vx = self.physics.move_speed
+            self.facing_right = True
+        elif self.action == self.JUMP and self.on_ground:
+            self.on_ground = False
+            self.vy = self.physics.jump_speed
+        elif self.action == self.DROP and self.on_ground and self._is_platform_below():
+            self.on_ground = False
+            self.skip_platform = True
+        elif self.action == self.SHOOT:
+            self._shoot()
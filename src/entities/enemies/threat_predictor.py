@@ -0,0 +1,39 @@
+from typing import Optional, Tuple
+
+import pygame
+
+from src.entities.enemies.world_perception import WorldPerception
+from src.model.physics import Physics
+
+
+class ThreatPredictor:
+    """
+    Decide whether jumping avoids the bullets coming at an entity.
+
+    The first bullet to hit the entity comes from the shared perception (see
+    WorldPerception.impact). The entity jumps when the bullet would pass below it while it is in the
+    air: the jump has to lift the feet above the bullet before it arrives and must not land before
+    the bullet has passed. The airborne window is looked up in the jump table of the entity physics
+    (see Kinematics).
+    """
+
+    def __init__(self, physics: Physics):
+        self.physics = physics
+
+    def predict(self, rect: pygame.Rect, perception: WorldPerception) -> Optional[Tuple[float, float, float]]:
+        """
+        Return (time to impact, time to pass the hitbox, bullet top) of the first bullet that
+        will hit the rect, or None if no bullet is coming. Times are in frames.
+        """
+        return perception.impact(rect)
+
+    def should_jump(self, rect: pygame.Rect, perception: WorldPerception) -> bool:
+        threat = self.predict(rect, perception)
+        if threat is None:
+            return False
+
+        time, pass_time, top = threat
+        window = self.physics.kinematics.window(rect.bottom - top)
+        if window is None:
+            return False
+        return window[0] <= time and time + pass_time <= window[1]
@@ -0,0 +1,209 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.model.map_data import MapData
+
+
+class BulletLane:
+    """
+    Bullets flying in one lane, one row (left, right, top, bottom, vx, vy) per bullet in a NumPy
+    array. The array is refilled in each frame and only grows (doubling) when a frame has more
+    bullets than any frame before, so no objects are allocated per bullet.
+
+    The parts of the impact computation that do not depend on the hitbox (leading edges, inverse
+    speeds, ...) are prepared once per frame, on the first impact query, so each query is a fixed
+    number of array operations whatever the number of bullets.
+    """
+    __slots__ = ("_rows", "_count", "_prepared", "_front", "_from_left", "_from_right", "_inverse_speed",
+                 "_min_gap", "_tops", "_bottoms", "_vy", "_angled")
+
+    def __init__(self, capacity: int = 16):
+        self._rows = np.empty((capacity, 6))
+        self._count = 0
+        self._prepared = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows[:self._count]
+
+    def clear(self) -> None:
+        self._count = 0
+        self._prepared = False
+
+    def add(self, rect: pygame.Rect, vx: float, vy: float = 0.0) -> None:
+        if self._count == len(self._rows):
+            self._rows = np.concatenate((self._rows, np.empty_like(self._rows)))
+        self._rows[self._count] = (rect.left, rect.right, rect.top, rect.bottom, vx, vy)
+        self._count += 1
+        self._prepared = False
+
+    def _prepare(self) -> None:
+        """
+        The horizontal gap to a hitbox is front + left of the hitbox for bullets flying right and
+        front - right of the hitbox for bullets flying left. Bullets that stand never hit (their
+        minimal gap is infinite).
+        """
+        left, right, top, bottom, vx, vy = self.rows.T
+        speed = np.abs(vx)
+        self._front = np.where(vx > 0, -right, left)
+        self._from_left = (vx > 0).astype(float)
+        self._from_right = (vx < 0).astype(float)
+        self._inverse_speed = np.divide(1.0, speed, out=np.zeros_like(speed), where=speed > 0)
+        self._min_gap = np.where(speed > 0, left - right, np.inf)
+        self._tops, self._bottoms, self._vy = top, bottom, vy
+        self._angled = bool(vy.any())
+        self._prepared = True
+
+    def impact(self, rect: pygame.Rect) -> Optional[Tuple[float, float, float]]:
+        """
+        Return (time to impact, time to pass the rect, highest bullet top while passing) of the first
+        bullet of the lane that will hit the rect, or None. Times are in frames.
+
+        All bullets are handled by array operations. The time to impact is the horizontal gap divided
+        by the horizontal speed (bullets flying away never hit), the bullet hits when it overlaps the
+        rect vertically at that time (angled bullets move by vy per frame).
+        """
+        if not self._count:
+            return None
+        if not self._prepared:
+            self._prepare()
+
+        gap = self._front + (self._from_left * rect.left - self._from_right * rect.right)
+        time = np.maximum(gap, 0) * self._inverse_speed
+        hits = gap >= self._min_gap - rect.width
+        if self._angled:
+            shift = self._vy * time
+            hits &= (self._bottoms + shift > rect.top) & (self._tops + shift < rect.bottom)
+        else:
+            hits &= (self._bottoms > rect.top) & (self._tops < rect.bottom)
+        if not hits.any():
+            return None
+
+        first = int(np.where(hits, time, np.inf).argmin())
+        first_time, first_gap, vy = float(time[first]), float(gap[first]), float(self._vy[first])
+        pass_time = (rect.width - float(self._min_gap[first]) + min(first_gap, 0)) * float(self._inverse_speed[first])
+        arrival_top = float(self._tops[first]) + vy * first_time
+        return first_time, pass_time, min(arrival_top, arrival_top + vy * pass_time)
+
+
+class WorldPerception:
+    """
+    Shared view of the world built once per frame by the level scene and read by all enemies, so
+    each enemy does not have to query the bullets, the player and the map on its own.
+
+    The map is divided into lanes, one for each platform row. A lane covers the space in which an
+    entity standing on the row can be hit (lane height is the entity height). For each lane the
+    perception knows the player bullets flying in it (stored as arrays, see BulletLane), their
+    count (threat) and when they reach a given hitbox (time_to_impact), so an enemy only looks at
+    the bullets of the lanes it occupies.
+    """
+
+    def __init__(self, map_data: MapData, lane_height: int):
+        self.lane_height = lane_height
+        self.rows = sorted({tile.top for tiles in map_data.platforms.values() for tile in tiles})
+        self._segments = self._find_row_segments(map_data)
+        self._lane_of_y = self._create_lane_lookup(map_data.height)
+
+        self.lanes: Dict[int, BulletLane] = {row: BulletLane() for row in self.rows}
+        self.threats: Dict[int, int] = {row: 0 for row in self.rows}
+        self.player_rect = pygame.Rect(0, 0, 0, 0)
+        self.player_center = 0
+        self.player_platform = 0
+        self.player_span: Optional[Tuple[int, int]] = None
+
+    def update(self, player, player_bullets: pygame.sprite.Group) -> None:
+        """
+        Refresh the perception. Called once per frame before enemies are updated.
+        """
+        self.player_rect = player.rect
+        self.player_center = player.rect.centerx
+        self.player_platform = player.platform
+        self.player_span = self.span_at(player.platform, player.rect.centerx)
+
+        for lane in self.lanes.values():
+            lane.clear()
+        for bullet in player_bullets:
+            row = self.lane_at(bullet.rect.centery)
+            if row is not None:
+                self.lanes[row].add(bullet.rect, bullet.speed, bullet.vy)
+        for row, lane in self.lanes.items():
+            self.threats[row] = len(lane)
+
+    def lane_at(self, y: int) -> Optional[int]:
+        """
+        Return the platform row (its top coordinate) whose lane contains y, or None.
+        """
+        if 0 <= y < len(self._lane_of_y):
+            return self._lane_of_y[y]
+        return None
+
+    def span_at(self, row: int, x: int) -> Optional[Tuple[int, int]]:
+        """
+        Return the horizontal span (left, right) of the continuous platform at the given row and x.
+        """
+        for left, right in self._segments.get(row, []):
+            if left <= x < right:
+                return left, right
+        return None
+
+    def impact(self, rect: pygame.Rect) -> Optional[Tuple[float, float, float]]:
+        """
+        First bullet to hit the rect over the lanes it occupies, as (time to impact, time to pass
+        the rect, highest bullet top while passing), or None. See BulletLane.impact.
+        """
+        impacts = [impact for impact in (lane.impact(rect) for lane in self.lanes_for(rect)) if impact]
+        return min(impacts, default=None)
+
+    def time_to_impact(self, rect: pygame.Rect) -> float:
+        """
+        Number of frames until the first bullet in the lanes of rect reaches it. Bullets flying
+        away do not count. Returns infinity if no bullet is coming.
+        """
+        impact = self.impact(rect)
+        return impact[0] if impact else math.inf
+
+    def lanes_for(self, rect: pygame.Rect) -> List[BulletLane]:
+        """
+        Return the lanes the rect overlaps (at most two for entities not taller than a lane).
+        """
+        top, bottom = self.lane_at(rect.top), self.lane_at(rect.bottom)
+        rows = [row for row in (top, bottom) if row is not None]
+        if len(rows) == 2 and rows[0] == rows[1]:
+            rows.pop()
+        return [self.lanes[row] for row in rows]
+
+    def _find_row_segments(self, map_data: MapData) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Merge neighbouring tiles of each platform row into continuous segments.
+        """
+        tiles_by_row: Dict[int, List[pygame.Rect]] = {row: [] for row in self.rows}
+        for tiles in map_data.platforms.values():
+            for tile in tiles:
+                tiles_by_row[tile.top].append(tile)
+
+        segments = {}
+        for row, tiles in tiles_by_row.items():
+            merged = []
+            for tile in sorted(tiles, key=lambda t: t.left):
+                if merged and tile.left <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], tile.right))
+                else:
+                    merged.append((tile.left, tile.right))
+            segments[row] = merged
+        return segments
+
+    def _create_lane_lookup(self, map_height: int) -> List[Optional[int]]:
+        """
+        Precompute the lane of each pixel row of the map, so lane_at() is a single list access.
+        """
+        lookup: List[Optional[int]] = [None] * (map_height + 1)
+        for row in self.rows:
+            for y in range(max(row - self.lane_height + 1, 0), min(row, map_height) + 1):
+                lookup[y] = row
+        return lookup
@@ -1,14 +1,15 @@
-import os
 import random
 import pygame
 
+from typing import Dict
+
 from src.constants import colors
 from src.constants.fonts import SMALL_FONT
+from src.entities.animation_controller import AnimationController
 from src.enums.entity_states import EntityState
 from src.model.entity_config import EntityConfig
-from src.utils.image_flipper import ImageFlipper
-from src.utils.image_loader import ImageLoader
-from src.utils.image_scaler import ImageScaler
+from src.entities.entity_prototype import EntityPrototype
+from src.utils.swept_collision import SweptCollision
 from src.weapons.weapon_factory import WeaponFactory
 
 
@@ -16,18 +17,28 @@ class Entity(pygame.sprite.Sprite):
     """
     Base class for all entities in the game.
     """
+    _name_labels: Dict[str, pygame.Surface] = {}
 
     def __init__(self, config: EntityConfig, image_path: str):
         super().__init__()
+        self.image_path = image_path
+        self.reset(config)
+
+    def reset(self, config: EntityConfig):
+        """
+        Configure the entity for a level. Called by the constructor and when the entity is reused
+        from the EntityPool, so everything level specific has to be set here.
+        """
         self.map_data = config.map_data
         self.entity_data = config.entity_data
         self.physics = config.physics
-        self.image_path = image_path
+        self.effects = config.effects
 
         self._load_entity_attributes()
+        self._load_prototype()
         self._load_weapon(config.on_bullet_created)
-        self._load_animations()
         self._create_sprite_image()
+        self.animation = AnimationController(self.physics.animation_speed)
         self._initialize_state()
         self._reset_position()
 
@@ -35,8 +46,8 @@ class Entity(pygame.sprite.Sprite):
         """
         Load basic attributes like name, lives, and size.
         """
-        self.name = self.entity_data["name"]
-        self.lives = self.entity_data["lives"]
+        self.name = self.entity_data.name
+        self.lives = self.entity_data.lives
         self.width = self.map_data.width // 20
         self.height = self.map_data.height // 10
         self.name_space = self.map_data.height // 70
@@ -49,12 +60,12 @@ class Entity(pygame.sprite.Sprite):
         """
         self.facing_right = random.choice([True, False])
         self.vx = self.vy = self.knockback_x = 0
-        self.frame_index = 0.0
         self.shooting = False
         self.on_ground = False
         self.skip_platform = False
         self.platform = 0
         self.state = EntityState.IDLE
+        self._start_animation()
 
     def _reset_position(self):
         """
@@ -64,7 +75,7 @@ class Entity(pygame.sprite.Sprite):
         spawn_center = (self.map_data.width - self.width) // 2
         spawn_multiplier = random.uniform(0.25, 1.75)
         spawn_x = int(spawn_center * spawn_multiplier)
-        self.rect = self.image.get_rect(topleft=(spawn_x, 0))
+        self.rect = pygame.Rect(spawn_x, 0, self.width, self.height)
 
     def _create_sprite_image(self):
         """
@@ -73,42 +84,28 @@ class Entity(pygame.sprite.Sprite):
         """
         self.image = self.state_animations[EntityState.IDLE][0]
 
-    def _load_animations(self):
-        self._load_static_animations()
-        self._load_shooting_animations()
-
-    def _load_static_animations(self):
-        """
-        Load animations for each state with scaled sizes and flipped versions.
-        """
-        self.state_animations, self.flipped_state_animations = {}, {}
-        for state in EntityState:
-            path = os.path.join(self.image_path, state.name.lower())
-            normal, flipped = self._load_scaled_images(path, self.width, self.height)
-            self.state_animations[state] = normal
-            self.flipped_state_animations[state] = flipped
-
-    def _load_shooting_animations(self):
+    def _load_prototype(self):
         """
-        Loading shooting animations. Scaled to 1.5 times the entity's width because
-        shooting images are wider than state images.
+        Take the animation tables and bullet images from the prototype shared by all entities of
+        the same kind and size (see EntityPrototype).
         """
-        path = os.path.join(self.image_path, 'shooting')
-        animations = self._load_scaled_images(path, int(1.5 * self.width), self.height)
-        self.shooting_animations, self.flipped_shooting_animations = animations
+        prototype = EntityPrototype.get(self.image_path, self.width, self.height, self.bullet_size)
+        self.state_animations = prototype.state_animations
+        self.flipped_state_animations = prototype.flipped_state_animations
+        self.shooting_animations = prototype.shooting_animations
+        self.flipped_shooting_animations = prototype.flipped_shooting_animations
+        self.bullet_images = prototype.bullet_images
 
-    def _can_land(self, tile: pygame.Rect) -> bool:
+    def _can_land(self, tile: pygame.Rect, previous_bottom: int) -> bool:
         """
         Determine if entity can land on the given tile considering platform skipping.
         If skip platform is set to True, the entity can only land on the platform below
         the current one.
         """
-        if not self._tile_collision(tile, self.rect):
+        if not SweptCollision.crossed_top(tile, previous_bottom, self.rect.bottom):
             return False
         if self.skip_platform and tile.top == self.platform:
             return False
-
-        self._tile_collision(tile, self.rect)
         return True
 
     def _apply_gravity(self):
@@ -125,14 +122,16 @@ class Entity(pygame.sprite.Sprite):
     def _move_and_collide(self):
         """
         Move entity horizontally and vertically based on velocity and knockback.
-        Check for landing on platforms or falling off map.
+        Check for landing on platforms (on any platform passed during this frame) or
+        falling off map.
         """
+        previous_bottom = self.rect.bottom
         self.rect.x += self.vx + self.knockback_x
         self.rect.y += self.vy
 
         if self.vy > 0:
             self.on_ground = False
-            self._check_landing()
+            self._check_landing(previous_bottom)
             self._check_fall_off_map()
 
     def _get_tiles_in_column(self):
@@ -144,13 +143,14 @@ class Entity(pygame.sprite.Sprite):
         tiles = self.map_data.platforms.get(col_index, [])
         return tiles
 
-    def _check_landing(self):
+    def _check_landing(self, previous_bottom: int):
         """
-        Check if the entity collides with a platform. If so, check if
-        the entity is landing on the platform.
+        Check if the entity passed the top of a platform while falling. If so, check if
+        the entity is landing on the platform. Tiles are sorted from top to bottom, so the
+        first platform passed is used.
         """
         for tile in self._get_tiles_in_column():
-            if self._can_land(tile):
+            if self._can_land(tile, previous_bottom):
                 self.rect.y = tile.top - self.height
                 self.vy = 0
                 self.on_ground = True
@@ -165,6 +165,8 @@ class Entity(pygame.sprite.Sprite):
         group and entity will no longer be updated or drawn.
         """
         if self.rect.y > self.map_data.height:
+            if self.effects:
+                self.effects.dust(self.rect.centerx)
             self._initialize_state()
             self._reset_position()
             self.lives -= 1
@@ -205,75 +207,91 @@ class Entity(pygame.sprite.Sprite):
     def _set_state(self, state: EntityState):
         if self.state != state:
             self.state = state
-            self.frame_index = 0.0
-
+            self._start_animation()
 
-    def _draw_standard(self, surface):
+    def _start_animation(self, tick: int = 0):
         """
-        Draw the entity on the surface. Used for all animations except shooting.
+        Start the animation of the current state, or the shooting animation (which does not loop).
         """
-        animations = self.state_animations if self.facing_right else self.flipped_state_animations
-        images = animations[self.state]
-        surface.blit(images[int(self.frame_index)], self.rect.topleft)
-        self.frame_index = (self.frame_index + self.physics.animation_speed) % len(images)
+        if self.shooting:
+            self.animation.start(len(self.shooting_animations), loop=False, tick=tick)
+        else:
+            self.animation.start(len(self.state_animations[self.state]), tick=tick)
 
+    def _advance_animation(self):
+        """
+        Advance the animation by one tick. When the shooting animation finishes, the entity stops
+        shooting and the animation of its state starts again.
+        """
+        if self.animation.advance() and self.shooting:
+            self.shooting = False
+            self._start_animation()
 
-    def _draw_shooting(self, surface):
+    def current_frame(self):
         """
-        Draw shooting animation. As the shooting images are wider than state images,
-        we need to offset the shooting images to the left or right depending on the
-        direction the entity is facing to let the animation look natural.
+        Return the image of the current animation frame and the position where it is drawn.
+        Used for drawing and for pixel-perfect collisions.
         """
-        animations = self.shooting_animations if self.facing_right else self.flipped_shooting_animations
-        image = animations[int(self.frame_index)]
-        offset = 0 if self.facing_right else -int(self.width * 0.5)
-        surface.blit(image, (self.rect.x + offset, self.rect.y))
-        self._update_shooting_animation()
+        if self.shooting:
+            animations = self.shooting_animations if self.facing_right else self.flipped_shooting_animations
+            offset = 0 if self.facing_right else -int(self.width * 0.5)
+            return animations[self.animation.frame], (self.rect.x + offset, self.rect.y)
+
+        animations = self.state_animations if self.facing_right else self.flipped_state_animations
+        return animations[self.state][self.animation.frame], self.rect.topleft
 
-    def _update_shooting_animation(self):
+    def _draw_frame(self, surface):
         """
-        Update shooting animation. When the animation reaches the last frame, stop the
-        animation and reset the frame index to 0 also change shooting state to false.
+        Draw the current animation frame. As the shooting images are wider than state images,
+        they are offset depending on the direction the entity is facing to let the animation
+        look natural (see current_frame).
         """
-        self.frame_index += self.physics.animation_speed
-        if int(self.frame_index) >= len(self.shooting_animations):
-            self.shooting = False
-            self.frame_index = 0.0
+        surface.blit(*self.current_frame())
 
     def _draw_name(self, surface):
         """
         Draw entity’s name just above the sprite
         """
-        name = SMALL_FONT.render(self.name, True, colors.WHITE)
+        name = self._get_name_label(self.name)
         name_rect = name.get_rect(center=(self.rect.centerx, self.rect.y - self.name_space))
-        surface.blit(name, name_rect)
+        surface.blit(name, name_rect.topleft)
+
+    @classmethod
+    def _get_name_label(cls, name: str) -> pygame.Surface:
+        """
+        Rendered names are cached, the text does not change and there can be hundreds of
+        entities with the same name (survival mode).
+        """
+        if name not in cls._name_labels:
+            cls._name_labels[name] = SMALL_FONT.render(name, True, colors.WHITE)
+        return cls._name_labels[name]
 
     def _shoot(self):
         """
-        Shoot if not already shooting. Define the position of the bullet.
-        Cooldowns for individual weapons could be added later.
+        Shoot if the weapon cooldown has passed (see Weapon). Define the position of the bullets
+        and (re)start the shooting animation.
         """
-        if not self.shooting:
+        if self.weapon.ready:
             self.shooting = True
-            self.frame_index = 0.0
+            self._start_animation()
             x_pos = self.rect.right if self.facing_right else self.rect.left
             y_pos = (self.rect.top + self.rect.centery) // 2
             self.weapon.shoot((x_pos, y_pos), self.facing_right)
 
     def _load_weapon(self, on_bullet_created):
         """
-        Load the weapon of the entity based on the weapon name defined in the JSON file. Also
+        Load the weapon of the entity based on the weapon definition of the entity. Also
         passing callable on_bullet_created. We use it to specify into which pygame group the
         bullet should be added (player bullets or enemy bullets).
         """
-        bullet_path = os.path.join(self.image_path, "bullet.png")
-        bullet_img = ImageScaler.scale_image(ImageLoader.load_image(bullet_path), *self.bullet_size)
         self.weapon = WeaponFactory.get_weapon(
-            weapon_name=self.entity_data["weapon"],
+            definition=self.entity_data.weapon,
             on_bullet_created=on_bullet_created,
-            bullet_images=[bullet_img, ImageFlipper.flip(bullet_img, True, False)],
+            bullet_images=self.bullet_images,
             bullet_speed=self.physics.bullet_speed,
-            bullet_damage=self.physics.bullet_damage
+            bullet_damage=self.physics.bullet_damage,
+            tick_rate=self.physics.tick_rate,
+            effects=self.effects
         )
 
     def update(self, *args, **kwargs):
@@ -281,10 +299,12 @@ class Entity(pygame.sprite.Sprite):
         The methods that are executed in each frame.
         """
         super().update(*args, **kwargs)
+        self.weapon.update()
         self._apply_gravity()
         self._move_and_collide()
         self._relax_knockback()
         self._update_state()
+        self._advance_animation()
 
     def draw(self, surface: pygame.Surface):
         """
@@ -292,10 +312,12 @@ class Entity(pygame.sprite.Sprite):
 
         We use custom draw method because when entity is shooting, its images have different sizes
         than the state images, and we would have to change self.image that is used by pygame group
-        to draw sprites.
+        to draw sprites. Anything with a blit method can be passed as the surface, the level scene
+        passes a layer of its render batch (see RenderBatch). Drawing does not change the entity,
+        animations are advanced by update() (see AnimationController).
         """
         self._draw_name(surface)
-        self._draw_shooting(surface) if self.shooting else self._draw_standard(surface)
+        self._draw_frame(surface)
 
     def _update_state(self):
         """
@@ -313,20 +335,3 @@ class Entity(pygame.sprite.Sprite):
             self._set_state(EntityState.IDLE)
         else:
             self._set_state(EntityState.RUNNING)
-
-    @staticmethod
-    def _tile_collision(tile: pygame.Rect, rect: pygame.Rect):
-        """
-        Check if the entity collides with a tile.
-        """
-        return tile.top <= rect.bottom <= tile.centery
-
-    @staticmethod
-    def _load_scaled_images(path: str, width: int, height: int):
-        """
-        Load all images from path, scale them, and create flipped versions
-        """
-        images = ImageLoader.load_images(path)
-        scaled = [ImageScaler.scale_image(img, width, height) for img in images]
-        flipped = [ImageFlipper.flip(img, True, False) for img in scaled]
-        return scaled, flipped
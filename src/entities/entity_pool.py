@@ -0,0 +1,33 @@
+from collections import defaultdict
+from typing import Dict, List, Type, TypeVar
+
+from src.entities.entity import Entity
+from src.model.entity_config import EntityConfig
+
+T = TypeVar("T", bound=Entity)
+
+
+class EntityPool:
+    """
+    Keep entities that are no longer used (level restarted, enemy killed) and hand them out again
+    instead of constructing new ones. A reused entity is reset with the new config, which is cheap
+    thanks to the shared EntityPrototype.
+    """
+    _free: Dict[Type[Entity], List[Entity]] = defaultdict(list)
+
+    @classmethod
+    def acquire(cls, entity_class: Type[T], config: EntityConfig) -> T:
+        free = cls._free[entity_class]
+        if free:
+            entity = free.pop()
+            entity.reset(config)
+            return entity
+        return entity_class(config)
+
+    @classmethod
+    def release(cls, entity: Entity) -> None:
+        """
+        Remove the entity from all groups and keep it for later reuse.
+        """
+        entity.kill()
+        cls._free[type(entity)].append(entity)
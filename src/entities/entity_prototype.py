@@ -0,0 +1,77 @@
+import os
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.enums.entity_states import EntityState
+from src.utils.image_loader import ImageLoader
+from src.utils.image_masker import ImageMasker
+from src.utils.image_scaler import ImageScaler
+
+
+class EntityPrototype:
+    """
+    Animation tables and bullet images shared by all entities of the same kind and size. They are
+    resolved once (walking the image folders, scaling, flipping and creating masks) and then only
+    referenced by new entities, so creating an entity does not touch the image caches at all.
+    """
+    _cache: Dict[Tuple[str, int, int, Tuple[int, int]], "EntityPrototype"] = {}
+
+    def __init__(self, image_path: str, width: int, height: int, bullet_size: Tuple[int, int]):
+        self.image_path = image_path
+        self._load_static_animations(width, height)
+        self._load_shooting_animations(width, height)
+        self._load_bullet_images(bullet_size)
+
+    @classmethod
+    def get(cls, image_path: str, width: int, height: int, bullet_size: Tuple[int, int]) -> "EntityPrototype":
+        """
+        Return the prototype for the entity kind (its image folder) and size, create it if needed.
+        """
+        key = (image_path, width, height, bullet_size)
+        if key not in cls._cache:
+            cls._cache[key] = cls(image_path, width, height, bullet_size)
+        return cls._cache[key]
+
+    def _load_static_animations(self, width: int, height: int):
+        """
+        Load animations for each state with scaled sizes and flipped versions.
+        """
+        self.state_animations, self.flipped_state_animations = {}, {}
+        for state in EntityState:
+            path = os.path.join(self.image_path, state.name.lower())
+            normal, flipped = self._load_scaled_images(path, width, height)
+            self.state_animations[state] = normal
+            self.flipped_state_animations[state] = flipped
+
+    def _load_shooting_animations(self, width: int, height: int):
+        """
+        Loading shooting animations. Scaled to 1.5 times the entity's width because
+        shooting images are wider than state images.
+        """
+        path = os.path.join(self.image_path, 'shooting')
+        animations = self._load_scaled_images(path, int(1.5 * width), height)
+        self.shooting_animations, self.flipped_shooting_animations = animations
+
+    def _load_bullet_images(self, bullet_size: Tuple[int, int]):
+        """
+        Bullet images for both directions (right and left).
+        """
+        bullet_path = os.path.join(self.image_path, "bullet.png")
+        bullet_img = ImageLoader.load_image(bullet_path)
+        self.bullet_images = [ImageScaler.scale_image(bullet_img, *bullet_size),
+                              ImageScaler.scale_image(bullet_img, *bullet_size, flip_x=True)]
+
+    @staticmethod
+    def _load_scaled_images(path: str, width: int, height: int) -> Tuple[List[pygame.Surface], List[pygame.Surface]]:
+        """
+        Load all images from path, scale them, and create flipped versions (from the pre-flipped
+        mips when they are built, see ImageScaler). Collision masks
+        of all images are created as well, so they are ready before the first hit.
+        """
+        images = ImageLoader.load_images(path)
+        scaled = [ImageScaler.scale_image(img, width, height) for img in images]
+        flipped = [ImageScaler.scale_image(img, width, height, flip_x=True) for img in images]
+        for img in (*scaled, *flipped):
+            ImageMasker.get_mask(img)
+        return scaled, flipped
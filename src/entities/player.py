@@ -11,6 +11,10 @@ class Player(Entity):
     def __init__(self, entity_config: EntityConfig):
         image_path = os.path.join(IMAGE_PATH, 'entity', 'player')
         super().__init__(entity_config, image_path)
+
+    def reset(self, config: EntityConfig):
+        super().reset(config)
+        self.input_source = pygame.key.get_pressed
         self._create_vision_rect()
         self.rect.center = 383, 320
 
@@ -31,7 +35,12 @@ class Player(Entity):
         super().update(*args, **kwargs)
 
     def _handle_input(self):
-        keys = pygame.key.get_pressed()
+        """
+        Read the pressed keys from the input source. By default it is the keyboard, but it can be
+        replaced by any callable returning an object indexable by pygame key constants (for
+        example InputState used by remote clients and bots).
+        """
+        keys = self.input_source()
         self._process_horizontal_input(keys)
         self._process_vertical_input(keys)
         self._process_shooting_input(keys)
@@ -0,0 +1,52 @@
+from src.model.input_state import InputState
+
+
+class PlayerBot:
+    """
+    Simple scripted opponent used to drive the player in bot-vs-bot matches. It is used as the
+    player input source and returns a new InputState each frame:
+    - Follow the nearest enemy to its platform
+    - Turn to the enemy and shoot
+    - Jump over enemy bullets that are about to hit
+    """
+
+    def __init__(self, level_scene):
+        self.scene = level_scene
+        self._input = InputState()
+
+    def __call__(self) -> InputState:
+        player = self.scene.player
+        self._input.mask = 0
+        target = self._find_target(player)
+        if target is None:
+            return self._input
+
+        if player.platform != target.platform and player.on_ground:
+            self._input.mask |= InputState.DOWN if player.platform < target.platform else InputState.UP
+        elif (target.rect.centerx >= player.rect.centerx) != player.facing_right:
+            self._input.mask |= InputState.RIGHT if target.rect.centerx >= player.rect.centerx else InputState.LEFT
+        else:
+            self._input.mask |= InputState.SHOOT
+
+        if self._bullet_incoming(player):
+            self._input.mask |= InputState.UP
+        return self._input
+
+    def _find_target(self, player):
+        enemies = self.scene.enemy_group.sprites()
+        if not enemies:
+            return None
+        return min(enemies, key=lambda enemy: abs(enemy.rect.centerx - player.rect.centerx)
+                   + abs(enemy.rect.bottom - player.rect.bottom))
+
+    def _bullet_incoming(self, player) -> bool:
+        """
+        Check if an enemy bullet on the player's row will reach the player in a few frames.
+        """
+        reach = 3 * player.width
+        for bullet in self.scene.enemy_bullets:
+            if player.rect.top <= bullet.rect.centery <= player.rect.bottom:
+                distance = player.rect.centerx - bullet.rect.centerx
+                if 0 < distance * bullet.speed and abs(distance) < reach:
+                    return True
+        return False
@@ -6,4 +6,5 @@ class GameScenes(Enum):
     """
     MENU = auto()
     LEVEL = auto()
-    PAUSE = auto()
\ No newline at end of file
+    PAUSE = auto()
+    SURVIVAL = auto()
\ No newline at end of file
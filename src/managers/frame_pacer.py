@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import List, Tuple
+
+from src.model.frame_stats import FrameStats
+
+
+class FramePacer:
+    """
+    Pace the game loop to the simulation tick rate. Ticks have fixed deadlines; wait() blocks until
+    the next deadline and returns how many simulation steps are due. When the game falls behind,
+    several steps are due at once and the game draws only once for them (draw skipping), at most
+    MAX_SKIPPED_DRAWS in a row. A larger backlog is dropped, the game then slows down instead of
+    never catching up.
+
+    Waiting modes:
+    - sleep: time.sleep until the deadline (cheap, but wakes up late by up to a few milliseconds)
+    - hybrid: sleep until SPIN_MARGIN before the deadline, then busy-wait
+    - busy: busy-wait the whole time (most precise, keeps one core busy)
+    - uncapped: never wait, draw as often as possible; the simulation still runs at the tick rate
+
+    The game reports when the input was sampled and when the frame was presented, which gives the
+    input latency statistics (see FrameStats) and the frame times (see frame_times). In pipelined
+    mode frames are presented on the render thread, the statistics shared with it are guarded by
+    a lock.
+    """
+    MODES = ("sleep", "hybrid", "busy", "uncapped")
+    MAX_SKIPPED_DRAWS = 5
+    SPIN_MARGIN = 0.002
+
+    def __init__(self, tick_rate: int, mode: str = "hybrid"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown frame pacing mode '{mode}', use one of {', '.join(self.MODES)}.")
+        self.mode = mode
+        self.period = 1 / tick_rate
+        self.uncapped = mode == "uncapped"
+        self._lock = threading.Lock()
+        self.reset()
+        self._sampled_at = self._previous_sample = self._deadline
+        self._input_pending = False
+        self._reset_window()
+
+    def reset(self):
+        """
+        Start the tick deadlines from now. Call after long pauses of the loop (loading, scene
+        initialization), otherwise the time spent is caught up with steps that are not drawn. The
+        frame times start again as well, the pause does not count into them.
+        """
+        with self._lock:
+            self._deadline = self._woke_at = self._presented_at = time.perf_counter()
+            self._busy_time = self._frame_time = 0.0
+            self._timed_frames = 0
+
+    def _reset_window(self):
+        self._latencies: List[float] = []
+        self._frames = self._steps = self._skipped_draws = 0
+
+    def wait(self) -> int:
+        """
+        Wait for the next tick and return the number of simulation steps to run before drawing. In
+        uncapped mode it does not wait and returns 0 when no step is due yet.
+        """
+        now = time.perf_counter()
+        self._busy_time += now - self._woke_at
+        self._woke_at = now
+        if now < self._deadline:
+            if self.uncapped:
+                return 0
+            self._wait_until(self._deadline)
+            now = self._woke_at = time.perf_counter()
+
+        due = int((now - self._deadline) / self.period) + 1
+        if due > self.MAX_SKIPPED_DRAWS + 1:
+            self._deadline = now
+            due = self.MAX_SKIPPED_DRAWS + 1
+        self._deadline += due * self.period
+        self._steps += due
+        self._skipped_draws += due - 1
+        return due
+
+    def _wait_until(self, deadline: float):
+        if self.mode == "sleep":
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            return
+
+        if self.mode == "hybrid":
+            remaining = deadline - time.perf_counter() - self.SPIN_MARGIN
+            if remaining > 0:
+                time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+
+    def input_sampled(self):
+        """
+        Call right after pumping the events, before the simulation step reads the input.
+        """
+        with self._lock:
+            self._previous_sample, self._sampled_at = self._sampled_at, time.perf_counter()
+            self._input_pending = True
+
+    def frame_presented(self):
+        """
+        Call right after the frame was flipped to the screen. Only the first frame presented after
+        sampling the input counts for the latency, the following ones (uncapped mode) show nothing new.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            if self._input_pending:
+                latency = now - self._sampled_at + (self._sampled_at - self._previous_sample) / 2
+                self._latencies.append(latency)
+                self._input_pending = False
+            self._frames += 1
+            self._frame_time += now - self._presented_at
+            self._presented_at = now
+            self._timed_frames += 1
+
+    def frame_times(self) -> Tuple[float, float]:
+        """
+        Mean time between two presented frames and mean busy time of the game loop per presented
+        frame (everything but waiting for the deadlines: events, simulation, drawing and presenting
+        unless it runs on the render thread), in seconds since the previous call.
+        """
+        with self._lock:
+            frames = max(self._timed_frames, 1)
+            times = self._frame_time / frames, self._busy_time / frames
+            self._frame_time = self._busy_time = 0.0
+            self._timed_frames = 0
+        return times
+
+    def stats(self, reset: bool = True) -> FrameStats:
+        """
+        Statistics since the last reset.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies) or [0.0]
+            stats = FrameStats(
+                mode=self.mode,
+                frames=self._frames,
+                steps=self._steps,
+                skipped_draws=self._skipped_draws,
+                mean_latency=1000 * sum(latencies) / len(latencies),
+                p95_latency=1000 * latencies[int(0.95 * (len(latencies) - 1))],
+                max_latency=1000 * latencies[-1],
+            )
+            if reset:
+                self._reset_window()
+        return stats
@@ -1,6 +1,8 @@
+import io
 import sys
 import pygame
 from src.constants.paths import MUSIC
+from src.utils.asset_pack import AssetPack
 from src.enums.game_scenes import GameScenes
 
 
@@ -10,10 +12,10 @@ class GameManager:
     audio management.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, audio_enabled: bool = True) -> None:
         self._previous_scene = None
         self._current_scene = GameScenes.MENU
-        self._audio_available = self.init_audio()
+        self._audio_available = self.init_audio() if audio_enabled else False
 
     @property
     def current_scene(self) -> GameScenes:
@@ -50,7 +52,11 @@ class GameManager:
         try:
             pygame.mixer.init()
             music_path = MUSIC
-            pygame.mixer.music.load(music_path)
+            pack = AssetPack.lookup(music_path)
+            if pack:
+                pygame.mixer.music.load(io.BytesIO(pack.data(music_path)), music_path)
+            else:
+                pygame.mixer.music.load(music_path)
             pygame.mixer.music.play(-1)
             return True
 
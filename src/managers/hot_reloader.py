@@ -0,0 +1,77 @@
+import fnmatch
+import os
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from src.constants.paths import LEVEL_PATH, MAP_PATH
+from src.managers.level_manager import LevelManager
+from src.utils.level_catalog import LevelCatalog
+from src.utils.map_loader import MapLoader
+
+
+class HotReloader:
+    """
+    Development mode: watch the level and map folders by polling the modification times of their
+    files (at most every INTERVAL seconds) and invalidate what was loaded from a changed file, so
+    edits show up without restarting the game:
+
+    - a changed map drops its MapLoader cache entry, the next LevelScene.initialize builds the map
+      again from the cached tileset images,
+    - a changed level file updates the catalog entry and the compiled level (see
+      LevelManager.invalidate).
+
+    Everything else (sprites, scaled sprite and mip caches, weapons and the survival level) stays
+    loaded. Only loose files are watched, the game has to run without the asset pack.
+    """
+    INTERVAL = 0.5
+    EXTENSIONS = (".json", ".tmx")
+
+    def __init__(self, level_manager: LevelManager, folders: Sequence[str] = (LEVEL_PATH, MAP_PATH),
+                 interval: float = INTERVAL):
+        self.level_manager = level_manager
+        self.folders = folders
+        self.interval = interval
+        self._files = self._scan()
+        self._next_poll = time.monotonic() + interval
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        files = {}
+        for folder in self.folders:
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(self.EXTENSIONS) and entry.is_file():
+                            stat = entry.stat()
+                            files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                continue
+        return files
+
+    def poll(self) -> List[str]:
+        """
+        Check the files if the interval has passed and reload the changed (added, modified or removed)
+        ones. Returns their paths.
+        """
+        now = time.monotonic()
+        if now < self._next_poll:
+            return []
+        self._next_poll = now + self.interval
+
+        files = self._scan()
+        changed = sorted(path for path in files.keys() | self._files.keys() if files.get(path) != self._files.get(path))
+        self._files = files
+
+        levels = [path for path in changed if self._is_level(path)]
+        if levels:
+            self.level_manager.invalidate(levels)
+            print(f"[Hot Reload] Reloaded {len(levels)} level(s): {', '.join(levels)}", file=sys.stderr)
+        for path in changed:
+            if path.endswith(".tmx"):
+                dropped = MapLoader.invalidate(path)
+                print(f"[Hot Reload] {path} changed, {dropped} cached map(s) dropped", file=sys.stderr)
+        return changed
+
+    def _is_level(self, path: str) -> bool:
+        return (os.path.normpath(os.path.dirname(path)) == os.path.normpath(self.level_manager.catalog.folder)
+                and fnmatch.fnmatch(os.path.basename(path), LevelCatalog.PATTERN))
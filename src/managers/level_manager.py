@@ -1,54 +1,80 @@
-import glob
-import os
-from typing import Dict, List
-from src.constants.paths import LEVEL_PATH
-from src.utils.file_reader import FileReader
-from src.utils.file_writer import FileWriter
+from typing import Dict, Iterable, List, Optional, Set, Union
+from src.model.level_definition import LevelDefinition, LevelEntry
+from src.utils.level_catalog import LevelCatalog
+from src.utils.level_compiler import LevelCompiler
+from src.utils.save_store import SaveStore
 
 class LevelManager:
     """
     Manage levels including loading, unlocking, and saving. Used by LevelScene
     and MenuScene (to set current level based on player click on level button).
+    The levels are listed by the LevelCatalog, a level file is only compiled (by LevelCompiler)
+    when the level is loaded and kept until the file changes (see invalidate). The unlocked levels
+    are saved in the SaveStore.
     """
+    UNLOCKED_LEVELS = "unlocked_levels"
 
-    def __init__(self):
+    def __init__(self, save_store: Optional[SaveStore] = None, catalog: Optional[LevelCatalog] = None):
+        self.save_store = save_store or SaveStore()
+        self.catalog = catalog or LevelCatalog()
         self._current_level = None
-        self._levels: List[Dict] = []
-        self._load_levels()
+        self._definitions: Dict[str, LevelDefinition] = {}
+        self._index_levels()
+
+    def _index_levels(self) -> None:
+        self._positions = {entry.id: i for i, entry in enumerate(self.levels)}
+        self._unlocked: Set[int] = {entry.id for entry in self.levels if entry.unlocked}
+        self._unlocked.update(self.save_store.get(self.UNLOCKED_LEVELS, []))
 
     @property
-    def current_level(self) -> Dict:
+    def current_level(self) -> LevelDefinition:
         return self._current_level
 
     @current_level.setter
-    def current_level(self, level: Dict) -> None:
+    def current_level(self, level: LevelDefinition) -> None:
         self._current_level = level
 
     @property
-    def levels(self) -> List[Dict]:
-        return self._levels
+    def levels(self) -> List[LevelEntry]:
+        return self.catalog.entries
+
+    def is_unlocked(self, level: Union[LevelEntry, LevelDefinition]) -> bool:
+        return level.id in self._unlocked
 
-    def _load_levels(self) -> None:
+    def load_level(self, entry: LevelEntry) -> LevelDefinition:
         """
-        Load levels from JSON files in levels directory.
+        Compile the level of the catalog entry (once, later calls return the same definition).
         """
-        pattern = os.path.join(LEVEL_PATH, '[0-9][0-9].json')
-        level_files = sorted(glob.glob(pattern))
-        self._levels = [FileReader.read_json(path) for path in level_files]
+        level = self._definitions.get(entry.path)
+        if level is None:
+            level = self._definitions[entry.path] = LevelCompiler.load_level(entry.path)
+        return level
 
-    def unlock_next_level(self) -> None:
+    def invalidate(self, paths: Iterable[str]) -> None:
         """
-        Unlock the next level after the current one and save it.
+        Forget the compiled levels of changed (or added or removed) level files and update the
+        catalog, which only reads the changed files again. When a file belongs to the current level,
+        it is compiled again right away so the next LevelScene.initialize plays the new version; if
+        it became invalid (reported by the catalog), the old version is kept.
         """
-        current_id = self._current_level['id']
-        next_id = current_id + 1
-
-        if 0 < next_id < len(self._levels):
-            next_level = self._levels[next_id]
-            next_level['unlocked'] = True
-            filename = f"{next_level['id'] + 1:02d}.json"
-            path = os.path.join(LEVEL_PATH, filename)
-            FileWriter.write_json(path, next_level)
-
+        current_path = None
+        for path in paths:
+            stale = self._definitions.pop(path, None)
+            if stale is not None and stale is self._current_level:
+                current_path = path
+        self.catalog = LevelCatalog(self.catalog.folder, self.catalog.index_path)
+        self._index_levels()
 
+        if current_path is not None:
+            entry = next((entry for entry in self.levels if entry.path == current_path), None)
+            if entry is not None:
+                self._current_level = self.load_level(entry)
 
+    def unlock_next_level(self) -> None:
+        """
+        Unlock the level after the current one in the catalog and save the progress (in the background).
+        """
+        position = self._positions.get(self._current_level.id)
+        if position is not None and position + 1 < len(self.levels):
+            self._unlocked.add(self.levels[position + 1].id)
+            self.save_store.set(self.UNLOCKED_LEVELS, sorted(self._unlocked))
@@ -0,0 +1,94 @@
+import threading
+from typing import Callable, Optional, Tuple
+
+from src.model.frame_description import FrameDescription
+from src.scenes.scene import Scene
+
+
+class RenderPipeline:
+    """
+    Render frames on a separate thread, so the simulation of the next frame overlaps with drawing and
+    presenting the previous one. pygame releases the GIL in blits, scaling and display.flip, so both
+    threads make progress on a multi-core machine.
+
+    Frames are handed over as FrameDescription in a double buffer: the render thread draws the front
+    frame while the simulation stores the newest one in the back slot. When the back slot is still
+    taken, the older frame is replaced and counted as dropped (the renderer is behind and only the
+    newest frame is worth drawing). Descriptions hold no sprites or rects, only shared images and
+    position tuples, so entities and bullets returned to their pools in the meantime do not matter.
+
+    The render thread is the only one drawing to the display surface while frames are in flight.
+    Anything else that draws (scene changes, scenes without a description) has to call wait_idle()
+    first. An error on the render thread stops it and is raised again by the next call from the game
+    loop.
+    """
+
+    def __init__(self, present: Callable[[], None]):
+        self._present = present
+        self._back: Optional[Tuple[Scene, FrameDescription]] = None
+        self._busy = False
+        self._running = True
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+        self.rendered = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+
+    def submit(self, scene: Scene, frame: FrameDescription, wait: bool = False):
+        """
+        Hand the frame over to the render thread. With wait, block until the previous frame was taken
+        by the render thread instead of dropping it (back pressure).
+        """
+        with self._condition:
+            if wait:
+                self._condition.wait_for(lambda: self._back is None or not self._running)
+            self._raise_error()
+            if self._back is not None:
+                self.dropped += 1
+            self._back = scene, frame
+            self._condition.notify_all()
+
+    def wait_idle(self):
+        """
+        Block until all submitted frames are rendered and presented.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._running or (self._back is None and not self._busy))
+            self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("Render thread failed.") from self._error
+
+    def stop(self):
+        self.wait_idle()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._back is not None or not self._running)
+                if not self._running:
+                    return
+                (scene, frame), self._back = self._back, None
+                self._busy = True
+                self._condition.notify_all()
+
+            try:
+                scene.render(frame)
+                self._present()
+            except BaseException as error:
+                with self._condition:
+                    self._error = error
+                    self._running = self._busy = False
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                self._busy = False
+                self.rendered += 1
+                self._condition.notify_all()
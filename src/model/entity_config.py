@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Optional
+from src.effects.particle_system import ParticleSystem
+from src.model.level_definition import EntityDefinition
 from src.model.map_data import MapData
 from src.model.physics import Physics
 from src.weapons.bullet import Bullet
@@ -7,9 +9,11 @@ from src.weapons.bullet import Bullet
 @dataclass
 class EntityConfig:
     """
-    Configuration data for an entity (Enemy or Player).
+    Configuration data for an entity (Enemy or Player). Effects are optional, headless
+    simulations do not create them.
     """
     map_data: MapData
-    entity_data: dict
+    entity_data: EntityDefinition
     on_bullet_created: Callable[[Bullet], None]
-    physics: Physics
\ No newline at end of file
+    physics: Physics
+    effects: Optional[ParticleSystem] = None
\ No newline at end of file
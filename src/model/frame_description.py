@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import pygame
+
+
+@dataclass(frozen=True)
+class FrameDescription:
+    """
+    Everything a scene draws in one frame, as an ordered tuple of (image, position) blits. Images are
+    shared, never modified surfaces (animation frames, bullet images, rendered labels and panels) and
+    positions are plain tuples, so the description stays valid while the simulation goes on and can be
+    rendered by another thread (see RenderPipeline).
+    """
+    tick: int
+    blits: Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FrameStats:
+    """
+    Frame pacing statistics over the last report window. Input latency is the estimated time from
+    a key press to the presentation of the frame that reacts to it (in milliseconds): the time from
+    sampling the input to presenting the frame, plus half of the interval between two samplings
+    (a key press waits on average that long to be sampled).
+    """
+    mode: str
+    frames: int
+    steps: int
+    skipped_draws: int
+    mean_latency: float
+    p95_latency: float
+    max_latency: float
+
+    def __str__(self) -> str:
+        return (f"[Frame Pacer] mode={self.mode} frames={self.frames} steps={self.steps} "
+                f"skipped_draws={self.skipped_draws} latency mean={self.mean_latency:.2f} ms "
+                f"p95={self.p95_latency:.2f} ms max={self.max_latency:.2f} ms")
@@ -0,0 +1,44 @@
+import pygame
+
+from pygame.key import ScancodeWrapper
+
+
+class InputState:
+    """
+    Player input packed into a bit mask. It can be indexed by pygame key constants the same
+    way as the result of pygame.key.get_pressed(), so the player can be controlled by
+    something else than the keyboard (remote clients, bots).
+    """
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    SHOOT = 16
+
+    _KEY_BITS = {
+        pygame.K_LEFT: LEFT, pygame.K_a: LEFT,
+        pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+        pygame.K_UP: UP, pygame.K_w: UP,
+        pygame.K_DOWN: DOWN, pygame.K_s: DOWN,
+        pygame.K_SPACE: SHOOT, pygame.K_p: SHOOT,
+    }
+
+    def __init__(self, mask: int = 0):
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        return bool(self.mask & self._KEY_BITS.get(key, 0))
+
+    def __call__(self) -> "InputState":
+        """
+        Allow the input state to be used as the player input source.
+        """
+        return self
+
+    @classmethod
+    def from_keys(cls, keys: ScancodeWrapper) -> "InputState":
+        mask = 0
+        for key, bit in cls._KEY_BITS.items():
+            if keys[key]:
+                mask |= bit
+        return cls(mask)
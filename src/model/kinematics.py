@@ -0,0 +1,122 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class JumpTable:
+    """
+    Precomputed jump and fall trajectories for one set of physics parameters. All queries are
+    a single tuple lookup. Distances are in pixels (rounded up to whole pixels), times in ticks.
+    The trajectory follows the entity update order: gravity is applied before moving.
+
+    - rise: height above the launch point after t ticks of a jump (t = 0 .. airtime)
+    - rise_ticks / descend_ticks: first and last tick at which the jump is at least N pixels high
+    - fall_ticks: ticks needed to fall N pixels from rest (walking off or skipping a platform)
+    - landing_ticks: tick at which a jump lands N pixels below the launch point
+    """
+    rise: Tuple[float, ...]
+    peak: float
+    peak_tick: int
+    airtime: int
+    reach: float
+    rise_ticks: Tuple[int, ...]
+    descend_ticks: Tuple[int, ...]
+    fall_ticks: Tuple[int, ...]
+    landing_ticks: Tuple[int, ...]
+
+    def window(self, height: float) -> Optional[Tuple[int, int]]:
+        """
+        Ticks between which a jump stays at least `height` pixels above the launch point,
+        or None if the jump is not high enough.
+        """
+        index = max(math.ceil(height), 0)
+        if index >= len(self.rise_ticks):
+            return None
+        return self.rise_ticks[index], self.descend_ticks[index]
+
+    def ticks_to_fall(self, distance: float) -> int:
+        return self.fall_ticks[min(max(math.ceil(distance), 0), len(self.fall_ticks) - 1)]
+
+    def landing_tick(self, drop: float) -> int:
+        return self.landing_ticks[min(max(math.ceil(drop), 0), len(self.landing_ticks) - 1)]
+
+
+class Kinematics:
+    """
+    Build jump tables and cache them by the physics parameters they depend on. A changed Physics
+    instance simply maps to another cache entry, so there is nothing to invalidate manually.
+    """
+    MAX_DISTANCE = 4096
+
+    @classmethod
+    def for_physics(cls, physics) -> JumpTable:
+        return cls.table(physics.gravity, physics.jump_speed, physics.move_speed)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def table(gravity: float, jump_speed: float, move_speed: float,
+              max_distance: int = MAX_DISTANCE) -> JumpTable:
+        rise = Kinematics._jump_trajectory(gravity, jump_speed)
+        peak = max(rise)
+        peak_tick = rise.index(peak)
+        airtime = len(rise) - 1
+
+        pixels = range(math.floor(peak) + 1)
+        rise_ticks = tuple(next(t for t in range(peak_tick + 1) if rise[t] >= px) for px in pixels)
+        descend_ticks = tuple(max(t for t in range(peak_tick, len(rise)) if rise[t] >= px) for px in pixels)
+
+        fall = Kinematics._fall_trajectory(gravity, 0.0, max_distance)
+        jump_fall = Kinematics._fall_trajectory(gravity, jump_speed, max_distance)
+        return JumpTable(
+            rise=rise,
+            peak=peak,
+            peak_tick=peak_tick,
+            airtime=airtime,
+            reach=airtime * abs(move_speed),
+            rise_ticks=rise_ticks,
+            descend_ticks=descend_ticks,
+            fall_ticks=Kinematics._ticks_per_pixel(fall, max_distance),
+            landing_ticks=Kinematics._ticks_per_pixel(jump_fall, max_distance),
+        )
+
+    @staticmethod
+    def _jump_trajectory(gravity: float, jump_speed: float) -> Tuple[float, ...]:
+        """
+        Height above the launch point after each tick until the entity is back at launch height.
+        """
+        heights, height, velocity = [0.0], 0.0, jump_speed
+        while True:
+            velocity += gravity
+            height -= velocity
+            if height <= 0:
+                heights.append(0.0)
+                return tuple(heights)
+            heights.append(height)
+
+    @staticmethod
+    def _fall_trajectory(gravity: float, velocity: float, max_distance: int) -> Tuple[float, ...]:
+        """
+        Distance below the start point after each tick (negative while still above it).
+        """
+        distances, distance = [0.0], 0.0
+        while distance < max_distance:
+            velocity += gravity
+            distance += velocity
+            distances.append(distance)
+        return tuple(distances)
+
+    @staticmethod
+    def _ticks_per_pixel(distances: Tuple[float, ...], max_distance: int) -> Tuple[int, ...]:
+        """
+        Invert a monotonic (after its lowest point) trajectory: for each whole pixel distance, the
+        first tick after which the trajectory is at least that far below the start.
+        """
+        ticks = []
+        tick = min(range(len(distances)), key=lambda t: distances[t])
+        for px in range(max_distance + 1):
+            while distances[tick] < px:
+                tick += 1
+            ticks.append(max(tick, 1) if px > 0 else tick)
+        return tuple(ticks)
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from src.model.weapon_definition import WeaponDefinition
+
+
+@dataclass(frozen=True, slots=True)
+class EntityDefinition:
+    """
+    An entity of a level as compiled by LevelCompiler. The weapon is already resolved to its
+    definition.
+    """
+    name: str
+    lives: int
+    weapon: WeaponDefinition
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyDefinition(EntityDefinition):
+    """
+    An enemy of a level. The type is resolved to the enemy class created by EnemyFactory. The weight
+    is only used by the survival waves (relative spawn probability).
+    """
+    type: str
+    enemy_class: type
+    weight: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class LevelDefinition:
+    """
+    A level from assets/levels. `unlocked` is the initial state from the file, the progress of the
+    player is kept by LevelManager.
+    """
+    id: int
+    name: str
+    unlocked: bool
+    map: str
+    player: EntityDefinition
+    enemies: Tuple[EnemyDefinition, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class LevelEntry:
+    """
+    A level in the LevelCatalog: what the menu shows, without the level body. The level itself is
+    compiled from the file when it is opened (see LevelManager.load_level).
+    """
+    id: int
+    name: str
+    unlocked: bool
+    path: str
+
+
+@dataclass(frozen=True, slots=True)
+class WaveDefinition:
+    """
+    Wave settings of the survival mode (see SurvivalScene). Durations are in seconds.
+    """
+    first_size: int
+    growth: float
+    duration: float
+    pause: float
+    max_enemies: int
+    extra_life_every: int
+    enemies: Tuple[EnemyDefinition, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SurvivalDefinition:
+    """
+    The survival level. It has no fixed enemies, they are spawned in waves.
+    """
+    name: str
+    map: str
+    player: EntityDefinition
+    waves: WaveDefinition
+    enemies: Tuple[EnemyDefinition, ...] = ()
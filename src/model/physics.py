@@ -1,16 +1,18 @@
 from dataclasses import dataclass
-from functools import cached_property
+
+from src.model.kinematics import JumpTable, Kinematics
 
 
 @dataclass
 class Physics:
     """
-    Stores the physical properties of the game. Tuned for 2560x1600 resolution, with scaling
-    applied for others. Each entity uses its own Physics instance, allowing easy future
-    customization (e.g., higher jump, different speed).
+    Stores the physical properties of the game. Tuned for 2560x1600 resolution and 60 ticks per
+    second, with scaling applied for others. Each entity uses its own Physics instance, allowing
+    easy future customization (e.g., higher jump, different speed).
     """
     BASE_WIDTH: int = 2560
     BASE_HEIGHT: int = 1600
+    BASE_TICK_RATE: int = 60
 
     gravity: float = 1.0
     move_speed: float = 10.0
@@ -19,6 +21,7 @@ class Physics:
     bullet_damage: float = 50.0
 
     animation_speed = 0.2
+    tick_rate = 60
     knockback_decay = 0.9
     knockback_threshold = 0.1
 
@@ -35,25 +38,35 @@ class Physics:
         self.bullet_speed *= scale_x
         self.bullet_damage *= scale_x
 
-    @cached_property
-    def jump_height(self) -> float:
+    def apply_tick_rate(self, tick_rate: int):
         """
-        Computes the jump height in pixels. Beware, the result is negative, because the jump moves
-        upward. Please note that the result is cached to avoid repeated computation.If you already
-        accessed the property and then change physics attributes that affect jump height (such as
-        `gravity` or `jump_speed`), you must manually clear the cache by calling:
-
-            del <variable_name>.__dict__['jump_height']
-
-        where `<variable_name>` is your instance of the Physics class. This ensures the value is
-        recalculated the next time it is accessed.
+        Scales the per-tick properties so that the game runs at the same speed with a different
+        number of simulation ticks per second. Velocities grow linearly with the tick length,
+        gravity quadratically and the knockback decay is applied as many times as it would be
+        at the base tick rate.
         """
-        jump_height = 0
-        v = self.jump_speed
-        while v < 0:
-            jump_height += v
-            v += self.gravity
-        return jump_height
-
+        step = self.BASE_TICK_RATE / tick_rate
+        self.tick_rate = tick_rate
+        self.gravity *= step * step
+        self.move_speed *= step
+        self.jump_speed *= step
+        self.bullet_speed *= step
+        self.bullet_damage *= step
+        self.knockback_decay **= step
+        self.animation_speed *= step
 
+    @property
+    def kinematics(self) -> JumpTable:
+        """
+        Precomputed jump and fall tables for the current physics parameters. Tables are cached by
+        the parameters, so changing e.g. `gravity` or `jump_speed` automatically selects another
+        table. See Kinematics.
+        """
+        return Kinematics.for_physics(self)
 
+    @property
+    def jump_height(self) -> float:
+        """
+        The jump height in pixels. Beware, the result is negative, because the jump moves upward.
+        """
+        return -self.kinematics.peak
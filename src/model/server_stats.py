@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ServerStats:
+    """
+    Load statistics of the match server. The load is the fraction of one core spent simulating
+    the hosted matches and the capacity is the estimated number of average matches that fit on
+    one core at the configured tick rate.
+    """
+    matches: int
+    mean_tick_cost: float
+    load: float
+    capacity: int
+    dropped_ticks: int
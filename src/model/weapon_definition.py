@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WeaponDefinition:
+    """
+    Weapon definition loaded from assets/weapons. One trigger pull fires a volley of `count` bullets.
+    The bullets are stacked vertically `spacing` bullet heights apart and fanned out evenly over
+    `spread` degrees. `speed` and `damage` are multipliers of the entity physics (bullet speed and
+    damage), `cooldown` is the time in seconds before the weapon can fire again.
+    """
+    name: str
+    count: int = 1
+    spacing: float = 0.0
+    spread: float = 0.0
+    speed: float = 1.0
+    damage: float = 1.0
+    cooldown: float = 0.5
@@ -0,0 +1,125 @@
+import dataclasses
+import random
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.entities.enemies.policy_enemy import PolicyEnemy
+from src.entities.enemies.threat_predictor import ThreatPredictor
+from src.entities.player_bot import PlayerBot
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.model.level_definition import LevelDefinition
+from src.rl.spaces import Box, Discrete
+from src.scenes.headless_level_scene import HeadlessLevelScene
+
+
+class LevelEnv:
+    """
+    Gym-style reinforcement learning environment around a headless level.
+
+    The agent controls the first enemy of the level (replaced by PolicyEnemy) and fights the
+    player driven by PlayerBot. Other enemies of the level keep their scripted AI. Nothing is
+    drawn while stepping. Resetting restores a snapshot of the freshly loaded level and only
+    re-randomizes the entity spawns, so no assets are loaded after the first reset.
+
+    Observation (all values roughly in [-1, 1]):
+    - agent: x, y, vx, vy, knockback, on ground, facing, shooting, lives
+    - player relative to agent: dx, dy, vx, vy, knockback, on ground, facing, shooting, lives
+    - nearest incoming bullet: time to impact, time to pass, bullet present
+    Reward: +1 for each life the player loses, -1 for each life the agent loses.
+    """
+    OBSERVATION_SIZE = 21
+    MAX_STEPS = 3600
+    THREAT_HORIZON = 60.0
+
+    def __init__(self, level: LevelDefinition, game_manager: Optional[GameManager] = None,
+                 level_manager: Optional[LevelManager] = None,
+                 resolution: Tuple[int, int] = HeadlessLevelScene.DEFAULT_RESOLUTION, max_steps: int = MAX_STEPS):
+        HeadlessLevelScene.init_display()
+        agent = dataclasses.replace(level.enemies[0], type="policy", enemy_class=PolicyEnemy)
+        level = dataclasses.replace(level, enemies=(agent, *level.enemies[1:]))
+        game_manager = game_manager or GameManager(audio_enabled=False)
+        level_manager = level_manager or LevelManager()
+
+        self.scene = HeadlessLevelScene(level, game_manager, level_manager, resolution)
+        self.max_steps = max_steps
+        self.observation_space = Box(-np.inf, np.inf, (self.OBSERVATION_SIZE,))
+        self.action_space = Discrete(PolicyEnemy.ACTION_COUNT)
+        self._initial_state = None
+        self._steps = 0
+
+    def reset(self, seed: Optional[int] = None, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Start a new episode. Entity spawns are randomized by the `random` module, which is seeded
+        when a seed is given. The snapshot also restores the `random` state, it is kept as it was
+        before the restore, so each episode gets new spawns.
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        if self._initial_state is None:
+            self.scene.initialize()
+            self.scene.player.input_source = PlayerBot(self.scene)
+            self.agent = self.scene.enemy_group.sprites()[0]
+            self._threat_predictor = ThreatPredictor(self.agent.physics)
+            self._initial_lives = (self.agent.lives, self.scene.player.lives)
+            self._initial_state = self.scene.save_state()
+        else:
+            random_state = random.getstate()
+            self.scene.load_state(self._initial_state)
+            random.setstate(random_state)
+            for entity in self.scene.entities:
+                entity._initialize_state()
+                entity._reset_position()
+
+        self.scene.perception.update(self.scene.player, self.scene.player_bullets)
+        self._steps = 0
+        return self.observe(out), {}
+
+    def step(self, action: int, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float, bool, bool, Dict]:
+        agent, player = self.agent, self.scene.player
+        agent_lives, player_lives = agent.lives, player.lives
+
+        agent.action = action
+        self.scene.update()
+        self._steps += 1
+
+        reward = float((player_lives - player.lives) - (agent_lives - agent.lives))
+        terminated = not agent.alive() or not player.alive()
+        truncated = not terminated and self._steps >= self.max_steps
+        return self.observe(out), reward, terminated, truncated, {}
+
+    def observe(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Write the observation into `out` (a row of a batch) or into a new array.
+        """
+        if out is None:
+            out = np.empty(self.OBSERVATION_SIZE, dtype=np.float32)
+
+        agent, player = self.agent, self.scene.player
+        width, height = self.scene.map_data.width, self.scene.map_data.height
+        out[:] = (
+            agent.rect.centerx / width, agent.rect.bottom / height,
+            *self._motion(agent), agent.lives / self._initial_lives[0],
+            (player.rect.centerx - agent.rect.centerx) / width, (player.rect.bottom - agent.rect.bottom) / height,
+            *self._motion(player), player.lives / self._initial_lives[1],
+            *self._threat(agent),
+        )
+        return out
+
+    @staticmethod
+    def _motion(entity) -> Tuple[float, ...]:
+        physics = entity.physics
+        return (
+            entity.vx / physics.move_speed, entity.vy / -physics.jump_speed,
+            entity.knockback_x / physics.bullet_damage, float(entity.on_ground),
+            1.0 if entity.facing_right else -1.0, float(entity.shooting),
+        )
+
+    def _threat(self, agent) -> Tuple[float, float, float]:
+        threat = self._threat_predictor.predict(agent.rect, self.scene.perception)
+        if threat is None:
+            return 1.0, 0.0, 0.0
+        time, pass_time, _ = threat
+        return min(time / self.THREAT_HORIZON, 1.0), min(pass_time / self.THREAT_HORIZON, 1.0), 1.0
@@ -0,0 +1,55 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class Discrete:
+    """
+    Space of integer actions 0, 1, ..., n - 1 (same meaning as gym.spaces.Discrete).
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.shape = ()
+        self.dtype = np.int64
+
+    def sample(self, rng: Optional[np.random.Generator] = None) -> int:
+        rng = rng or np.random.default_rng()
+        return int(rng.integers(self.n))
+
+    def contains(self, value) -> bool:
+        return 0 <= int(value) < self.n
+
+
+class Box:
+    """
+    Space of real vectors with bounds for each dimension (same meaning as gym.spaces.Box). Bounds
+    may be infinite, sample() then draws like gym: from a normal distribution for unbounded
+    dimensions, from a shifted exponential distribution for dimensions bounded on one side and
+    uniformly for bounded ones.
+    """
+
+    def __init__(self, low: float, high: float, shape: Tuple[int, ...], dtype=np.float32):
+        self.low = np.full(shape, low, dtype=dtype)
+        self.high = np.full(shape, high, dtype=dtype)
+        self.shape = shape
+        self.dtype = dtype
+
+    def sample(self, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        rng = rng or np.random.default_rng()
+        low_bounded, high_bounded = np.isfinite(self.low), np.isfinite(self.high)
+        sample = np.empty(self.shape, dtype=np.float64)
+
+        bounded = low_bounded & high_bounded
+        sample[bounded] = rng.uniform(self.low[bounded], self.high[bounded])
+        unbounded = ~low_bounded & ~high_bounded
+        sample[unbounded] = rng.normal(size=np.count_nonzero(unbounded))
+        only_low = low_bounded & ~high_bounded
+        sample[only_low] = self.low[only_low] + rng.exponential(size=np.count_nonzero(only_low))
+        only_high = ~low_bounded & high_bounded
+        sample[only_high] = self.high[only_high] - rng.exponential(size=np.count_nonzero(only_high))
+        return sample.astype(self.dtype)
+
+    def contains(self, value) -> bool:
+        value = np.asarray(value)
+        return value.shape == self.shape and bool(np.all((value >= self.low) & (value <= self.high)))
@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.entities.enemies.policy_enemy import PolicyEnemy
+from src.model.level_definition import LevelDefinition
+from src.rl.level_env import LevelEnv
+from src.rl.spaces import Box, Discrete
+from src.rl.vector_level_env import VectorLevelEnv
+from src.scenes.headless_level_scene import HeadlessLevelScene
+
+
+def _worker(connection: Connection, levels: Sequence[LevelDefinition], num_envs: int, resolution: Tuple[int, int],
+            max_steps: int) -> None:
+    """
+    Host a VectorLevelEnv in a worker process and execute commands sent through the pipe.
+    """
+    env = VectorLevelEnv(levels, num_envs, resolution, max_steps)
+    while True:
+        command, data = connection.recv()
+        if command == "step":
+            connection.send(env.step(data))
+        elif command == "reset":
+            connection.send(env.reset(data))
+        elif command == "close":
+            connection.close()
+            return
+
+
+class SubprocVectorLevelEnv:
+    """
+    Vectorised environment split across worker processes to use multiple cores. Each worker
+    steps its share of the environments in lockstep (see VectorLevelEnv), the main process only
+    sends the actions and concatenates the batched results.
+    """
+
+    def __init__(self, levels: Sequence[LevelDefinition], num_envs: int, num_workers: Optional[int] = None,
+                 resolution: Tuple[int, int] = HeadlessLevelScene.DEFAULT_RESOLUTION,
+                 max_steps: int = LevelEnv.MAX_STEPS):
+        num_workers = min(num_workers or os.cpu_count() or 1, num_envs)
+        sizes = [num_envs // num_workers + (index < num_envs % num_workers) for index in range(num_workers)]
+        self._splits = np.cumsum(sizes)[:-1]
+        self._seed_offsets = [0, *self._splits.tolist()]
+        self.num_envs = num_envs
+
+        context = multiprocessing.get_context("spawn")
+        self._connections: List[Connection] = []
+        self._processes = []
+        for size in sizes:
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, levels, size, resolution, max_steps), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        self.observation_space = Box(-np.inf, np.inf, (LevelEnv.OBSERVATION_SIZE,))
+        self.action_space = Discrete(PolicyEnemy.ACTION_COUNT)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, List[Dict]]:
+        for connection, offset in zip(self._connections, self._seed_offsets):
+            connection.send(("reset", None if seed is None else seed + offset))
+        results = [connection.recv() for connection in self._connections]
+        observations = np.concatenate([result[0] for result in results])
+        return observations, [info for result in results for info in result[1]]
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        for connection, chunk in zip(self._connections, np.split(np.asarray(actions), self._splits)):
+            connection.send(("step", chunk))
+        results = [connection.recv() for connection in self._connections]
+        return (
+            np.concatenate([result[0] for result in results]),
+            np.concatenate([result[1] for result in results]),
+            np.concatenate([result[2] for result in results]),
+            np.concatenate([result[3] for result in results]),
+            [info for result in results for info in result[4]],
+        )
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.send(("close", None))
+        for process in self._processes:
+            process.join()
@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.model.level_definition import LevelDefinition
+from src.rl.level_env import LevelEnv
+from src.scenes.headless_level_scene import HeadlessLevelScene
+
+
+class VectorLevelEnv:
+    """
+    Step N independent LevelEnv matches in lockstep and return batched observations.
+
+    Environment i plays levels[i % len(levels)]. Finished environments are reset automatically;
+    their last observation is stored in infos[i]["final_observation"]. The returned arrays are
+    buffers reused by the next call, copy them if they need to be kept.
+    """
+
+    def __init__(self, levels: Sequence[LevelDefinition], num_envs: int,
+                 resolution: Tuple[int, int] = HeadlessLevelScene.DEFAULT_RESOLUTION,
+                 max_steps: int = LevelEnv.MAX_STEPS):
+        HeadlessLevelScene.init_display()
+        game_manager = GameManager(audio_enabled=False)
+        level_manager = LevelManager()
+        self.envs = [
+            LevelEnv(levels[i % len(levels)], game_manager, level_manager, resolution, max_steps)
+            for i in range(num_envs)
+        ]
+        self.num_envs = num_envs
+        self.observation_space = self.envs[0].observation_space
+        self.action_space = self.envs[0].action_space
+
+        self._observations = np.zeros((num_envs, LevelEnv.OBSERVATION_SIZE), dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=bool)
+        self._truncated = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, List[Dict]]:
+        for index, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + index, self._observations[index])
+        return self._observations, [{} for _ in self.envs]
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        infos = []
+        observations = self._observations
+        for index, (env, action) in enumerate(zip(self.envs, actions.tolist())):
+            _, reward, terminated, truncated, info = env.step(action, observations[index])
+            self._rewards[index] = reward
+            self._terminated[index] = terminated
+            self._truncated[index] = truncated
+
+            if terminated or truncated:
+                info = {"final_observation": observations[index].copy()}
+                env.reset(out=observations[index])
+            infos.append(info)
+
+        return observations, self._rewards, self._terminated, self._truncated, infos
+
+    def close(self) -> None:
+        pass
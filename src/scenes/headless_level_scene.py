@@ -0,0 +1,61 @@
+import os
+from typing import Tuple
+
+import pygame
+
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.model.level_definition import LevelDefinition
+from src.model.physics import Physics
+from src.scenes.level_scene import LevelScene
+
+
+class HeadlessLevelScene(LevelScene):
+    """
+    Level scene used for simulations without a window (match server, benchmarks, training). It
+    plays the given level on its own off-screen surface, never changes the game scene, never
+    unlocks levels and does not touch the mouse. It is only updated; drawing is optional. Particle
+    effects are not created.
+    """
+    DEFAULT_RESOLUTION = (1280, 800)
+    EFFECTS = False
+
+    def __init__(self, level: LevelDefinition, game_manager: GameManager, level_manager: LevelManager,
+                 resolution: Tuple[int, int] = DEFAULT_RESOLUTION, tick_rate: int = Physics.BASE_TICK_RATE):
+        super().__init__(pygame.Surface(resolution), game_manager, level_manager, tick_rate)
+        self._level = level
+
+    @staticmethod
+    def init_display():
+        """
+        Images are converted to the display pixel format when loaded, so pygame needs a display
+        even when nothing is shown. Use the dummy video driver unless another one is requested.
+        """
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+
+    @property
+    def finished(self) -> bool:
+        return self.level_result is not None
+
+    def initialize(self):
+        """
+        Always start the level from scratch, there is no pause scene in headless mode.
+        """
+        self._initialize()
+        self._load_map()
+        self._load_entities()
+        self._create_ui_panels()
+        self._create_snapshot()
+
+    def _initialize(self):
+        super()._initialize()
+        self.level = self._level
+
+    def _finish_level(self, player_won: bool):
+        self.level_result = self._create_level_result(player_won)
+
+    def _check_switch_to_menu(self):
+        pass
@@ -5,27 +5,44 @@ import pygame
 from src.constants import colors
 from src.constants.fonts import LARGE_FONT
 from src.constants.paths import MAP_PATH
+from src.effects.particle_system import ParticleSystem
+from src.entities.enemies.ai_scheduler import AIScheduler
 from src.entities.enemies.enemy_factory import EnemyFactory
+from src.entities.enemies.world_perception import WorldPerception
+from src.entities.entity_pool import EntityPool
 from src.entities.player import Player
 from src.managers.game_manager import GameScenes, GameManager
 from src.managers.level_manager import LevelManager
 from src.model.entity_config import EntityConfig
+from src.model.frame_description import FrameDescription
+from src.model.level_definition import EnemyDefinition
 from src.model.level_result import LevelResult
 from src.model.physics import Physics
 from src.scenes.scene import Scene
 from src.ui.entity_panel import EntityPanel
+from src.utils.level_snapshot import LevelSnapshot
 from src.utils.map_loader import MapLoader
+from src.utils.pixel_collision import PixelCollision
+from src.utils.render_batch import RenderBatch
+from src.utils.swept_collision import SweptCollision
 
 
 class LevelScene(Scene):
     """
-    Main game scene handling rendering and logic for a specific level.
+    Main game scene handling rendering and logic for a specific level. With pixel_perfect_hits,
+    bullets only hit opaque pixels of the entities (see PixelCollision), otherwise their rects.
     """
     SWITCH_TO_MENU_DELAY = 1000
+    EFFECTS = True
+    MAP_LAYER, UI_LAYER, ENTITY_LAYER, BULLET_LAYER, EFFECT_LAYER, OVERLAY_LAYER = range(6)
 
-    def __init__(self, surface: pygame.Surface, game_manager: GameManager, level_manager: LevelManager):
+    def __init__(self, surface: pygame.Surface, game_manager: GameManager, level_manager: LevelManager,
+                 tick_rate: int = Physics.BASE_TICK_RATE, pixel_perfect_hits: bool = False):
         super().__init__(surface, game_manager)
         self.level_manager = level_manager
+        self.tick_rate = tick_rate
+        self._bullet_hit = PixelCollision.bullet_hit if pixel_perfect_hits else SweptCollision.bullet_hit
+        self.render_batch = RenderBatch(self.OVERLAY_LAYER + 1)
         self._init_ui_layout()
 
     def _init_ui_layout(self):
@@ -50,6 +67,7 @@ class LevelScene(Scene):
         self._load_map()
         self._load_entities()
         self._create_ui_panels()
+        self._create_snapshot()
 
     def _initialize(self):
         """
@@ -57,24 +75,44 @@ class LevelScene(Scene):
         """
         self.level = self.level_manager.current_level
         self.level_result = None
+        self._mission_result = None
+        self.tick = 0
         self.player_bullets = pygame.sprite.Group()
         self.enemy_bullets = pygame.sprite.Group()
 
+    def _create_snapshot(self):
+        self.snapshot = LevelSnapshot(self)
+
     def _load_map(self):
-        map_path = os.path.join(MAP_PATH, self.level["map"])
+        map_path = os.path.join(MAP_PATH, self.level.map)
         self.map_data = MapLoader.load_map(str(map_path), self.width, self.height)
 
     def _load_entities(self):
         """
         Load all entities in the level. Each entity will receive default physics which
-        is scaled to the size of the map. The default physics was tuned for resolution
-        2560x1600. See Physics class for more details.
+        is scaled to the size of the map and to the simulation tick rate. The default physics
+        was tuned for resolution 2560x1600 at 60 ticks per second. See Physics class for more details.
+        Entities of the previous run are released to the pool first, so a restart reuses them.
         """
+        self._release_entities()
+        self._create_effects()
         physics = Physics()
         physics.apply_scaling(self.map_data.width, self.map_data.height)
+        physics.apply_tick_rate(self.tick_rate)
+        self.physics = physics
 
         self._load_player(physics)
         self._load_enemies(physics)
+        self.entities = [*self.player_group, *self.enemy_group]
+        self.ai_scheduler = AIScheduler(self.map_data.surface.get_rect())
+        self.perception = WorldPerception(self.map_data, self.player.height)
+
+    def _create_effects(self):
+        """
+        Particle effects are only created when the scene draws them (see EFFECTS).
+        """
+        self.effects = ParticleSystem(self.map_data.width, self.map_data.height, self.tick_rate) \
+            if self.EFFECTS else None
 
     def _create_entity_config(self, physics, entity_data, bullet_adder):
         """
@@ -82,14 +120,14 @@ class LevelScene(Scene):
         modify its physics (for example change move speed).
         """
         physics_copy = copy.copy(physics)
-        return EntityConfig(self.map_data, entity_data, bullet_adder, physics_copy)
+        return EntityConfig(self.map_data, entity_data, bullet_adder, physics_copy, self.effects)
 
     def _load_player(self, physics):
         """
         Load player entity and place it into player group.
         """
-        player_config = self._create_entity_config(physics, self.level["player"], self.player_bullets.add)
-        self.player = Player(player_config)
+        player_config = self._create_entity_config(physics, self.level.player, self.player_bullets.add)
+        self.player = EntityPool.acquire(Player, player_config)
         self.player_group = pygame.sprite.Group(self.player)
 
     def _load_enemies(self, physics):
@@ -97,46 +135,106 @@ class LevelScene(Scene):
         Load all enemies in the level and place them into enemy group.
         """
         self.enemy_group = pygame.sprite.Group()
-        for enemy_data in self.level["enemies"]:
+        for enemy_data in self.level.enemies:
             enemy_config = self._create_entity_config(physics, enemy_data, self.enemy_bullets.add)
             enemy = EnemyFactory.create_enemy(enemy_config)
             self.enemy_group.add(enemy)
 
+    def _release_entities(self):
+        """
+        Return entities of the previous run to the pool (nothing to release on the first run).
+        """
+        for entity in getattr(self, "entities", ()):
+            EntityPool.release(entity)
+
+    def spawn_enemy(self, enemy_data: EnemyDefinition):
+        """
+        Add an enemy to the running level. The enemy is taken from the entity pool, so spawning does
+        not load any images. Only the UI panel of the new enemy is created and the enemy is added to
+        the snapshot, the other entities are not touched.
+        """
+        enemy = self._add_enemy(enemy_data)
+        self.entities.append(enemy)
+        self.entity_panels.append((self._create_ui_panel(enemy), enemy))
+        self.snapshot.add_entity(enemy)
+        return enemy
+
+    def _add_enemy(self, enemy_data: EnemyDefinition):
+        enemy_config = self._create_entity_config(self.physics, enemy_data, self.enemy_bullets.add)
+        enemy = EnemyFactory.create_enemy(enemy_config)
+        self.enemy_group.add(enemy)
+        return enemy
+
     def update(self):
         """
         Update the level scene.
         """
+        self.tick += 1
         self.player_group.update()
-        self.enemy_group.update(
-            player_bullets=self.player_bullets,
-            player_center=self.player.rect.centerx,
-            player_platform=self.player.platform
-        )
-        self.player_bullets.update(self.map_data.width)
-        self.enemy_bullets.update(self.map_data.width)
+        self.ai_scheduler.schedule(self.enemy_group.sprites(), self.player.rect)
+        self.perception.update(self.player, self.player_bullets)
+        self.enemy_group.update(perception=self.perception)
+        self.player_bullets.update(self.map_data.width, self.map_data.height)
+        self.enemy_bullets.update(self.map_data.width, self.map_data.height)
         self._check_bullet_collisions()
+        if self.effects:
+            self.effects.update()
         self._check_level_end()
 
+    def save_state(self, buffer: bytearray = None) -> bytearray:
+        """
+        Capture the state of all entities, bullets and the level result into a binary buffer. Pass
+        the buffer returned by the previous call to reuse it. See LevelSnapshot for more details.
+        """
+        return self.snapshot.capture(buffer)
+
+    def load_state(self, buffer) -> None:
+        """
+        Restore the level to the state captured by save_state().
+        """
+        self.snapshot.restore(buffer)
+
     def _check_bullet_collisions(self):
         self._handle_enemy_bullets()
         self._handle_friendly_bullets()
 
     def _handle_enemy_bullets(self):
         """
-        If the player is hit by an enemy bullet, apply knockback.
+        If the player is hit by an enemy bullet, apply knockback. Bullets are tested along the whole
+        path travelled in the last frame (see SweptCollision). With pixel perfect hits, only bullets
+        touching opaque pixels of the current animation frame hit (see PixelCollision).
+
+        Candidates are found by a single collidelistall call over the bullet sweep rects, so the
+        exact (slower) hit test only runs for the few bullets near the player.
         """
-        hit_bullets = pygame.sprite.spritecollide(self.player, self.enemy_bullets, dokill=True)
-        for bullet in hit_bullets:
-            self.player.knockback_x += bullet.damage
+        bullets = self.enemy_bullets.sprites()
+        candidates = self.player.rect.collidelistall([bullet.sweep_rect for bullet in bullets])
+        for index in candidates:
+            bullet = bullets[index]
+            if self._bullet_hit(self.player, bullet):
+                bullet.kill()
+                self.player.knockback_x += bullet.damage
+                self._emit_impact(bullet)
 
     def _handle_friendly_bullets(self):
         """
-        If enemy is hit by a player bullet, apply knockback.
+        If enemy is hit by a player bullet, apply knockback. A bullet is removed at the first enemy
+        it hits. Same broadphase as for enemy bullets, enemy rects are collected once per frame.
         """
-        hits = pygame.sprite.groupcollide(self.enemy_group, self.player_bullets, False, True)
-        for enemy, bullets in hits.items():
-            for bullet in bullets:
-                enemy.knockback_x += bullet.damage
+        enemies = self.enemy_group.sprites()
+        enemy_rects = [enemy.rect for enemy in enemies]
+        for bullet in self.player_bullets.sprites():
+            for index in bullet.sweep_rect.collidelistall(enemy_rects):
+                enemy = enemies[index]
+                if self._bullet_hit(enemy, bullet):
+                    enemy.knockback_x += bullet.damage
+                    bullet.kill()
+                    self._emit_impact(bullet)
+                    break
+
+    def _emit_impact(self, bullet):
+        if self.effects:
+            self.effects.impact(bullet.rect.center, bullet.speed > 0)
 
     def _check_level_end(self):
         """
@@ -149,11 +247,22 @@ class LevelScene(Scene):
             return
 
         if len(self.player_group) == 0:
-            self.level_result = LevelResult(False, pygame.time.get_ticks())
+            self._finish_level(player_won=False)
         elif len(self.enemy_group) == 0:
-            self.level_result = LevelResult(True, pygame.time.get_ticks())
+            self._finish_level(player_won=True)
+
+    def _finish_level(self, player_won: bool):
+        """
+        Store the level result. If the player won, the next level is unlocked.
+        """
+        self.level_result = self._create_level_result(player_won)
+        if player_won:
             self.level_manager.unlock_next_level()
 
+    @staticmethod
+    def _create_level_result(player_won: bool) -> LevelResult:
+        return LevelResult(player_won, pygame.time.get_ticks())
+
     def _check_switch_to_menu(self):
         """
         The level scene is switched to the menu scene after certain amount of time since level
@@ -167,19 +276,10 @@ class LevelScene(Scene):
         Create UI panels for all entities in the level. The UI panel holds information about
         entity (name, image and lives - this value is updated dynamically).
         """
-        all_entities = [*self.player_group, *self.enemy_group]
-        total_width = (self.panel_width + self.spacing) * len(all_entities) - self.spacing
-        start_x = (self.width - total_width) // 2
-        panel_size = (self.panel_width, self.panel_height)
-        self.entity_panels = []
+        self.entity_panels = [(self._create_ui_panel(entity), entity) for entity in self.entities]
 
-        for index, entity in enumerate(all_entities):
-            x = start_x + index * (self.panel_width + self.spacing)
-            y = self.spacing
-            position = (x, y)
-            entity_data = (entity.name, entity.image)
-            panel = EntityPanel(panel_size, position, self.spacing, *entity_data)
-            self.entity_panels.append((panel, entity))
+    def _create_ui_panel(self, entity) -> EntityPanel:
+        return EntityPanel((self.panel_width, self.panel_height), self.spacing, entity.name, entity.image)
 
     def handle_event(self, event):
         """
@@ -189,38 +289,64 @@ class LevelScene(Scene):
             self.game_manager.set_scene(GameScenes.PAUSE)
 
     def draw(self):
+        self.render(self.describe())
+
+    def describe(self) -> FrameDescription:
         """
-        Draw the level. Start with drawing the map, then draw UI panels, then draw entities and finally
-        draw bullets. If the level is finished, draw the mission result at the top of the surface.
+        Describe the level frame. Start with the map, then UI panels, then entities and finally
+        bullets and particle effects. If the level is finished, the mission result is at the top.
+        Everything is collected into the render batch, so the frame is drawn by one blits call.
         """
         self._draw_map()
         self._draw_ui()
         self._draw_entities()
         self._draw_bullets()
+        self._draw_effects()
 
         if self.level_result:
             self._draw_mission_result()
+        return FrameDescription(self.tick, self.render_batch.take())
 
     def _draw_map(self):
-        self.surface.blit(self.map_data.surface, (0, 0))
+        self.render_batch.layers[self.MAP_LAYER].blit(self.map_data.surface, (0, 0))
 
     def _draw_ui(self):
+        """
+        The panels are drawn in a row centered at the top of the screen. The row is laid out here,
+        so adding a panel does not need to move the others.
+        """
+        layer = self.render_batch.layers[self.UI_LAYER]
+        step = self.panel_width + self.spacing
+        x = (self.width - step * len(self.entity_panels) + self.spacing) // 2
         for panel, entity in self.entity_panels:
-            panel.draw(self.surface, entity.lives)
+            panel.draw(layer, entity.lives, (x, self.spacing))
+            x += step
 
     def _draw_entities(self):
-        for entity in [*self.player_group, *self.enemy_group]:
-            entity.draw(self.surface)
+        layer = self.render_batch.layers[self.ENTITY_LAYER]
+        for entity in self.player_group:
+            entity.draw(layer)
+        for entity in self.enemy_group:
+            entity.draw(layer)
 
     def _draw_bullets(self):
-        self.player_bullets.draw(self.surface)
-        self.enemy_bullets.draw(self.surface)
+        layer = self.render_batch.layers[self.BULLET_LAYER]
+        layer.extend([(bullet.image, bullet.rect.topleft) for bullet in self.player_bullets])
+        layer.extend([(bullet.image, bullet.rect.topleft) for bullet in self.enemy_bullets])
+
+    def _draw_effects(self):
+        if self.effects:
+            self.render_batch.layers[self.EFFECT_LAYER].extend(self.effects.get_blits())
 
     def _draw_mission_result(self):
-        text, color = self._get_level_finish_text_and_color()
-        mission_result = LARGE_FONT.render(text, True, color)
-        rect = mission_result.get_rect(center=self.surface.get_rect().center)
-        self.surface.blit(mission_result, rect)
+        """
+        The result does not change once the level is finished, so it is rendered only once.
+        """
+        if self._mission_result is None:
+            text, color = self._get_level_finish_text_and_color()
+            image = LARGE_FONT.render(text, True, color)
+            self._mission_result = image, image.get_rect(center=self.surface.get_rect().center).topleft
+        self.render_batch.layers[self.OVERLAY_LAYER].blit(*self._mission_result)
 
     def _get_level_finish_text_and_color(self):
         if self.level_result.player_won:
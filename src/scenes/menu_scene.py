@@ -12,13 +12,19 @@ from src.ui.button import Button
 class MenuScene(Scene):
     """
     Game starting scene. It shows a title and buttons to start a level. Successfully finishing of
-    the level will unlock next level.
+    the level will unlock next level. The last button starts the survival mode.
+
+    The level list is virtualised: there are only buttons for the rows that fit on the screen and
+    scrolling (mouse wheel, arrow and page keys) assigns them other levels, so the menu costs the
+    same with a handful of levels or thousands of them. A level file is only read when its button
+    is clicked.
     """
+    SCROLL_KEYS = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -1, pygame.K_PAGEDOWN: 1}
+    PAGE_KEYS = (pygame.K_PAGEUP, pygame.K_PAGEDOWN)
 
     def __init__(self, surface: pygame.Surface, game_manager: GameManager, level_manager: LevelManager):
         super().__init__(surface, game_manager)
         self.level_manager = level_manager
-        self.buttons: List[Button] = []
         self._init_layout()
 
     def _init_layout(self):
@@ -28,19 +34,33 @@ class MenuScene(Scene):
         self.button_width = self.width // 3
         self.button_height = self.height // 15
         self.padding = self.button_height // 4
+        self.row_height = self.button_height + self.padding
         self.title_height = LARGE_FONT.get_height()
         self.title_space = 3 * self.padding
+        self.visible_rows = self._count_visible_rows()
+        self.first_row = 0
+        self.num_levels = len(self.level_manager.levels)
+        self.buttons: List[Button] = []
 
         self._calculate_container_rect()
         self._set_title_position()
         self._create_level_buttons()
 
+    def _count_visible_rows(self) -> int:
+        """
+        Number of level buttons shown at once: all levels if they fit on the screen, otherwise as
+        many as fit between the title and the survival button.
+        """
+        free_height = self.height - self.title_height - self.title_space - 2 * self.padding
+        fitting = max(1, free_height // self.row_height - 1)
+        return min(len(self.level_manager.levels), fitting)
+
     def _calculate_container_rect(self):
         """
         Create and center the container that will hold game title and level buttons.
         """
-        num_levels = len(self.level_manager.levels)
-        total_button_height = num_levels * (self.button_height + self.padding) - self.padding
+        num_buttons = self.visible_rows + 1
+        total_button_height = num_buttons * self.row_height - self.padding
         container_height = self.title_height + self.title_space + total_button_height
         container_width = self.button_width
 
@@ -56,24 +76,33 @@ class MenuScene(Scene):
 
     def _create_level_buttons(self):
         """
-        Create the level button rects.
+        Create the button rects of the visible rows, the scroll bar next to them and the survival
+        button below them.
         """
         x = self.container_rect.left
         y = self.container_rect.top + self.title_height + self.title_space
         button_dimensions = (self.button_width, self.button_height)
 
-        for i, level in enumerate(self.level_manager.levels):
-            button_rect = pygame.Rect(x, y + i * (self.button_height + self.padding), *button_dimensions)
-            self.buttons.append(Button(button_rect, on_click=self._make_level_callback(level)))
+        for row in range(self.visible_rows):
+            button_rect = pygame.Rect(x, y + row * self.row_height, *button_dimensions)
+            self.buttons.append(Button(button_rect, on_click=self._make_level_callback(row)))
+
+        list_height = max(0, self.visible_rows * self.row_height - self.padding)
+        self.scroll_bar_rect = pygame.Rect(x + self.button_width + self.padding, y, self.padding, list_height)
+        self.list_rect = pygame.Rect(x, y, self.scroll_bar_rect.right - x, list_height)
 
-    def _make_level_callback(self, level):
+        button_rect = pygame.Rect(x, y + self.visible_rows * self.row_height, *button_dimensions)
+        self.survival_button = Button(button_rect, on_click=lambda: self.game_manager.set_scene(GameScenes.SURVIVAL))
+
+    def _make_level_callback(self, row: int):
         """
-        Handle level button click. If relevant level is unlocked, set it as the current level and
-        switch to the level scene.
+        Handle level button click. If the level shown in the row is unlocked, load it as the current
+        level and switch to the level scene.
         """
         def callback():
-            if level["unlocked"]:
-                self.level_manager.current_level = level
+            level = self.level_manager.levels[self.first_row + row]
+            if self.level_manager.is_unlocked(level):
+                self.level_manager.current_level = self.level_manager.load_level(level)
                 self.game_manager.set_scene(GameScenes.LEVEL)
         return callback
 
@@ -81,18 +110,37 @@ class MenuScene(Scene):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game_manager.set_scene(GameScenes.PAUSE)
             return
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll(-event.y)
+        elif event.type == pygame.KEYDOWN and event.key in self.SCROLL_KEYS:
+            self.scroll(self.SCROLL_KEYS[event.key] * (self.visible_rows if event.key in self.PAGE_KEYS else 1))
 
         for button in self.buttons:
             button.handle_event(event)
+        self.survival_button.handle_event(event)
 
     def initialize(self):
         """
         Initialize the menu scene each time when game is switched to this scene.
         """
         pygame.mouse.set_visible(True)
+        if self.num_levels != len(self.level_manager.levels):
+            # Levels were added or removed (hot reload).
+            self._init_layout()
         super().initialize()
         self._render_title()
         self._render_level_buttons()
+        self._render_survival_button()
+
+    def scroll(self, rows: int):
+        """
+        Move the level list by the number of rows (negative is up) and draw the rows again.
+        """
+        last_row = max(0, len(self.level_manager.levels) - self.visible_rows)
+        first_row = min(max(self.first_row + rows, 0), last_row)
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self._render_level_buttons()
 
     def _render_title(self):
         title_text = LARGE_FONT.render("Gun Mayhem", True, colors.TITLE_COLOR)
@@ -100,11 +148,32 @@ class MenuScene(Scene):
         self.surface.blit(title_text, title_rect)
 
     def _render_level_buttons(self):
-        for i, button in enumerate(self.buttons):
-            level = self.level_manager.levels[i]
-            base_color, text_color = self._get_button_colors(level["unlocked"])
-            button.draw(self.surface, level["name"], base_color, text_color)
+        self.surface.blit(self.background, self.list_rect, self.list_rect)
+        for row, button in enumerate(self.buttons):
+            level = self.level_manager.levels[self.first_row + row]
+            base_color, text_color = self._get_button_colors(self.level_manager.is_unlocked(level))
+            button.draw(self.surface, level.name, base_color, text_color)
             pygame.draw.rect(self.surface, (0, 0, 0), button.rect, 2, border_radius=10)
+        self._render_scroll_bar()
+
+    def _render_scroll_bar(self):
+        """
+        Show the position of the visible rows in the list, only when not all levels fit.
+        """
+        num_levels = len(self.level_manager.levels)
+        if num_levels <= self.visible_rows:
+            return
+
+        track = self.scroll_bar_rect
+        thumb_height = max(self.padding, track.height * self.visible_rows // num_levels)
+        thumb_y = track.top + (track.height - thumb_height) * self.first_row // (num_levels - self.visible_rows)
+        pygame.draw.rect(self.surface, colors.BUTTON_DISABLED, track, border_radius=track.width // 2)
+        thumb = pygame.Rect(track.left, thumb_y, track.width, thumb_height)
+        pygame.draw.rect(self.surface, colors.BUTTON_ENABLED, thumb, border_radius=track.width // 2)
+
+    def _render_survival_button(self):
+        self.survival_button.draw(self.surface, "Survival", colors.BUTTON_CONTINUE, colors.WHITE)
+        pygame.draw.rect(self.surface, (0, 0, 0), self.survival_button.rect, 2, border_radius=10)
 
     @staticmethod
     def _get_button_colors(unlocked: bool):
@@ -97,10 +97,10 @@ class PauseScene(Scene):
 
     def _handle_exit(self):
         """
-        Handle exit button click. In case that previous scene is the level scene, return to
-        menu scene. Otherwise, exit the game.
+        Handle exit button click. In case that previous scene is the level (or survival) scene,
+        return to menu scene. Otherwise, exit the game.
         """
-        if self.game_manager.previous_scene == GameScenes.LEVEL:
+        if self.game_manager.previous_scene in (GameScenes.LEVEL, GameScenes.SURVIVAL):
             self.game_manager.set_scene(GameScenes.MENU)
         else:
             pygame.quit()
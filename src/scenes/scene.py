@@ -1,8 +1,11 @@
 import pygame
 
+from typing import Optional
+
 from src.constants import colors
 from src.constants.paths import BACKGROUND
 from src.managers.game_manager import GameManager
+from src.model.frame_description import FrameDescription
 from src.utils.image_loader import ImageLoader
 from src.utils.image_scaler import ImageScaler
 
@@ -35,6 +38,16 @@ class Scene:
         """
         pass
 
+    def describe(self) -> Optional[FrameDescription]:
+        """
+        Override to support pipelined rendering: return the frame as a description that render()
+        can draw later (possibly on the render thread). Scenes returning None are drawn by draw().
+        """
+        return None
+
+    def render(self, frame: FrameDescription):
+        self.surface.blits(frame.blits, doreturn=False)
+
     def handle_event(self, event: pygame.event.Event):
         """Override to handle input events."""
         pass
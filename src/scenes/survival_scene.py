@@ -0,0 +1,172 @@
+import dataclasses
+import random
+import sys
+import pygame
+
+from typing import List, Optional
+from src.constants import colors
+from src.constants.fonts import SMALL_FONT
+from src.constants.paths import SURVIVAL
+from src.entities.enemies.enemy import Enemy
+from src.entities.entity_pool import EntityPool
+from src.managers.frame_pacer import FramePacer
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.model.level_result import LevelResult
+from src.model.physics import Physics
+from src.scenes.level_scene import LevelScene
+from src.utils.level_compiler import LevelCompiler
+
+
+class SurvivalScene(LevelScene):
+    """
+    Endless mode. Escalating waves of enemies are spawned until the player dies. Every wave is larger
+    than the previous one and each few waves the enemies get an extra life. Wave settings and enemy
+    types (with their spawn weights) are read from the survival level file.
+
+    Enemies are taken from the entity pool and killed enemies are returned to it, so spawning does not
+    allocate anything once the pool is warm. Each second the number of entities and bullets is logged
+    to stderr, with the mean frame time and busy time of the game loop measured by the frame pacer
+    (see FramePacer.frame_times), which makes the mode usable as a stress test.
+    """
+    LOG_INTERVAL = 1
+
+    def __init__(self, surface: pygame.Surface, game_manager: GameManager, level_manager: LevelManager,
+                 tick_rate: int = Physics.BASE_TICK_RATE, pixel_perfect_hits: bool = False,
+                 pacer: Optional[FramePacer] = None):
+        super().__init__(surface, game_manager, level_manager, tick_rate, pixel_perfect_hits)
+        self.pacer = pacer
+        self.survival = LevelCompiler.load_survival(SURVIVAL)
+        self.waves = self.survival.waves
+        self.enemy_weights = [enemy_data.weight for enemy_data in self.waves.enemies]
+
+    def _initialize(self):
+        """
+        Same as parent method, but the level is the survival level and wave counters are reset.
+        """
+        super()._initialize()
+        self.level = self.survival
+        self.enemies: List[Enemy] = []
+        self.wave = 0
+        self.kills = 0
+        self._start_wave()
+        self._hud_values = None
+        self._log_ticks = 0
+
+    def _load_enemies(self, physics):
+        """
+        The survival starts without enemies, they are spawned in waves.
+        """
+        self.enemy_group = pygame.sprite.Group()
+
+    def _start_wave(self):
+        """
+        Start the next wave. Its enemies are spawned evenly during the wave duration.
+        """
+        self.wave += 1
+        self.wave_size = round(self.waves.first_size * self.waves.growth ** (self.wave - 1))
+        self.wave_spawned = 0
+        self.wave_start = self.tick
+        self.wave_ticks = round(self.waves.duration * self.tick_rate)
+        self.pause_ticks = round(self.waves.pause * self.tick_rate)
+        self.extra_lives = (self.wave - 1) // self.waves.extra_life_every
+        self.enemy_types = [
+            dataclasses.replace(enemy_data, lives=enemy_data.lives + self.extra_lives)
+            for enemy_data in self.waves.enemies
+        ]
+
+    def update(self):
+        super().update()
+        self._recycle_killed_enemies()
+        if not self.level_result:
+            self._spawn_enemies()
+
+        self._log_ticks += 1
+        if self._log_ticks == self.LOG_INTERVAL * self.tick_rate:
+            self._log_stats()
+
+    def _recycle_killed_enemies(self):
+        """
+        Return killed enemies to the pool. Killed enemies are removed from the enemy group, so the
+        list of enemies is only filtered when the group got smaller.
+        """
+        if len(self.enemy_group) == len(self.enemies):
+            return
+
+        alive = []
+        for enemy in self.enemies:
+            if enemy.alive():
+                alive.append(enemy)
+            else:
+                EntityPool.release(enemy)
+                self.kills += 1
+        self.enemies = alive
+        self.entities = [self.player, *alive]
+
+    def _spawn_enemies(self):
+        """
+        Spawn the enemies of the current wave that are due, but never more than max_enemies alive
+        at once. The next wave starts when the current one is spawned and either all enemies are
+        killed or the pause after the wave has passed.
+        """
+        elapsed = self.tick - self.wave_start
+        due = min(self.wave_size, self.wave_size * elapsed // self.wave_ticks + 1)
+        while self.wave_spawned < due and len(self.enemies) < self.waves.max_enemies:
+            self._spawn_enemy()
+            self.wave_spawned += 1
+
+        if self.wave_spawned == self.wave_size:
+            if not self.enemies or elapsed >= self.wave_ticks + self.pause_ticks:
+                self._start_wave()
+
+    def _spawn_enemy(self):
+        """
+        Spawn a random enemy type (by weight) with the extra lives of the wave. It falls into
+        the map at a random position.
+        """
+        enemy_data = random.choices(self.enemy_types, self.enemy_weights)[0]
+        enemy = self._add_enemy(enemy_data)
+        self.enemies.append(enemy)
+        self.entities.append(enemy)
+        self.snapshot.add_entity(enemy)
+
+    def _check_level_end(self):
+        """
+        The survival only ends when the player dies.
+        """
+        if self.level_result:
+            self._check_switch_to_menu()
+        elif len(self.player_group) == 0:
+            self._finish_level(player_won=False)
+
+    def _finish_level(self, player_won: bool):
+        """
+        Store the result, nothing is unlocked by the survival.
+        """
+        self.level_result = LevelResult(player_won, pygame.time.get_ticks())
+        print(f"[Survival] Finished in wave {self.wave} with {self.kills} kills", file=sys.stderr)
+
+    def _log_stats(self):
+        bullets = len(self.player_bullets) + len(self.enemy_bullets)
+        frame = ""
+        if self.pacer:
+            frame_time, busy_time = self.pacer.frame_times()
+            frame = f" frame={1000 * frame_time:.2f} ms busy={1000 * busy_time:.2f} ms"
+        print(f"[Survival] wave={self.wave} entities={len(self.entities)} bullets={bullets}{frame}", file=sys.stderr)
+        self._log_ticks = 0
+
+    def _draw_ui(self):
+        """
+        Draw the player panel and the wave information. The text is only rendered again when the
+        values change.
+        """
+        super()._draw_ui()
+        values = (self.wave, self.kills, len(self.enemies))
+        if values != self._hud_values:
+            self._hud_values = values
+            text = f"Wave: {self.wave}   Kills: {self.kills}   Enemies: {len(self.enemies)}"
+            self._hud = SMALL_FONT.render(text, True, colors.WHITE)
+        self.render_batch.layers[self.UI_LAYER].blit(self._hud, (self.spacing, self.spacing))
+
+    def _get_level_finish_text_and_color(self):
+        return f"SURVIVED {self.wave - 1} WAVES", colors.RED
@@ -0,0 +1,71 @@
+import time
+from typing import Dict
+
+from asyncio import StreamWriter
+
+from src.model.input_state import InputState
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.entities.player_bot import PlayerBot
+from src.server.state_delta import StateDelta
+
+
+class Match:
+    """
+    One headless level simulation hosted by the match server. The player is controlled either
+    by the built-in bot (bot-vs-bot match) or by the input sent by a remote client. Each match
+    has its own tick deadline and keeps track of how long its ticks take, so the server can
+    schedule matches fairly and estimate how many of them fit on one core.
+
+    The subscribers (client writers) are mapped to whether they received every message since
+    their last keyframe, clients that did not get a keyframe first (see StateDelta).
+    """
+    COST_SMOOTHING = 0.05
+
+    def __init__(self, match_id: int, scene: HeadlessLevelScene, tick_rate: int, bot: bool,
+                 restart_on_finish: bool = False):
+        self.match_id = match_id
+        self.scene = scene
+        self.tick_interval = 1 / tick_rate
+        self.bot = bot
+        self.restart_on_finish = restart_on_finish
+        self.input_state = InputState()
+        self.subscribers: Dict[StreamWriter, bool] = {}
+        self.delta = StateDelta()
+
+        self.next_deadline = 0.0
+        self.tick_cost = 0.0
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.restart()
+
+    def restart(self) -> None:
+        """
+        Start the level from scratch and let the next message carry the full entity state.
+        """
+        self.scene.initialize()
+        self.scene.player.input_source = PlayerBot(self.scene) if self.bot else self.input_state
+        self.delta.reset()
+
+    @property
+    def finished(self) -> bool:
+        return self.scene.finished
+
+    def step(self) -> bytes:
+        """
+        Simulate one tick and return the encoded state delta. The smoothed cost of a tick
+        (simulation and encoding) is updated.
+        """
+        start = time.perf_counter()
+        self.scene.update()
+        payload = self.delta.encode(self.scene)
+        cost = time.perf_counter() - start
+
+        self.tick_cost += (cost - self.tick_cost) * (1.0 if self.ticks == 0 else self.COST_SMOOTHING)
+        self.ticks += 1
+        return payload
+
+    def keyframe(self) -> bytes:
+        """
+        Encode all entities of the last simulated tick, for clients that are not in sync.
+        """
+        return self.delta.keyframe(self.scene)
@@ -0,0 +1,70 @@
+import asyncio
+import random
+import struct
+from typing import Dict, Optional
+
+from src.model.input_state import InputState
+from src.server.state_delta import StateDelta
+
+
+class LocalMatchClient:
+    """
+    Stand-in for a remote player. It connects to the match server, sends random (but persistent
+    for a while) inputs at the tick rate and decodes the received state deltas into the latest
+    known state of all entities. A keyframe replaces the known state.
+    """
+    _HANDSHAKE = struct.Struct("<H")
+    _FRAME = struct.Struct("<I")
+
+    def __init__(self, match_id: int, tick_rate: int = 60):
+        self.match_id = match_id
+        self.tick_interval = 1 / tick_rate
+        self.entities: Dict[int, tuple] = {}
+        self.last_state: Optional[Dict] = None
+        self.messages = 0
+        self.received_bytes = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect_tcp(self, host: str, port: int) -> None:
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._writer.write(self._HANDSHAKE.pack(self.match_id))
+
+    async def connect_unix(self, path: str) -> None:
+        self._reader, self._writer = await asyncio.open_unix_connection(path)
+        self._writer.write(self._HANDSHAKE.pack(self.match_id))
+
+    async def run(self, duration: float) -> None:
+        sender = asyncio.create_task(self._send_inputs())
+        try:
+            await asyncio.wait_for(self._receive(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            sender.cancel()
+            self._writer.close()
+
+    async def _send_inputs(self) -> None:
+        mask = 0
+        while True:
+            if random.random() < 0.1:
+                mask = random.choice([0, InputState.LEFT, InputState.RIGHT]) \
+                       | random.choice([0, 0, InputState.UP, InputState.DOWN]) \
+                       | random.choice([0, InputState.SHOOT])
+                self._writer.write(bytes((mask,)))
+            await asyncio.sleep(self.tick_interval)
+
+    async def _receive(self) -> None:
+        while True:
+            try:
+                (size,) = self._FRAME.unpack(await self._reader.readexactly(self._FRAME.size))
+                payload = await self._reader.readexactly(size)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+
+            self.messages += 1
+            self.received_bytes += self._FRAME.size + size
+            self.last_state = StateDelta.decode(payload)
+            if self.last_state["keyframe"]:
+                self.entities.clear()
+            self.entities.update(self.last_state["entities"])
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import heapq
+import itertools
+import struct
+import sys
+import time
+from typing import Dict, List, Optional
+
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.model.level_definition import LevelDefinition, LevelEntry
+from src.model.server_stats import ServerStats
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.server.match import Match
+
+
+class MatchServer:
+    """
+    Host many headless matches on one asyncio event loop.
+
+    Each match has its own tick deadline. The scheduler always runs a single tick of the match
+    with the earliest deadline and then yields to the event loop, so client I/O is handled between
+    ticks and a heavy match can never run several ticks in a row while others wait. A match that
+    falls more than MAX_LAG_TICKS behind drops the missed ticks instead of trying to catch up,
+    which would otherwise steal time from the other matches.
+
+    Protocol: a client sends the match id (uint16) after connecting and then one byte with the
+    InputState mask whenever its input changes. The server sends each state delta prefixed by
+    its length (uint32).
+    """
+    MAX_LAG_TICKS = 3
+    MAX_BUFFERED_BYTES = 64 * 1024
+
+    _HANDSHAKE = struct.Struct("<H")
+    _FRAME = struct.Struct("<I")
+
+    def __init__(self, tick_rate: int = 60, resolution=HeadlessLevelScene.DEFAULT_RESOLUTION):
+        self.tick_rate = tick_rate
+        self.resolution = resolution
+        self.matches: Dict[int, Match] = {}
+        self._game_manager = GameManager(audio_enabled=False)
+        self._level_manager = LevelManager()
+        self._schedule: List = []
+        self._ids = itertools.count()
+        self._servers: List[asyncio.AbstractServer] = []
+        self._stopping = False
+
+    @property
+    def levels(self) -> List[LevelEntry]:
+        return self._level_manager.levels
+
+    def load_level(self, entry: LevelEntry) -> LevelDefinition:
+        return self._level_manager.load_level(entry)
+
+    def create_match(self, level: LevelDefinition, bot: bool = True, restart_on_finish: bool = False) -> Match:
+        """
+        Create a match of the given level and schedule its first tick.
+        """
+        match_id = next(self._ids)
+        scene = HeadlessLevelScene(level, self._game_manager, self._level_manager, self.resolution, self.tick_rate)
+        match = Match(match_id, scene, self.tick_rate, bot, restart_on_finish)
+        match.next_deadline = time.perf_counter()
+        self.matches[match_id] = match
+        heapq.heappush(self._schedule, (match.next_deadline, match_id))
+        return match
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Listen for clients on a local TCP socket and return the port.
+        """
+        server = await asyncio.start_server(self._handle_client, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def start_unix(self, path: str) -> None:
+        server = await asyncio.start_unix_server(self._handle_client, path)
+        self._servers.append(server)
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """
+        Run the scheduling loop until stopped, until the duration elapses or until all matches finish.
+        """
+        stop_at = None if duration is None else time.perf_counter() + duration
+        while not self._stopping and self._schedule:
+            now = time.perf_counter()
+            if stop_at is not None and now >= stop_at:
+                break
+
+            deadline, match_id = self._schedule[0]
+            if deadline > now:
+                await asyncio.sleep(deadline - now)
+                continue
+
+            heapq.heappop(self._schedule)
+            match = self.matches.get(match_id)
+            if match is not None and self._run_tick(match, now):
+                heapq.heappush(self._schedule, (match.next_deadline, match_id))
+            await asyncio.sleep(0)
+
+        await self._close()
+
+    def stats(self) -> ServerStats:
+        matches = list(self.matches.values())
+        if not matches:
+            return ServerStats(0, 0.0, 0.0, 0, 0)
+
+        mean_cost = sum(match.tick_cost for match in matches) / len(matches)
+        load = mean_cost * len(matches) * self.tick_rate
+        capacity = int(1 / (mean_cost * self.tick_rate)) if mean_cost > 0 else 0
+        dropped = sum(match.dropped_ticks for match in matches)
+        return ServerStats(len(matches), mean_cost, load, capacity, dropped)
+
+    def _run_tick(self, match: Match, now: float) -> bool:
+        """
+        Run one tick of the match and send the state delta to its clients. Return False when
+        the match is finished and removed.
+        """
+        lag = now - match.next_deadline
+        if lag > self.MAX_LAG_TICKS * match.tick_interval:
+            match.dropped_ticks += int(lag / match.tick_interval)
+            match.next_deadline = now
+
+        self._broadcast(match, match.step())
+        match.next_deadline += match.tick_interval
+
+        if not match.finished:
+            return True
+        if match.restart_on_finish:
+            match.restart()
+            return True
+
+        self._remove_match(match)
+        return False
+
+    def _broadcast(self, match: Match, payload: bytes) -> None:
+        """
+        Send the payload to all match clients. Clients that do not read fast enough skip frames
+        instead of making the server buffer an unbounded amount of data. The deltas only apply on
+        top of the previous frame, so a client that skipped a frame or just joined gets a keyframe
+        with all entities first (encoded once per tick, when some client needs it).
+        """
+        frame = self._FRAME.pack(len(payload)) + payload
+        keyframe = None
+        for writer, in_sync in list(match.subscribers.items()):
+            if writer.is_closing():
+                del match.subscribers[writer]
+            elif writer.transport.get_write_buffer_size() >= self.MAX_BUFFERED_BYTES:
+                match.subscribers[writer] = False
+            elif in_sync:
+                writer.write(frame)
+            else:
+                if keyframe is None:
+                    keyframe_payload = match.keyframe()
+                    keyframe = self._FRAME.pack(len(keyframe_payload)) + keyframe_payload
+                writer.write(keyframe)
+                match.subscribers[writer] = True
+
+    def _remove_match(self, match: Match) -> None:
+        del self.matches[match.match_id]
+        for writer in match.subscribers:
+            writer.close()
+        match.subscribers.clear()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Attach the client to the requested match and apply its input until it disconnects. Only
+        the latest received input byte matters, older ones are overwritten.
+        """
+        try:
+            (match_id,) = self._HANDSHAKE.unpack(await reader.readexactly(self._HANDSHAKE.size))
+            match = self.matches.get(match_id)
+            if match is None:
+                return
+
+            match.subscribers[writer] = False
+            while data := await reader.read(64):
+                match.input_state.mask = data[-1]
+            match.subscribers.pop(writer, None)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for match in self.matches.values():
+            for writer in match.subscribers:
+                writer.close()
+            match.subscribers.clear()
+
+
+async def _report(server: MatchServer, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        stats = server.stats()
+        print(f"[Server] matches={stats.matches} tick={stats.mean_tick_cost * 1e6:.0f}us "
+              f"load={stats.load:.0%} capacity/core={stats.capacity} dropped={stats.dropped_ticks}",
+              file=sys.stderr)
+
+
+async def _serve(args) -> None:
+    from src.server.match_client import LocalMatchClient
+
+    server = MatchServer(args.tick_rate)
+    port = await server.start_tcp(args.host, args.port)
+    if args.unix:
+        await server.start_unix(args.unix)
+
+    levels = server.levels
+    clients = []
+    for index in range(args.matches):
+        remote = index < args.remote
+        level = server.load_level(levels[index % len(levels)])
+        match = server.create_match(level, bot=not remote, restart_on_finish=True)
+        if remote:
+            client = LocalMatchClient(match.match_id, args.tick_rate)
+            await client.connect_tcp(args.host, port)
+            clients.append(asyncio.create_task(client.run(args.duration)))
+
+    reporter = asyncio.create_task(_report(server, 1.0))
+    await server.run(args.duration)
+    reporter.cancel()
+    await asyncio.gather(*clients, return_exceptions=True)
+
+    stats = server.stats()
+    print(f"[Server] finished: {stats.matches} matches, mean tick {stats.mean_tick_cost * 1e6:.0f}us, "
+          f"load {stats.load:.0%}, estimated capacity {stats.capacity} matches per core", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Gun Mayhem matches on one event loop.")
+    parser.add_argument("--matches", type=int, default=8, help="number of hosted matches")
+    parser.add_argument("--remote", type=int, default=1, help="matches controlled by a local client stand-in")
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--unix", help="also listen on this Unix socket path")
+    args = parser.parse_args()
+
+    HeadlessLevelScene.init_display()
+    asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import struct
+from typing import Dict
+
+
+class StateDelta:
+    """
+    Encode the level state sent to match clients. Each message contains only entities whose
+    visible state changed since the previous message and the positions of all bullets (bullets
+    move in every frame, so sending a delta for them would not save anything). The baseline of the
+    deltas is shared by all clients of a match, a client that joins later or skips a message gets
+    a keyframe with all entities instead (see keyframe), the following deltas apply on top of it.
+
+    Message layout (little endian):
+    - header: tick (uint32), flags (uint8), entity count (uint32), bullet count (uint32)
+    - entity: index (uint32), x (int32), y (int32), lives (uint16, clamped), flags (uint8), state (uint8)
+    - bullet: x (int32), y (int32), group (uint8; 0 = player bullet, 1 = enemy bullet)
+    """
+    _HEADER = struct.Struct("<IBII")
+    _ENTITY = struct.Struct("<IiiHBB")
+    _BULLET = struct.Struct("<iiB")
+    _MAX_LIVES = 0xFFFF
+
+    FINISHED = 1
+    PLAYER_WON = 2
+    KEYFRAME = 4
+
+    FACING_RIGHT = 1
+    SHOOTING = 2
+    ON_GROUND = 4
+    ALIVE = 8
+
+    def __init__(self):
+        self._previous = {}
+
+    def reset(self) -> None:
+        """
+        Forget the previously sent state, the next message will contain all entities.
+        """
+        self._previous.clear()
+
+    def encode(self, level_scene) -> bytes:
+        """
+        Encode the entities changed since the previous call and move the baseline to this tick.
+        """
+        changed = []
+        for index, entity in enumerate(level_scene.entities):
+            record = self._entity_record(index, entity)
+            if self._previous.get(index) != record:
+                self._previous[index] = record
+                changed.append(record)
+        return self._pack(level_scene, changed, self._result_flags(level_scene))
+
+    def keyframe(self, level_scene) -> bytes:
+        """
+        Encode all entities of the baseline, i.e. the state of the tick passed to the last encode().
+        """
+        return self._pack(level_scene, self._previous.values(), self._result_flags(level_scene) | self.KEYFRAME)
+
+    def _pack(self, level_scene, records, flags) -> bytes:
+        bullets = [(bullet.rect.x, bullet.rect.y, group_index)
+                   for group_index, group in enumerate((level_scene.player_bullets, level_scene.enemy_bullets))
+                   for bullet in group]
+
+        parts = [self._HEADER.pack(level_scene.tick, flags, len(records), len(bullets))]
+        parts.extend(self._ENTITY.pack(*record) for record in records)
+        parts.extend(self._BULLET.pack(*bullet) for bullet in bullets)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, payload: bytes) -> Dict:
+        tick, flags, entity_count, bullet_count = cls._HEADER.unpack_from(payload, 0)
+        offset = cls._HEADER.size
+        entities = {}
+        for _ in range(entity_count):
+            index, *record = cls._ENTITY.unpack_from(payload, offset)
+            entities[index] = tuple(record)
+            offset += cls._ENTITY.size
+
+        bullets = list(cls._BULLET.iter_unpack(payload[offset:offset + bullet_count * cls._BULLET.size]))
+        return {
+            "tick": tick,
+            "finished": bool(flags & cls.FINISHED),
+            "player_won": bool(flags & cls.PLAYER_WON),
+            "keyframe": bool(flags & cls.KEYFRAME),
+            "entities": entities,
+            "bullets": bullets,
+        }
+
+    @classmethod
+    def _entity_record(cls, index, entity):
+        flags = (cls.FACING_RIGHT * entity.facing_right | cls.SHOOTING * entity.shooting
+                 | cls.ON_GROUND * entity.on_ground | cls.ALIVE * entity.alive())
+        lives = min(max(entity.lives, 0), cls._MAX_LIVES)
+        return index, entity.rect.x, entity.rect.y, lives, flags, entity.state.value
+
+    @classmethod
+    def _result_flags(cls, level_scene):
+        if level_scene.level_result is None:
+            return 0
+        return cls.FINISHED | (cls.PLAYER_WON if level_scene.level_result.player_won else 0)
@@ -9,14 +9,14 @@ from src.constants import colors
 
 class EntityPanel:
     """
-    A UI panel displaying an entity's image, name, and dynamic lives count.
+    A UI panel displaying an entity's image, name, and dynamic lives count. The position is given
+    when drawing, so the level can lay out its panels without rebuilding them.
     """
-    def __init__(self, size: Tuple[int, int], position: Tuple[int, int], spacing: int,
-                 entity_name: str, entity_image: pygame.Surface):
+    def __init__(self, size: Tuple[int, int], spacing: int, entity_name: str, entity_image: pygame.Surface):
         self.width, self.height = size
-        self.x, self.y = position
         self.spacing = spacing
         self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.lives = None
         self._create_image(entity_image)
         self._create_panel_text(entity_name)
 
@@ -49,15 +49,26 @@ class EntityPanel:
         self.text_y = (self.height - self.name_text.get_height() - dummy_lives_text.get_height() - self.spacing) // 2
 
 
-    def draw(self, surface, lives):
+    def draw(self, surface, lives, position: Tuple[int, int]):
         """
         Draw the panel. Needs to be called in each frame, because when entity dies, it is respawned
         at the top of screen and can redraw the panel.
         """
-        self._draw_background()
-        self._draw_panel_image()
-        self._draw_panel_text(lives)
-        surface.blit(self.surface, (self.x, self.y))
+        surface.blit(self.get_image(lives), position)
+
+    def get_image(self, lives) -> pygame.Surface:
+        """
+        Return the panel image for the lives count. The panel is only rendered again when the count
+        changes, into a new surface, so images handed out before (for example in a frame waiting
+        for the render thread) never change.
+        """
+        if lives != self.lives:
+            self.lives = lives
+            self.surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._draw_background()
+            self._draw_panel_image()
+            self._draw_panel_text(lives)
+        return self.surface
 
     def _draw_background(self):
         """
@@ -0,0 +1,178 @@
+import argparse
+import fnmatch
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from src.constants.paths import ASSET_PACK, ASSET_PATH
+
+
+class AssetPack:
+    """
+    All game assets in one file, read through a memory map. The file starts with a header (magic,
+    version and index size) followed by a JSON index of name -> (offset, length, format, width,
+    height) and the data. Names are the paths the game uses (for example assets/images/...), with
+    forward slashes.
+
+    Images are stored decoded, in the BGRA layout convert_alpha() produces for 32-bit displays, so
+    loading one is a pygame.image.frombuffer over the mapped file: no file is opened, nothing is
+    decoded and no pixels are copied. Other files (maps, music, JSON) are stored as they are.
+
+    The pack is optional. When it is not built (or an asset is missing in it) the loaders fall back to
+    the loose files, which is what development uses.
+    """
+    MAGIC = b"GMPK"
+    VERSION = 1
+    ALIGNMENT = 16
+    _HEADER = struct.Struct("<4sII")
+    IMAGE, BYTES = "BGRA", "bytes"
+    PACKED = ("images/**/*.png", "mips/**/*.bmp", "levels/*.json", "maps/*.tmx", "sounds/*", "weapons/*.json")
+    IMAGE_EXTENSIONS = (".png", ".bmp")
+
+    active: Optional["AssetPack"] = None
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            # A private (copy-on-write) mapping gives writable buffers, which frombuffer needs, without
+            # ever writing to the file.
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        magic, version, index_size = self._HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{path} is not an asset pack of version {self.VERSION}.")
+        index_start = self._HEADER.size
+        self.index: Dict[str, Tuple[int, int, str, int, int]] = {
+            name: tuple(entry) for name, entry in json.loads(self._map[index_start:index_start + index_size]).items()
+        }
+        self._view = memoryview(self._map)
+
+    @classmethod
+    def activate(cls, path: str = ASSET_PACK) -> bool:
+        """
+        Use the pack for loading assets if it exists. Returns whether the pack is used.
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            cls.active = cls(path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"[Asset Pack] Using loose files, pack could not be opened: {e}", file=sys.stderr)
+            return False
+
+    @staticmethod
+    def key(path: str) -> str:
+        return os.path.normpath(path).replace(os.sep, "/")
+
+    @classmethod
+    def lookup(cls, path: str, newer_loose: bool = False) -> Optional["AssetPack"]:
+        """
+        Return the active pack if it contains the file, otherwise None (load the loose file). With
+        newer_loose a loose file modified after the pack was built is used instead of the packed copy,
+        for files that are edited while the pack is in use (levels).
+        """
+        pack = cls.active
+        if pack is None or cls.key(path) not in pack.index:
+            return None
+        return None if newer_loose and cls.newer(path, pack) else pack
+
+    @staticmethod
+    def newer(path: str, pack: "AssetPack") -> bool:
+        """
+        Whether the loose file exists and was modified after the pack was built.
+        """
+        try:
+            return os.stat(path).st_mtime_ns > pack.mtime_ns
+        except OSError:
+            return False
+
+    @classmethod
+    def find(cls, folder: str, pattern: str) -> List[str]:
+        """
+        Sorted paths of the files in the folder matching the pattern, from the pack or from the disk.
+        """
+        if cls.active is not None:
+            prefix = cls.key(folder) + "/"
+            names = sorted(
+                name for name in cls.active.index
+                if name.startswith(prefix) and "/" not in name[len(prefix):]
+                and fnmatch.fnmatch(name[len(prefix):], pattern)
+            )
+            if names:
+                return names
+        return sorted(glob.glob(os.path.join(folder, pattern)))
+
+    def image(self, path: str) -> pygame.Surface:
+        offset, length, fmt, width, height = self.index[self.key(path)]
+        return pygame.image.frombuffer(self._view[offset:offset + length], (width, height), fmt)
+
+    def data(self, path: str) -> memoryview:
+        offset, length, *_ = self.index[self.key(path)]
+        return self._view[offset:offset + length]
+
+    @classmethod
+    def build(cls, out: str = ASSET_PACK, root: str = ASSET_PATH) -> int:
+        """
+        Pack the assets of the root folder into the out file. Returns the number of packed files.
+        """
+        paths = sorted({
+            path for pattern in cls.PACKED for path in glob.glob(os.path.join(root, pattern), recursive=True)
+            if os.path.isfile(path) and os.path.abspath(path) != os.path.abspath(out)
+        })
+        index, blobs = {}, []
+        offset = 0
+        for path in paths:
+            if path.endswith(cls.IMAGE_EXTENSIONS):
+                image = pygame.image.load(path)
+                data, fmt, size = pygame.image.tobytes(image, cls.IMAGE), cls.IMAGE, image.get_size()
+            else:
+                with open(path, "rb") as f:
+                    data, fmt, size = f.read(), cls.BYTES, (0, 0)
+            padding = -offset % cls.ALIGNMENT
+            blobs.append(bytes(padding))
+            blobs.append(data)
+            offset += padding
+            index[cls.key(path)] = (offset, len(data), fmt, *size)
+            offset += len(data)
+
+        # Offsets are relative to the data, they are moved behind the index once its size is known.
+        index_json = json.dumps(index).encode()
+        data_start = cls._HEADER.size + len(index_json)
+        data_start += -data_start % cls.ALIGNMENT
+        while True:
+            index_json = json.dumps({
+                name: (data_start + offset, length, fmt, width, height)
+                for name, (offset, length, fmt, width, height) in index.items()
+            }).encode()
+            start = cls._HEADER.size + len(index_json)
+            if start <= data_start:
+                break
+            data_start = start + -start % cls.ALIGNMENT
+
+        with open(out, "wb") as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, len(index_json)))
+            f.write(index_json)
+            f.write(bytes(data_start - cls._HEADER.size - len(index_json)))
+            for blob in blobs:
+                f.write(blob)
+        return len(index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the game assets into one file.")
+    parser.add_argument("--out", default=ASSET_PACK)
+    parser.add_argument("--root", default=ASSET_PATH)
+    args = parser.parse_args()
+    count = AssetPack.build(args.out, args.root)
+    print(f"Packed {count} files into {args.out} ({os.path.getsize(args.out) / 2 ** 20:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
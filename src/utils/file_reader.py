@@ -1,11 +1,16 @@
 import json
 from typing import Any
 
+from src.utils.asset_pack import AssetPack
+
 
 class FileReader:
-    """Utility class for reading files. Supports JSON."""
+    """Utility class for reading files. Supports JSON (from the asset pack if it contains the file)."""
 
     @staticmethod
-    def read_json(path: str) -> Any:
+    def read_json(path: str, newer_loose: bool = False) -> Any:
+        pack = AssetPack.lookup(path, newer_loose)
+        if pack:
+            return json.loads(bytes(pack.data(path)))
         with open(path, 'r') as f:
             return json.load(f)
@@ -1,4 +1,6 @@
 import json
+import os
+import tempfile
 from typing import Any
 
 class FileWriter:
@@ -8,3 +10,32 @@ class FileWriter:
     def write_json(path: str, data: Any) -> None:
         with open(path, 'w') as f:
             json.dump(data, f, indent=4)
+
+    @staticmethod
+    def write_json_atomic(path: str, data: Any) -> None:
+        """
+        Write the JSON to a temporary file next to the target, flush it to the disk and replace the
+        target with it. Readers (and a crash at any point) see either the old or the new file,
+        never a partially written one.
+        """
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if hasattr(os, 'O_DIRECTORY'):
+            # Make the rename itself durable (POSIX only, directories cannot be opened on Windows).
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
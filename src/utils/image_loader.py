@@ -1,18 +1,20 @@
-import glob
 import os
 import pygame
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from src.utils.asset_pack import AssetPack
 
 
 class ImageLoader:
     """
     Class for loading images. Supports loading single images from a path and
-    loading all images from a folder.
+    loading all images from a folder. Images are taken from the asset pack when it
+    is active, otherwise from the loose files.
     """
 
     _image_cache: Dict[str, pygame.Surface] = {}
     _folder_cache: Dict[str, List[pygame.Surface]] = {}
+    _paths: Dict[int, str] = {}
 
     @classmethod
     def load_image(cls, path: str) -> pygame.Surface:
@@ -20,17 +22,28 @@ class ImageLoader:
         if path in cls._image_cache:
             return cls._image_cache[path]
 
-        image = pygame.image.load(path).convert_alpha()
+        pack = AssetPack.lookup(path)
+        image = pack.image(path) if pack else pygame.image.load(path).convert_alpha()
         cls._image_cache[path] = image
+        cls._paths[id(image)] = path
         return image
 
+    @classmethod
+    def path_of(cls, image: pygame.Surface) -> Optional[str]:
+        """Path of an image loaded by this class, None for other surfaces."""
+        return cls._paths.get(id(image))
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return AssetPack.lookup(path) is not None or os.path.exists(path)
+
     @classmethod
     def load_images(cls, folder: str) -> List[pygame.Surface]:
         """Load all PNG images from a folder and cache them as a list."""
         if folder in cls._folder_cache:
             return cls._folder_cache[folder]
 
-        files = sorted(glob.glob(os.path.join(folder, "*.png")))
+        files = AssetPack.find(folder, "*.png")
         images = [cls.load_image(file) for file in files]
         cls._folder_cache[folder] = images
         return images
@@ -0,0 +1,20 @@
+import weakref
+
+import pygame
+
+
+class ImageMasker:
+    """
+    Create collision masks of images and cache them. Masks are keyed by the image object, so they
+    are shared the same way as the scaled and flipped images they belong to. The cache only holds
+    weak references to the images: the mask is dropped together with its image (for example a
+    surface dropped by ImageScaler.forget), so a later image can never get the mask of a freed one.
+    """
+    _cache: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_mask(cls, image: pygame.Surface) -> pygame.mask.Mask:
+        mask = cls._cache.get(image)
+        if mask is None:
+            mask = cls._cache[image] = pygame.mask.from_surface(image)
+        return mask
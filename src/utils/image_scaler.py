@@ -1,20 +1,82 @@
-from typing import Dict, Tuple
+from typing import Dict, Set, Tuple
+
+import sys
 
 import pygame
 
+from src.utils.asset_pack import AssetPack
+from src.utils.image_loader import ImageLoader
+from src.utils.mip_builder import MipBuilder
+
 class ImageScaler:
     """
-    Scale an image to a given width and height.
+    Scale an image to a given width and height, optionally flipped horizontally. For images loaded
+    by ImageLoader the smallest pre-built mip (see MipBuilder) that is at least as large as the
+    requested size is scaled, so only a small final scale is left. Without mips, or when loose mips
+    are older than the image, the image itself is scaled (and flipped).
     """
 
-    _cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+    _cache: Dict[Tuple[int, int, int, bool], pygame.Surface] = {}
+    _stale_mips: Set[str] = set()
 
     @classmethod
-    def scale_image(cls, image: pygame.Surface, width: int, height: int) -> pygame.Surface:
-        key = (id(image), width, height)
+    def scale_image(cls, image: pygame.Surface, width: int, height: int, flip_x: bool = False) -> pygame.Surface:
+        key = (id(image), width, height, flip_x)
         if key in cls._cache:
             return cls._cache[key]
 
-        scaled_image = pygame.transform.smoothscale(image, (width, height))
+        source, flipped = cls._select_mip(image, width, height, flip_x)
+        scaled_image = pygame.transform.smoothscale(source, (width, height))
+        if flip_x and not flipped:
+            scaled_image = pygame.transform.flip(scaled_image, True, False)
         cls._cache[key] = scaled_image
         return scaled_image
+
+    @classmethod
+    def forget(cls, image: pygame.Surface) -> None:
+        """
+        Drop the scaled copies of an image that is not used any more. Needed for temporary images,
+        the cache is keyed by id() and would otherwise keep the copies (and hand them out for
+        a later image that gets the same id).
+        """
+        key = id(image)
+        for cached in [cached for cached in cls._cache if cached[0] == key]:
+            del cls._cache[cached]
+
+    @classmethod
+    def _select_mip(cls, image: pygame.Surface, width: int, height: int, flip_x: bool) -> Tuple[pygame.Surface, bool]:
+        """
+        Return the image to scale from and whether it is already flipped.
+        """
+        path = ImageLoader.path_of(image)
+        if path is None:
+            return image, False
+
+        size = image.get_size()
+        level = 0
+        while level < MipBuilder.levels(size):
+            mip_width, mip_height = MipBuilder.level_size(size, level + 1)
+            if mip_width < width or mip_height < height:
+                break
+            level += 1
+        if level == 0 and not flip_x:
+            return image, False
+
+        mip_path = MipBuilder.mip_path(path, level, flip_x)
+        if not ImageLoader.exists(mip_path) or not cls._mips_fresh(path, mip_path):
+            return image, False
+        return ImageLoader.load_image(mip_path), flip_x
+
+    @classmethod
+    def _mips_fresh(cls, path: str, mip_path: str) -> bool:
+        """
+        Packed mips are built together with the pack. Loose mips are only used if they are not
+        older than the image, a stale build is reported once per image.
+        """
+        if AssetPack.lookup(mip_path) or MipBuilder.up_to_date(path):
+            return True
+        if path not in cls._stale_mips:
+            cls._stale_mips.add(path)
+            print(f"[Image Scaler] Mips of {path} are older than the image and not used, rebuild them with "
+                  f"python -m src.utils.mip_builder", file=sys.stderr)
+        return False
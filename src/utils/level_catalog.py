@@ -0,0 +1,111 @@
+import fnmatch
+import os
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.constants.paths import LEVEL_INDEX, LEVEL_PATH
+from src.model.level_definition import LevelEntry
+from src.utils.asset_pack import AssetPack
+from src.utils.file_reader import FileReader
+from src.utils.file_writer import FileWriter
+from src.utils.level_compiler import LevelCompiler
+
+
+class LevelCatalog:
+    """
+    The levels of a folder as a list of entries (id, name, unlocked, path) for the menu, sorted by id.
+    Level files are named by their number (01.json, 002.json, 1234.json, ...), any count of digits.
+
+    The entries are kept in an index file next to the save file. Each record stores a signature of
+    the level file (modification time and size, or the position of the file in the asset pack), only
+    files whose signature changed are read and compiled again, so with an up-to-date index the
+    catalog is built from one stat per file without parsing any level. Invalid files are left out
+    of the catalog. They are recorded in the index with their error too, so they are only compiled
+    (and reported) again when they change.
+    """
+    PATTERN = "[0-9]*.json"
+    VERSION = 1
+    _NAME = re.compile(fnmatch.translate(PATTERN))
+
+    def __init__(self, folder: str = LEVEL_PATH, index_path: str = LEVEL_INDEX):
+        self.folder = folder
+        self.index_path = index_path
+        self.entries: List[LevelEntry] = []
+        self.parsed = 0
+        self._build()
+
+    def _build(self) -> None:
+        cached = self._read_index()
+        records: Dict[str, Dict[str, Any]] = {}
+        for path, signature in self._scan():
+            record = cached.get(path)
+            if record is None or record.get("signature") != signature:
+                record = self._index_file(path, signature)
+                self.parsed += 1
+            records[path] = record
+
+        self.entries = sorted(
+            (LevelEntry(record["id"], record["name"], record["unlocked"], path)
+             for path, record in records.items() if "error" not in record),
+            key=lambda entry: (entry.id, entry.path)
+        )
+        if self.parsed or records.keys() != cached.keys():
+            self._write_index(records)
+
+    def _scan(self) -> Iterator[Tuple[str, List[int]]]:
+        """
+        Yield the level files with their signatures: the levels of the asset pack merged with the loose
+        files of the folder. A loose file is listed over its packed copy when it was modified after the
+        pack was built (as LevelCompiler reads it), so levels added or edited since then show up.
+        Loose files are listed with scandir, which gives their stat without another path lookup.
+        """
+        files: Dict[str, Tuple[str, List[int]]] = {}
+        pack = AssetPack.active
+        if pack:
+            for path in AssetPack.find(self.folder, self.PATTERN):
+                packed = pack.index.get(AssetPack.key(path))
+                if packed:
+                    files[AssetPack.key(path)] = path, [pack.mtime_ns, packed[0], packed[1]]
+
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if self._NAME.match(entry.name) and entry.is_file():
+                        stat = entry.stat()
+                        key = AssetPack.key(entry.path)
+                        if key not in files or stat.st_mtime_ns > pack.mtime_ns:
+                            files[key] = entry.path, [stat.st_mtime_ns, stat.st_size]
+        except FileNotFoundError:
+            pass
+        yield from files.values()
+
+    @staticmethod
+    def _index_file(path: str, signature: List[int]) -> Dict[str, Any]:
+        try:
+            level = LevelCompiler.load_level(path)
+        except (OSError, ValueError) as e:
+            print(f"[Level Catalog] Skipping invalid level: {e}", file=sys.stderr)
+            return {"signature": signature, "error": str(e)}
+        return {"signature": signature, "id": level.id, "name": level.name, "unlocked": level.unlocked}
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            index = FileReader.read_json(self.index_path)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[Level Catalog] Rebuilding the level index, {self.index_path} could not be read: {e}",
+                  file=sys.stderr)
+            return {}
+        if not isinstance(index, dict) or index.get("version") != self.VERSION or index.get("folder") != self.folder:
+            return {}
+        return index.get("levels", {})
+
+    def _write_index(self, records: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            FileWriter.write_json_atomic(self.index_path, {
+                "version": self.VERSION, "folder": self.folder, "levels": records
+            })
+        except OSError as e:
+            print(f"[Level Catalog] Level index could not be saved to {self.index_path}: {e}", file=sys.stderr)
@@ -0,0 +1,134 @@
+from typing import Any, Dict, Tuple
+
+from src.entities.enemies.enemy_factory import EnemyFactory
+from src.model.level_definition import (
+    EnemyDefinition, EntityDefinition, LevelDefinition, SurvivalDefinition, WaveDefinition
+)
+from src.model.weapon_definition import WeaponDefinition
+from src.utils.file_reader import FileReader
+from src.weapons.weapon_factory import WeaponFactory
+
+
+class LevelCompiler:
+    """
+    Validate level files against the schema below and compile them into frozen definitions (see
+    level_definition). Weapon names are resolved to weapon definitions and enemy types to enemy
+    classes, so a typo in a level file fails when the level is loaded, with the file and the field
+    in the message, instead of deep inside the factories when the entity is created.
+
+    The schema maps each field to its type. Fields in OPTIONAL may be left out (they get the given
+    default), any field not in the schema is an error.
+    """
+    ENTITY = {"name": str, "lives": int, "weapon": str}
+    ENEMY = {**ENTITY, "type": str, "weight": float}
+    LEVEL = {"id": int, "name": str, "unlocked": bool, "map": str, "player": dict, "enemies": list}
+    SURVIVAL = {"name": str, "map": str, "player": dict, "waves": dict}
+    WAVES = {"first_size": int, "growth": float, "duration": float, "pause": float, "max_enemies": int,
+             "extra_life_every": int, "enemies": list}
+    OPTIONAL = {"type": "default", "weight": 1.0, "unlocked": False}
+    POSITIVE = ("lives", "weight", "first_size", "growth", "duration", "max_enemies", "extra_life_every")
+
+    @classmethod
+    def load_level(cls, path: str) -> LevelDefinition:
+        return cls.compile_level(cls._read(path), path)
+
+    @classmethod
+    def load_survival(cls, path: str) -> SurvivalDefinition:
+        return cls.compile_survival(cls._read(path), path)
+
+    @staticmethod
+    def _read(path: str) -> Any:
+        try:
+            # Levels are edited while the pack is in use, a loose file newer than the pack wins.
+            return FileReader.read_json(path, newer_loose=True)
+        except ValueError as e:
+            raise ValueError(f"{path}: invalid JSON: {e}") from None
+
+    @classmethod
+    def compile_level(cls, data: Any, source: str = "level") -> LevelDefinition:
+        fields = cls._check(data, cls.LEVEL, source)
+        return LevelDefinition(
+            id=fields["id"],
+            name=fields["name"],
+            unlocked=fields["unlocked"],
+            map=fields["map"],
+            player=cls._compile_entity(fields["player"], cls._join(source, "player")),
+            enemies=cls._compile_enemies(fields["enemies"], cls._join(source, "enemies")),
+        )
+
+    @classmethod
+    def compile_survival(cls, data: Any, source: str = "survival") -> SurvivalDefinition:
+        fields = cls._check(data, cls.SURVIVAL, source)
+        waves_path = cls._join(source, "waves")
+        waves = cls._check(fields["waves"], cls.WAVES, waves_path)
+        enemies = cls._compile_enemies(waves.pop("enemies"), cls._join(waves_path, "enemies"))
+        if not enemies:
+            raise ValueError(f"{cls._join(waves_path, 'enemies')}: at least one enemy type is required")
+        return SurvivalDefinition(
+            name=fields["name"],
+            map=fields["map"],
+            player=cls._compile_entity(fields["player"], cls._join(source, "player")),
+            waves=WaveDefinition(**waves, enemies=enemies),
+        )
+
+    @classmethod
+    def _compile_entity(cls, data: Any, path: str) -> EntityDefinition:
+        fields = cls._check(data, cls.ENTITY, path)
+        return EntityDefinition(fields["name"], fields["lives"], cls._resolve_weapon(fields["weapon"], path))
+
+    @classmethod
+    def _compile_enemies(cls, items: list, path: str) -> Tuple[EnemyDefinition, ...]:
+        enemies = []
+        for index, data in enumerate(items):
+            item_path = f"{path}[{index}]"
+            fields = cls._check(data, cls.ENEMY, item_path)
+            try:
+                enemy_class = EnemyFactory.get_enemy_class(fields["type"])
+            except ValueError as e:
+                raise ValueError(f"{cls._join(item_path, 'type')}: {e}") from None
+            weapon = cls._resolve_weapon(fields["weapon"], item_path)
+            enemies.append(EnemyDefinition(fields["name"], fields["lives"], weapon, fields["type"], enemy_class,
+                                           fields["weight"]))
+        return tuple(enemies)
+
+    @classmethod
+    def _resolve_weapon(cls, name: str, path: str) -> WeaponDefinition:
+        try:
+            return WeaponFactory.get_definition(name)
+        except ValueError as e:
+            raise ValueError(f"{cls._join(path, 'weapon')}: {e}") from None
+
+    @staticmethod
+    def _join(path: str, key: str) -> str:
+        """
+        Path of a field for error messages, e.g. "assets/levels/01.json: enemies[0].weapon".
+        """
+        return f"{path}.{key}" if ": " in path else f"{path}: {key}"
+
+    @classmethod
+    def _check(cls, data: Any, schema: Dict[str, type], path: str) -> Dict[str, Any]:
+        """
+        Check an object against the schema and return its fields with the defaults filled in.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected an object, got {type(data).__name__}")
+        unknown = data.keys() - schema.keys()
+        if unknown:
+            raise ValueError(f"{path}: unknown field(s) {', '.join(sorted(unknown))}")
+
+        fields = {}
+        for key, kind in schema.items():
+            if key not in data:
+                if key not in cls.OPTIONAL:
+                    raise ValueError(f"{path}: missing field '{key}'")
+                fields[key] = cls.OPTIONAL[key]
+                continue
+
+            value = data[key]
+            allowed = (int, float) if kind is float else kind
+            if isinstance(value, bool) and kind is not bool or not isinstance(value, allowed):
+                raise ValueError(f"{cls._join(path, key)}: expected {kind.__name__}, got {type(value).__name__}")
+            if key in cls.POSITIVE and value <= 0:
+                raise ValueError(f"{cls._join(path, key)}: must be positive, got {value}")
+            fields[key] = value
+        return fields
@@ -0,0 +1,207 @@
+import argparse
+import os
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from src.constants.map_layers import BACKGROUND_LAYER, ENVIRONMENT_LAYER, PLATFORM_LAYER
+from src.constants.paths import IMAGE_PATH
+from src.utils.file_writer import FileWriter
+
+
+class LevelGenerator:
+    """
+    Generate TMX maps and level JSON files for scaling tests. The maps use the same tilesets as
+    map_01.tmx: the background image is repeated over the whole map, platforms are placed on every
+    few rows and signs are scattered over the environment layers. All randomness comes from the
+    seed, so the same parameters always produce the same files.
+    """
+    TILE_SIZE = 128
+    BACKGROUND_COLUMNS, BACKGROUND_ROWS = 20, 15
+    ENVIRONMENT_GIDS = (301, 302)
+    PLATFORM_LEFT, PLATFORM_MIDDLE, PLATFORM_RIGHT = 401, 402, 403
+    BRICK_GIDS = (404, 405)
+    ENEMY_TYPES = ("default", "shrinker", "invisible")
+    WEAPONS = ("normal", "triple")
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def generate_map(self, cols: int = 20, rows: int = 15, platform_density: float = 0.5,
+                     layers: int = 3, row_spacing: int = 2, sign_density: float = 0.02,
+                     image_path: str = "../images") -> str:
+        """
+        Return the TMX document of a map with the given size in tiles. platform_density is the share
+        of columns covered by platforms on each platform row. layers is the total number of tile
+        layers (background, environment layers and platform layer, at least 3). Tile images are
+        referenced by image_path, relative to the map file (default fits maps in assets/maps).
+        """
+        platform_rows = range(rows - 2, 1, -row_spacing)
+        platforms = self._generate_platforms(cols, rows, platform_rows, platform_density)
+        environment_layers = [
+            self._generate_signs(cols, rows, platforms, sign_density) for _ in range(max(layers, 3) - 2)
+        ]
+
+        tile_layers = [(BACKGROUND_LAYER, self._generate_background(cols, rows))]
+        for index, signs in enumerate(environment_layers):
+            name = ENVIRONMENT_LAYER if index == 0 else f"{ENVIRONMENT_LAYER} {index + 1}"
+            tile_layers.append((name, signs))
+        tile_layers.append((PLATFORM_LAYER, platforms))
+        return self._to_tmx(cols, rows, tile_layers, image_path)
+
+    def generate_level(self, map_name: str, level_id: int = 0, enemies: int = 1,
+                       enemy_types: Sequence[str] = ENEMY_TYPES, weapons: Sequence[str] = WEAPONS,
+                       lives: int = 5) -> Dict:
+        """
+        Return a level in the format of assets/levels. Enemy types and weapons are picked randomly
+        from the given sequences.
+        """
+        return {
+            "id": level_id,
+            "name": f"Generated {self.seed}",
+            "unlocked": True,
+            "map": map_name,
+            "player": {"name": "Player", "lives": lives, "weapon": "normal"},
+            "enemies": [
+                {
+                    "name": f"Enemy {index + 1}",
+                    "type": self.random.choice(enemy_types),
+                    "lives": lives,
+                    "weapon": self.random.choice(weapons),
+                }
+                for index in range(enemies)
+            ],
+        }
+
+    def write(self, directory: str, name: str, cols: int = 20, rows: int = 15, platform_density: float = 0.5,
+              layers: int = 3, enemies: int = 1, enemy_types: Sequence[str] = ENEMY_TYPES,
+              weapons: Sequence[str] = WEAPONS) -> Tuple[str, str]:
+        """
+        Write <name>.tmx and <name>.json into the directory and return their paths. The level refers
+        to the map by its absolute path, so it can be loaded from any directory.
+        """
+        os.makedirs(directory, exist_ok=True)
+        map_path = os.path.abspath(os.path.join(directory, f"{name}.tmx"))
+        level_path = os.path.join(directory, f"{name}.json")
+
+        image_path = os.path.relpath(os.path.abspath(IMAGE_PATH), os.path.dirname(map_path))
+        tmx = self.generate_map(cols, rows, platform_density, layers, image_path=image_path.replace(os.sep, "/"))
+        with open(map_path, 'w') as f:
+            f.write(tmx)
+
+        level = self.generate_level(map_path, enemies=enemies, enemy_types=enemy_types, weapons=weapons)
+        FileWriter.write_json(level_path, level)
+        return map_path, level_path
+
+    def _generate_background(self, cols: int, rows: int) -> List[List[int]]:
+        """
+        Repeat the 20x15 background tileset over the map.
+        """
+        return [
+            [(y % self.BACKGROUND_ROWS) * self.BACKGROUND_COLUMNS + x % self.BACKGROUND_COLUMNS + 1 for x in range(cols)]
+            for y in range(rows)
+        ]
+
+    def _generate_platforms(self, cols: int, rows: int, platform_rows: Sequence[int],
+                            density: float) -> List[List[int]]:
+        """
+        Fill each platform row with segments separated by gaps. Segment and gap lengths are drawn so
+        that the segments cover roughly the requested share of the row. Short segments are made of
+        bricks, longer ones of ground tiles with rounded ends.
+        """
+        grid = [[0] * cols for _ in range(rows)]
+        density = min(max(density, 0.05), 1.0)
+        for y in platform_rows:
+            x = self.random.randint(0, 3)
+            while x < cols:
+                length = self.random.randint(2, 8)
+                for offset, gid in enumerate(self._segment(length)):
+                    if x + offset < cols:
+                        grid[y][x + offset] = gid
+                gap = round(length * (1 - density) / density)
+                x += length + max(gap + self.random.randint(-1, 1), 1 if density < 1 else 0)
+        return grid
+
+    def _segment(self, length: int) -> List[int]:
+        if length <= 2:
+            return list(self.BRICK_GIDS[:length])
+        return [self.PLATFORM_LEFT, *[self.PLATFORM_MIDDLE] * (length - 2), self.PLATFORM_RIGHT]
+
+    def _generate_signs(self, cols: int, rows: int, platforms: List[List[int]], density: float) -> List[List[int]]:
+        """
+        Place signs on free tiles right above platforms.
+        """
+        grid = [[0] * cols for _ in range(rows)]
+        for y in range(1, rows):
+            for x in range(cols):
+                if platforms[y][x] and not platforms[y - 1][x] and self.random.random() < density:
+                    grid[y - 1][x] = self.random.choice(self.ENVIRONMENT_GIDS)
+        return grid
+
+    def _to_tmx(self, cols: int, rows: int, tile_layers: List[Tuple[str, List[List[int]]]], image_path: str) -> str:
+        """
+        Serialize the layers with the tilesets of map_01.tmx.
+        """
+        size = self.TILE_SIZE
+        layers_xml = []
+        for layer_id, (name, grid) in enumerate(tile_layers, start=1):
+            csv = ",\n".join(",".join(map(str, row)) for row in grid)
+            layers_xml.append(
+                f'  <layer id="{layer_id}" name="{name}" width="{cols}" height="{rows}">\n'
+                f'    <data encoding="csv">\n{csv}\n    </data>\n'
+                f'  </layer>\n'
+            )
+
+        platform_tiles = ["ground_01", "ground_02", "ground_03", "brick_01", "brick_02"]
+        platform_xml = "".join(
+            f'    <tile id="{index}"><image source="{image_path}/map/platformer/{tile}.png" '
+            f'width="{size}" height="{size}"/></tile>\n'
+            for index, tile in enumerate(platform_tiles)
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<map version="1.10" tiledversion="1.11.2" orientation="orthogonal" renderorder="right-down" '
+            f'width="{cols}" height="{rows}" tilewidth="{size}" tileheight="{size}" infinite="0" '
+            f'nextlayerid="{len(tile_layers) + 1}" nextobjectid="1">\n'
+            f'  <tileset firstgid="1" name="background" tilewidth="{size}" tileheight="{size}" '
+            f'tilecount="300" columns="20">\n'
+            f'    <image source="{image_path}/map/background/background.png" width="2560" height="1920"/>\n'
+            f'  </tileset>\n'
+            f'  <tileset firstgid="301" name="environment" tilewidth="480" tileheight="480" tilecount="2" columns="0">\n'
+            f'    <grid orientation="orthogonal" width="1" height="1"/>\n'
+            f'    <tile id="0"><image source="{image_path}/map/environment/sign_01.png" '
+            f'width="{size}" height="{size}"/></tile>\n'
+            f'    <tile id="1"><image source="{image_path}/map/environment/sign_02.png" '
+            f'width="{size}" height="{size}"/></tile>\n'
+            f'  </tileset>\n'
+            f'  <tileset firstgid="401" name="platform" tilewidth="320" tileheight="320" tilecount="5" columns="0">\n'
+            f'    <grid orientation="orthogonal" width="1" height="1"/>\n'
+            f'{platform_xml}'
+            f'  </tileset>\n'
+            f'{"".join(layers_xml)}'
+            '</map>\n'
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a Gun Mayhem map and level for scaling tests.")
+    parser.add_argument("--out", default="generated", help="output directory")
+    parser.add_argument("--name", default="generated")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=15)
+    parser.add_argument("--density", type=float, default=0.5, help="share of each platform row covered")
+    parser.add_argument("--layers", type=int, default=3, help="number of tile layers (at least 3)")
+    parser.add_argument("--enemies", type=int, default=1)
+    parser.add_argument("--types", nargs="+", default=LevelGenerator.ENEMY_TYPES)
+    parser.add_argument("--weapons", nargs="+", default=LevelGenerator.WEAPONS)
+    args = parser.parse_args()
+
+    generator = LevelGenerator(args.seed)
+    paths = generator.write(args.out, args.name, args.cols, args.rows, args.density, args.layers,
+                            args.enemies, args.types, args.weapons)
+    print(*paths, sep="\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import random
+import struct
+from typing import List, Optional
+
+import pygame
+
+from src.enums.entity_states import EntityState
+from src.model.level_result import LevelResult
+from src.weapons.bullet import Bullet
+
+
+class LevelSnapshot:
+    """
+    Capture and restore the whole simulation state of a level scene into a compact binary buffer.
+
+    The buffer has a fixed layout: a header (including the AI scheduler state), the state of the
+    `random` module (used for spawns and respawns), one record per entity (including whether an
+    enemy is due to replan) and one record per bullet. Entities are stored in the order in which
+    the level created them (player first), so restoring only writes the values back into the
+    existing objects. Bullets are restored through the bullet free list (see Bullet.create), so the
+    sprites that are already in the groups are reused and spare ones are kept for later. No assets
+    are loaded during restoring, bullet images are referenced by an index into a table built from
+    the entity weapons (see add_entity).
+    """
+    _HEADER = struct.Struct("<IHIBd2I")
+    _RANDOM = struct.Struct("<625I?d")
+    _ENTITY = struct.Struct("<2i3d4i4?B2?")
+    _BULLET = struct.Struct("<5dHB")
+
+    _RESULT_NONE, _RESULT_LOST, _RESULT_WON = 0, 1, 2
+    _PLAYER_BULLET, _ENEMY_BULLET = 0, 1
+
+    _states: List[EntityState] = list(EntityState)
+    _state_indices = {state: index for index, state in enumerate(EntityState)}
+
+    def __init__(self, level_scene):
+        self.scene = level_scene
+        self._images: List[pygame.Surface] = []
+        self._image_indices = {}
+        for entity in self.entities:
+            self.add_entity(entity)
+
+    @property
+    def entities(self) -> List:
+        """
+        The entities of the scene. They are read from the scene on each use, so the snapshot follows
+        spawned and removed entities without being recreated.
+        """
+        return self.scene.entities
+
+    def add_entity(self, entity) -> None:
+        """
+        Add the bullet images of the entity weapon to the image table. Bullets store only the index
+        of their image. Call for entities added to the scene after the snapshot was created.
+        """
+        for image in entity.weapon.bullet_images:
+            if id(image) not in self._image_indices:
+                self._image_indices[id(image)] = len(self._images)
+                self._images.append(image)
+
+    def size(self) -> int:
+        """
+        Number of bytes needed to store the current state of the level.
+        """
+        bullet_count = len(self.scene.player_bullets) + len(self.scene.enemy_bullets)
+        return (self._HEADER.size + self._RANDOM.size + len(self.entities) * self._ENTITY.size
+                + bullet_count * self._BULLET.size)
+
+    def capture(self, buffer: Optional[bytearray] = None) -> bytearray:
+        """
+        Write the current level state into the buffer. The given buffer is reused (and resized if it
+        is too small), so capturing in each frame does not need to allocate a new buffer.
+        """
+        size = self.size()
+        if buffer is None:
+            buffer = bytearray(size)
+        elif len(buffer) > size:
+            del buffer[size:]
+        elif len(buffer) < size:
+            buffer.extend(bytes(size - len(buffer)))
+
+        self._pack_header(buffer)
+        self._pack_random(buffer)
+        offset = self._HEADER.size + self._RANDOM.size
+        for entity in self.entities:
+            self._pack_entity(buffer, offset, entity)
+            offset += self._ENTITY.size
+
+        for group_index, group in enumerate((self.scene.player_bullets, self.scene.enemy_bullets)):
+            for bullet in group:
+                self._pack_bullet(buffer, offset, bullet, group_index)
+                offset += self._BULLET.size
+        return buffer
+
+    def restore(self, buffer) -> None:
+        """
+        Restore the level state from the buffer created by capture() of the same level.
+        """
+        tick, entity_count, bullet_count, result, finish_time, *scheduler_state = self._HEADER.unpack_from(buffer, 0)
+        if entity_count != len(self.entities):
+            raise ValueError(f"Snapshot contains {entity_count} entities, level has {len(self.entities)}.")
+
+        self.scene.tick = tick
+        self.scene.ai_scheduler.state = tuple(scheduler_state)
+        self.scene.level_result = None if result == self._RESULT_NONE \
+            else LevelResult(result == self._RESULT_WON, finish_time)
+        self.scene._mission_result = None
+        self._unpack_random(buffer)
+
+        offset = self._HEADER.size + self._RANDOM.size
+        for index, entity in enumerate(self.entities):
+            self._unpack_entity(buffer, offset, entity, index)
+            offset += self._ENTITY.size
+
+        self._restore_bullets(buffer, offset, bullet_count)
+
+    def _pack_header(self, buffer):
+        level_result = self.scene.level_result
+        if level_result is None:
+            result, finish_time = self._RESULT_NONE, 0.0
+        else:
+            result = self._RESULT_WON if level_result.player_won else self._RESULT_LOST
+            finish_time = level_result.finish_time
+
+        bullet_count = len(self.scene.player_bullets) + len(self.scene.enemy_bullets)
+        self._HEADER.pack_into(buffer, 0, self.scene.tick, len(self.entities), bullet_count, result, finish_time,
+                               *self.scene.ai_scheduler.state)
+
+    def _pack_random(self, buffer):
+        """
+        The Mersenne Twister state is 624 words and the position in them, gauss_next is cached by
+        random.gauss() between calls.
+        """
+        _, words, gauss_next = random.getstate()
+        self._RANDOM.pack_into(buffer, self._HEADER.size, *words, gauss_next is not None, gauss_next or 0.0)
+
+    def _unpack_random(self, buffer):
+        *words, has_gauss_next, gauss_next = self._RANDOM.unpack_from(buffer, self._HEADER.size)
+        random.setstate((random.Random.VERSION, tuple(words), gauss_next if has_gauss_next else None))
+
+    def _pack_entity(self, buffer, offset, entity):
+        self._ENTITY.pack_into(
+            buffer, offset,
+            entity.rect.x, entity.rect.y,
+            entity.vx, entity.vy, entity.knockback_x,
+            entity.lives, entity.platform, entity.weapon.cooldown, entity.animation.tick,
+            entity.facing_right, entity.shooting, entity.on_ground, entity.skip_platform,
+            self._state_indices[entity.state], entity.alive(), getattr(entity, "replan_due", False)
+        )
+
+    def _unpack_entity(self, buffer, offset, entity, index):
+        (x, y, entity.vx, entity.vy, entity.knockback_x, entity.lives, entity.platform,
+         entity.weapon.cooldown, animation_tick, entity.facing_right, entity.shooting, entity.on_ground,
+         entity.skip_platform, state_index, alive, replan_due) = self._ENTITY.unpack_from(buffer, offset)
+
+        entity.rect.topleft = (x, y)
+        entity.state = self._states[state_index]
+        entity._start_animation(animation_tick)
+        if index:  # the player does not plan
+            entity.replan_due = replan_due
+        self._restore_membership(entity, index, alive)
+
+    def _restore_membership(self, entity, index, alive):
+        """
+        Killed entities are removed from their group, so they have to be added back when restoring
+        a snapshot taken before they were killed (and vice versa).
+        """
+        if not alive:
+            entity.kill()
+        elif not entity.alive():
+            group = self.scene.player_group if index == 0 else self.scene.enemy_group
+            group.add(entity)
+
+    def _pack_bullet(self, buffer, offset, bullet, group_index):
+        image_index = self._image_indices[id(bullet.image)]
+        self._BULLET.pack_into(
+            buffer, offset, bullet.x, bullet.y, bullet.speed, bullet.vy, bullet.damage, image_index, group_index
+        )
+
+    def _restore_bullets(self, buffer, offset, bullet_count):
+        """
+        Kill the bullets in the groups, which returns them to the free list, and create the bullets
+        of the snapshot from it. Sprites are only allocated when the snapshot has more bullets than
+        the free list (creating a bullet is cheap as the images are shared).
+        """
+        groups = (self.scene.player_bullets, self.scene.enemy_bullets)
+        for group in groups:
+            for bullet in group.sprites():
+                bullet.kill()
+
+        for _ in range(bullet_count):
+            x, y, speed, vy, damage, image_index, group_index = self._BULLET.unpack_from(buffer, offset)
+            offset += self._BULLET.size
+
+            bullet = Bullet.create((0, 0), speed, damage, self._images[image_index], vy)
+            bullet.set_position(x, y)
+            groups[group_index].add(bullet)
@@ -1,11 +1,15 @@
+import os
 import pygame
 import pytmx
 
 from collections import defaultdict
 from typing import Dict, List, Tuple
-from pytmx.util_pygame import load_pygame
+from xml.etree import ElementTree
+from pytmx.util_pygame import handle_transformation, smart_convert
 from src.constants.map_layers import PLATFORM_LAYER
 from src.model.map_data import MapData
+from src.utils.asset_pack import AssetPack
+from src.utils.image_loader import ImageLoader
 from src.utils.image_scaler import ImageScaler
 
 
@@ -55,10 +59,44 @@ class MapLoader:
                     surface.blit(image, (x * tmx.tilewidth, y * tmx.tileheight))
 
         scale = (width / (tmx.width * tmx.tilewidth), height / (tmx.height * tmx.tileheight))
-        surface = ImageScaler.scale_image(surface, width, height)
+        scaled = ImageScaler.scale_image(surface, width, height)
+        # The full-size surface is temporary, the scaled map is cached by MapLoader itself.
+        ImageScaler.forget(surface)
+        surface = scaled
         platforms = cls._get_scaled_rects(tmx, scale, PLATFORM_LAYER)
         return MapData(tmx.height, tmx.width, *surface.get_size(), surface, platforms)
 
+    @staticmethod
+    def _image_loader(filename: str, colorkey, **kwargs):
+        """
+        pytmx image loader. Same as pytmx's pygame loader, but the tileset images come from
+        ImageLoader: they are taken from the asset pack when it is active and stay cached when a
+        map is loaded again (see invalidate).
+        """
+        if colorkey:
+            colorkey = pygame.Color(f"#{colorkey}")
+        pixelalpha = kwargs.get("pixelalpha", True)
+        image = ImageLoader.load_image(filename)
+
+        def load_tile(rect=None, flags=None):
+            tile = image.subsurface(rect) if rect else image.copy()
+            if flags:
+                tile = handle_transformation(tile, flags)
+            return smart_convert(tile, colorkey, pixelalpha)
+
+        return load_tile
+
+    @classmethod
+    def _load_tmx(cls, map_path: str) -> pytmx.TiledMap:
+        pack = AssetPack.lookup(map_path)
+        if not pack:
+            return pytmx.TiledMap(map_path, image_loader=cls._image_loader)
+
+        tmx = pytmx.TiledMap(image_loader=cls._image_loader)
+        tmx.filename = map_path
+        tmx.parse_xml(ElementTree.fromstring(bytes(pack.data(map_path))))
+        return tmx
+
     @classmethod
     def load_map(cls, map_path: str, width: int, height: int) -> MapData:
         """
@@ -68,7 +106,7 @@ class MapLoader:
         if key in cls._cache:
             return cls._cache[key]
 
-        tmx = load_pygame(map_path)
+        tmx = cls._load_tmx(map_path)
         map_width = tmx.width * tmx.tilewidth
         map_height = tmx.height * tmx.tileheight
         surface = pygame.Surface((map_width, map_height))
@@ -76,3 +114,16 @@ class MapLoader:
         map_data = cls._create_map(surface, tmx, width, height)
         cls._cache[key] = map_data
         return map_data
+
+    @classmethod
+    def invalidate(cls, map_path: str) -> int:
+        """
+        Drop the cached maps (at all sizes) of a changed map file, so the next load_map reads it again.
+        Tileset images stay cached by ImageLoader, the map surfaces are only referenced by this cache
+        (see _create_map) and are freed. Returns the number of dropped maps.
+        """
+        path = os.path.normpath(map_path)
+        stale = [key for key in cls._cache if os.path.normpath(key[0]) == path]
+        for key in stale:
+            del cls._cache[key]
+        return len(stale)
@@ -0,0 +1,118 @@
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pygame
+
+from src.constants.paths import IMAGE_PATH, MIP_PATH
+
+
+class MipBuilder:
+    """
+    Offline build step for sprite mip levels. For every image under assets/images it writes a halving
+    chain (level 1 is half the size of the original, level 2 a quarter, ...) down to MIN_SIZE pixels
+    and a horizontally flipped variant of every level, including the original (level 0). Each level
+    is smoothscaled from the previous one, which gives cleaner large downscales than one smoothscale
+    from the original. Mips are stored as uncompressed BMP files (which keep the alpha channel),
+    decoding them is much cheaper than decoding the PNG and scaling it.
+
+    Images are processed in parallel by a process pool. An image is skipped when its mips are newer
+    than the image, so only changed images are built again.
+
+    ImageScaler picks the smallest mip that is still at least as large as the requested size and
+    only does the final scale. Missing mips are not an error, the original image is scaled then,
+    and so it is when loose mips are older than their image (the image was edited after the build).
+    """
+    MIN_SIZE = 16
+    EXTENSION = ".bmp"
+
+    @staticmethod
+    def level_size(size: Tuple[int, int], level: int) -> Tuple[int, int]:
+        width, height = size
+        return max(1, width >> level), max(1, height >> level)
+
+    @classmethod
+    def levels(cls, size: Tuple[int, int]) -> int:
+        """
+        Number of mip levels of an image with the size (without the original).
+        """
+        level = 0
+        while min(cls.level_size(size, level + 1)) >= cls.MIN_SIZE:
+            level += 1
+        return level
+
+    @classmethod
+    def mip_path(cls, path: str, level: int, flipped: bool = False, root: str = IMAGE_PATH, out: str = MIP_PATH) -> str:
+        """
+        Path of a mip of the image: <out>/<image path relative to root without extension>/<level>.bmp
+        (with a _flipped suffix for the flipped variant).
+        """
+        name = os.path.splitext(os.path.relpath(path, root))[0]
+        return os.path.join(out, name, f"{level}{'_flipped' if flipped else ''}{cls.EXTENSION}")
+
+    @classmethod
+    def up_to_date(cls, path: str, root: str = IMAGE_PATH, out: str = MIP_PATH) -> bool:
+        """
+        Whether the mips of the image are complete and not older than the image.
+        """
+        first = cls.mip_path(path, 0, True, root, out)
+        try:
+            return os.path.getmtime(first) >= os.path.getmtime(path)
+        except OSError:
+            return False
+
+    @classmethod
+    def build(cls, root: str = IMAGE_PATH, out: str = MIP_PATH, workers: Optional[int] = None) -> int:
+        """
+        Build the mips of all images under root. Returns the number of images built.
+        """
+        paths = sorted(glob.glob(os.path.join(root, "**", "*.png"), recursive=True))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            built = executor.map(_build_image, paths, [root] * len(paths), [out] * len(paths))
+            return sum(built)
+
+    @classmethod
+    def build_image(cls, path: str, root: str = IMAGE_PATH, out: str = MIP_PATH) -> bool:
+        """
+        Build the mips of one image unless they are up to date. Returns whether they were built.
+        """
+        if cls.up_to_date(path, root, out):
+            return False
+
+        image = pygame.image.load(path)
+        os.makedirs(os.path.dirname(cls.mip_path(path, 0, True, root, out)), exist_ok=True)
+        outputs: List[Tuple[str, pygame.Surface]] = []
+        mip = image
+        for level in range(cls.levels(image.get_size()) + 1):
+            if level:
+                mip = pygame.transform.smoothscale(mip, cls.level_size(image.get_size(), level))
+                outputs.append((cls.mip_path(path, level, False, root, out), mip))
+            outputs.append((cls.mip_path(path, level, True, root, out), pygame.transform.flip(mip, True, False)))
+
+        # The flipped original is written last, it marks the mips of the image as complete.
+        for mip_path, surface in reversed(outputs):
+            pygame.image.save(surface, mip_path)
+        return True
+
+
+def _build_image(path: str, root: str, out: str) -> bool:
+    return MipBuilder.build_image(path, root, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build mip levels of all sprites.")
+    parser.add_argument("--root", default=IMAGE_PATH)
+    parser.add_argument("--out", default=MIP_PATH)
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: all cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = MipBuilder.build(args.root, args.out, args.workers)
+    print(f"Built mips of {count} images into {args.out} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
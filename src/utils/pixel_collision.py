@@ -0,0 +1,36 @@
+from typing import Dict, Tuple
+
+import pygame
+
+from src.utils.image_masker import ImageMasker
+from src.utils.swept_collision import SweptCollision
+
+
+class PixelCollision:
+    """
+    Pixel-perfect hit detection. The swept rect test is used as a cheap broadphase and the mask of
+    the entity's current animation frame is only checked when the rects overlap. The filled masks of
+    the sweep rects are cached by size (bullets of one weapon always sweep the same size).
+    """
+    _filled: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+
+    @staticmethod
+    def bullet_hit(entity, bullet) -> bool:
+        """
+        Collision callback for pygame sprite collide functions (entity first, bullet second). The
+        whole area the bullet swept in the last frame is tested against the opaque entity pixels.
+        """
+        if not SweptCollision.bullet_hit(entity, bullet):
+            return False
+
+        image, position = entity.current_frame()
+        sweep = bullet.sweep_rect
+        offset = (sweep.x - position[0], sweep.y - position[1])
+        return ImageMasker.get_mask(image).overlap(PixelCollision._filled_mask(sweep.size), offset) is not None
+
+    @classmethod
+    def _filled_mask(cls, size: Tuple[int, int]) -> pygame.mask.Mask:
+        mask = cls._filled.get(size)
+        if mask is None:
+            mask = cls._filled[size] = pygame.mask.Mask(size, fill=True)
+        return mask
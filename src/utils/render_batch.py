@@ -0,0 +1,49 @@
+from typing import List, Tuple, Union
+
+import pygame
+
+Destination = Union[Tuple[int, int], pygame.Rect]
+
+
+class RenderLayer:
+    """
+    Collects blits of one layer. It has the blit() method of a surface, so drawing code (for example
+    Entity.draw) can draw into a layer without knowing that the blit is deferred.
+    """
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items: List[Tuple[pygame.Surface, Destination]] = []
+
+    def blit(self, source: pygame.Surface, dest: Destination) -> None:
+        self.items.append((source, dest))
+
+    def extend(self, items) -> None:
+        self.items.extend(items)
+
+
+class RenderBatch:
+    """
+    Deferred drawing of many small images. During the frame the images are collected into layers,
+    flush() then submits all of them, ordered by layer, with a single Surface.blits call. This saves
+    the Python call overhead of one blit per image, which dominates drawing with many bullets.
+    Drawing code passes positions as tuples captured while collecting (see LevelScene.describe), so
+    the collected blits stay valid when sprites move or are reused before they are flushed or
+    rendered on the render thread.
+    """
+
+    def __init__(self, layers: int):
+        self.layers = [RenderLayer() for _ in range(layers)]
+
+    def take(self) -> Tuple[Tuple[pygame.Surface, Destination], ...]:
+        """
+        Return the collected blits ordered by layer and empty the layers.
+        """
+        items = []
+        for layer in self.layers:
+            items.extend(layer.items)
+            layer.items.clear()
+        return tuple(items)
+
+    def flush(self, surface: pygame.Surface) -> None:
+        surface.blits(self.take(), doreturn=False)
@@ -0,0 +1,89 @@
+import atexit
+import copy
+import json
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+from src.constants.paths import SAVE
+from src.utils.file_writer import FileWriter
+
+
+class SaveStore:
+    """
+    Player progress, kept apart from the read-only level definitions. Values are read and changed
+    in memory; writing them is left to a background thread, so the game loop never waits for the
+    disk. Changes made while a write is pending are coalesced into one write (the writer waits
+    COALESCE_DELAY seconds before taking the data), and each write replaces the save file
+    atomically (see FileWriter.write_json_atomic).
+
+    Pending changes are written at exit. A save file that cannot be read is reported and the
+    progress starts from scratch, write errors are reported and retried with the next change.
+    """
+    COALESCE_DELAY = 0.5
+
+    def __init__(self, path: str = SAVE):
+        self.path = path
+        self._data: Dict[str, Any] = self._load()
+        self._condition = threading.Condition()
+        self._pending = False
+        self._writing = False
+        self._flush_requested = False
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[Save Store] Progress could not be loaded from {self.path}: {e}", file=sys.stderr)
+            return {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._condition:
+            return copy.deepcopy(self._data.get(key, default))
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Change a value and schedule writing the save file. Does not wait for the write.
+        """
+        with self._condition:
+            self._data[key] = copy.deepcopy(value)
+            self._pending = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-store", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all changes are written (or the timeout passes). Returns whether they are.
+        """
+        with self._condition:
+            self._flush_requested = self._pending
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                # Give further changes a moment to arrive, flush() cuts the wait short.
+                self._condition.wait_for(lambda: self._flush_requested, self.COALESCE_DELAY)
+                data = copy.deepcopy(self._data)
+                self._pending = self._flush_requested = False
+                self._writing = True
+
+            try:
+                FileWriter.write_json_atomic(self.path, data)
+                self.writes += 1
+            except OSError as e:
+                print(f"[Save Store] Progress could not be saved to {self.path}: {e}", file=sys.stderr)
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -0,0 +1,39 @@
+import pygame
+
+from typing import Optional
+
+
+class SweptCollision:
+    """
+    Collision tests that take into account the whole movement during one frame instead of only the
+    final position. Fast objects cannot skip over thin platforms or small hitboxes, so the result does
+    not depend on the frame rate (speeds per frame grow with resolution and with lower tick rates).
+    """
+
+    @staticmethod
+    def crossed_top(tile: pygame.Rect, previous_bottom: float, bottom: float) -> bool:
+        """
+        Check if a falling rect crossed (or touched) the top of the tile while moving from
+        previous_bottom to bottom.
+        """
+        return previous_bottom <= tile.top <= bottom
+
+    @staticmethod
+    def sweep(rect: pygame.Rect, previous_x: int, out: pygame.Rect, previous_y: Optional[int] = None) -> pygame.Rect:
+        """
+        Store the area covered by a moving rect during the frame into `out`. For rects also moving
+        vertically (previous_y given) it is the bounding box of the path.
+        """
+        if previous_y is None or previous_y == rect.y:
+            out.update(min(previous_x, rect.x), rect.y, rect.width + abs(rect.x - previous_x), rect.height)
+        else:
+            out.update(min(previous_x, rect.x), min(previous_y, rect.y),
+                       rect.width + abs(rect.x - previous_x), rect.height + abs(rect.y - previous_y))
+        return out
+
+    @staticmethod
+    def bullet_hit(entity, bullet) -> bool:
+        """
+        Collision callback for pygame sprite collide functions (entity first, bullet second).
+        """
+        return entity.rect.colliderect(bullet.sweep_rect)
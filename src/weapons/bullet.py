@@ -1,33 +1,79 @@
 import pygame
 
-from typing import Tuple
+from typing import List, Tuple
+from src.utils.swept_collision import SweptCollision
 
 class Bullet(pygame.sprite.Sprite):
     """
     Bullet class to represent a projectile fired by a weapon. The damage is initial number
     of pixels by which the entity is knocked back (summed to current knockback and entity
-    moving speed). The damage effect is relaxed in each frame until it reaches 0.
+    moving speed). The damage effect is relaxed in each frame until it reaches 0. The sweep rect
+    covers the whole path the bullet travelled in the last frame and is used for hit detection.
+
+    The position is kept in float x and y and the rect is rounded from it, so speeds below one pixel
+    per frame (fanned volleys, high tick rates) still add up instead of being truncated each frame.
+
+    Killed bullets are kept in a free list and reused by create(), weapons firing large volleys
+    then do not allocate new sprites.
     """
-    def __init__(self, position: Tuple[int, int], speed: float, damage: float, image: pygame.Surface):
+    _free: List["Bullet"] = []
+
+    def __init__(self, position: Tuple[int, int], speed: float, damage: float, image: pygame.Surface,
+                 vy: float = 0.0):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.sweep_rect = pygame.Rect(0, 0, 0, 0)
+        self._reset(position, speed, damage, image, vy)
+
+    @classmethod
+    def create(cls, position: Tuple[int, int], speed: float, damage: float, image: pygame.Surface,
+               vy: float = 0.0) -> "Bullet":
+        if cls._free:
+            bullet = cls._free.pop()
+            bullet._reset(position, speed, damage, image, vy)
+            return bullet
+        return cls(position, speed, damage, image, vy)
+
+    def _reset(self, position: Tuple[int, int], speed: float, damage: float, image: pygame.Surface, vy: float):
         self.speed = speed
+        self.vy = vy
         self.damage = damage
         self.image = image
-        self.rect = (self.image.get_rect(center=position))
+        self.rect.size = image.get_size()
+        self.rect.center = position
+        self.x, self.y = self.rect.topleft
+        self.sweep_rect.update(self.rect)
+
+    def set_position(self, x: float, y: float) -> None:
+        """
+        Place the top left corner of the bullet (used when restoring a level snapshot).
+        """
+        self.x, self.y = x, y
+        self.rect.topleft = (x, y)
+        self.sweep_rect.update(self.rect)
+
+    def kill(self) -> None:
+        """
+        Remove the bullet from all groups and keep it for reuse.
+        """
+        if self.alive():
+            super().kill()
+            Bullet._free.append(self)
 
-    def update(self, map_width: int) -> None:
+    def update(self, map_width: int, map_height: int) -> None:
         """
-        Update bullet position. And destroy bullet if it goes off the map.
+        Update bullet position and its sweep rect. And destroy bullet if it goes off the map.
         """
-        self.rect.x += self.speed
-        if self._is_off_map(map_width):
+        previous_x, previous_y = self.rect.topleft
+        self.x += self.speed
+        self.y += self.vy
+        self.rect.topleft = (self.x, self.y)  # rounded to whole pixels by pygame
+        SweptCollision.sweep(self.rect, previous_x, self.sweep_rect, previous_y)
+        if self._is_off_map(map_width, map_height):
             self.kill()
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.blit(self.image, self.rect)
 
-    def _is_off_map(self, map_width: int) -> bool:
-        return self.rect.right < 0 or self.rect.left > map_width
-
-
-
+    def _is_off_map(self, map_width: int, map_height: int) -> bool:
+        return self.rect.right < 0 or self.rect.left > map_width or self.rect.bottom < 0 or self.rect.top > map_height
@@ -1,36 +1,94 @@
-from typing import Callable, Tuple
+import math
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
+from src.effects.particle_system import ParticleSystem
+from src.model.weapon_definition import WeaponDefinition
 from src.weapons.bullet import Bullet
 
+Volley = List[Tuple[int, int, float, float, float]]
+
+
 class Weapon:
     """
-    Base class for all weapons. Contains bullet creation logic and method for shooting. THe bullet
-    images is a tuple of two images, one for each buller direction (right and left).
+    Weapon firing volleys described by a WeaponDefinition. The bullet images is a tuple of two images,
+    one for each bullet direction (right and left).
+
+    The volley pattern is compiled once into per-bullet (offset x, offset y, speed x, speed y, damage)
+    records for both directions, so firing only creates the bullets and adds the whole volley to the
+    bullet group in one call. The fire rate is given by the cooldown counted in simulation ticks.
     """
-    def __init__(self, on_bullet_created: Callable[[Bullet], None], bullet_images: list[pygame.Surface],
-                 bullet_speed: float, bullet_damage: float) -> None:
+    _volley_cache: Dict[Tuple[WeaponDefinition, int, float, float], Tuple[Volley, Volley]] = {}
+
+    def __init__(self, definition: WeaponDefinition, on_bullet_created: Callable[..., None],
+                 bullet_images: list[pygame.Surface], bullet_speed: float, bullet_damage: float,
+                 tick_rate: int, effects: Optional[ParticleSystem] = None) -> None:
+        self.definition = definition
         self.on_bullet_created = on_bullet_created
         self.bullet_images = bullet_images
-        self.bullet_speed = bullet_speed
-        self.bullet_damage = bullet_damage
+        self.bullet_speed = bullet_speed * definition.speed
+        self.bullet_damage = bullet_damage * definition.damage
+        self.cooldown_ticks = max(1, round(definition.cooldown * tick_rate))
+        self.cooldown = 0
+        self.effects = effects
+        self._volleys = self._compile_volleys()
+
+    def _compile_volleys(self) -> Tuple[Volley, Volley]:
+        """
+        Compute the volley records for shooting right and left. Volleys are cached by the definition,
+        bullet size, speed and damage, entities of the same kind share them.
+        """
+        bullet_height = self.bullet_images[0].get_height()
+        key = (self.definition, bullet_height, self.bullet_speed, self.bullet_damage)
+        if key not in self._volley_cache:
+            right = self._compile_volley(bullet_height)
+            left = [(-dx, dy, -vx, vy, -damage) for dx, dy, vx, vy, damage in right]
+            self._volley_cache[key] = (right, left)
+        return self._volley_cache[key]
+
+    def _compile_volley(self, bullet_height: int) -> Volley:
+        """
+        Bullets are centered around the muzzle: stacked `spacing` bullet heights apart and fanned
+        evenly over `spread` degrees. Bullets on the fan edges still knock back horizontally with
+        the full damage.
+        """
+        count, spacing, spread = self.definition.count, self.definition.spacing, self.definition.spread
+        volley = []
+        for index in range(count):
+            position = index - (count - 1) / 2
+            angle = math.radians(spread * position / (count - 1)) if count > 1 else 0.0
+            dy = round(position * spacing * bullet_height)
+            vx, vy = self.bullet_speed * math.cos(angle), self.bullet_speed * math.sin(angle)
+            volley.append((0, dy, vx, vy, self.bullet_damage))
+        return volley
+
+    @property
+    def ready(self) -> bool:
+        return self.cooldown == 0
+
+    def update(self) -> None:
+        """
+        Count down the cooldown, called once per simulation tick by the entity.
+        """
+        if self.cooldown:
+            self.cooldown -= 1
 
     def shoot(self, position: Tuple[int, int], facing_right: bool) -> None:
         """
-        Fire a bullet based on the given position and facing direction. The on_bullet_created
-        callback adds the bullet to the bullet group (player or enemy).
+        Fire a volley from the given position in the facing direction and start the cooldown. The
+        on_bullet_created callback adds the bullets to the bullet group (player or enemy). A muzzle
+        flash is emitted when the weapon has effects.
         """
         if facing_right:
-            speed = self.bullet_speed
-            damage = self.bullet_damage
-            image = self.bullet_images[0]
+            volley, image = self._volleys[0], self.bullet_images[0]
         else:
-            speed = -self.bullet_speed
-            damage = -self.bullet_damage
-            image = self.bullet_images[1]
-
-        bullet = Bullet(position, speed, damage, image)
-        self.on_bullet_created(bullet)
-
+            volley, image = self._volleys[1], self.bullet_images[1]
 
+        x, y = position
+        self.on_bullet_created(*[
+            Bullet.create((x + dx, y + dy), vx, damage, image, vy) for dx, dy, vx, vy, damage in volley
+        ])
+        self.cooldown = self.cooldown_ticks
+        if self.effects:
+            self.effects.muzzle_flash(position, facing_right)
@@ -1,23 +1,45 @@
-from src.weapons.triple_shotter import TripleShotter
+from typing import Dict
+
+from src.constants.paths import WEAPON_PATH
+from src.model.weapon_definition import WeaponDefinition
+from src.utils.asset_pack import AssetPack
+from src.utils.file_reader import FileReader
 from src.weapons.weapon import Weapon
 
 
 class WeaponFactory:
     """
-    Factory class for creating weapons based on the weapon name.
+    Factory class for creating weapons from their definitions. Weapons are defined by JSON files
+    in the weapons directory (see WeaponDefinition), they are loaded on first use. Level files
+    refer to weapons by name, LevelCompiler resolves the names with get_definition().
     """
 
-    _weapon_classes = {
-        "normal": Weapon,
-        "triple": TripleShotter,
-    }
+    _definitions: Dict[str, WeaponDefinition] = {}
+
+    @classmethod
+    def _load_definitions(cls) -> Dict[str, WeaponDefinition]:
+        if not cls._definitions:
+            for path in AssetPack.find(WEAPON_PATH, '*.json'):
+                definition = WeaponDefinition(**FileReader.read_json(path))
+                cls._definitions[definition.name] = definition
+        return cls._definitions
+
+    @classmethod
+    def get_definition(cls, weapon_name: str) -> WeaponDefinition:
+        definitions = cls._load_definitions()
+        if weapon_name.lower() not in definitions:
+            raise ValueError(f"unknown weapon '{weapon_name}' (known: {', '.join(definitions)})")
+        return definitions[weapon_name.lower()]
 
     @staticmethod
-    def get_weapon(weapon_name: str, on_bullet_created, bullet_images, bullet_speed, bullet_damage):
-        weapon_class = WeaponFactory._weapon_classes.get(weapon_name.lower())
-        return weapon_class(
+    def get_weapon(definition: WeaponDefinition, on_bullet_created, bullet_images, bullet_speed, bullet_damage,
+                   tick_rate, effects=None) -> Weapon:
+        return Weapon(
+            definition=definition,
             on_bullet_created=on_bullet_created,
             bullet_images=bullet_images,
             bullet_speed=bullet_speed,
-            bullet_damage=bullet_damage
+            bullet_damage=bullet_damage,
+            tick_rate=tick_rate,
+            effects=effects
         )
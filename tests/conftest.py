@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from src.constants.paths import LEVEL_PATH
+from src.entities.player_bot import PlayerBot
+from src.managers.game_manager import GameManager
+from src.managers.level_manager import LevelManager
+from src.scenes.headless_level_scene import HeadlessLevelScene
+from src.utils.level_catalog import LevelCatalog
+from src.utils.level_compiler import LevelCompiler
+from src.utils.save_store import SaveStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def game_root():
+    """
+    Asset paths are relative to the repository root, the tests run from there without a window.
+    """
+    previous = os.getcwd()
+    os.chdir(ROOT)
+    HeadlessLevelScene.init_display()
+    yield ROOT
+    os.chdir(previous)
+
+
+@pytest.fixture
+def level_manager(tmp_path):
+    """
+    Level manager whose save file and level index are kept in a temporary folder.
+    """
+    return LevelManager(SaveStore(str(tmp_path / "save.json")),
+                        LevelCatalog(LEVEL_PATH, str(tmp_path / "level_index.json")))
+
+
+@pytest.fixture
+def level_scene(level_manager):
+    """
+    Create a started headless scene of the given level file with the player driven by PlayerBot.
+    """
+    def create(name: str = "06.json") -> HeadlessLevelScene:
+        level = LevelCompiler.load_level(os.path.join(LEVEL_PATH, name))
+        scene = HeadlessLevelScene(level, GameManager(audio_enabled=False), level_manager)
+        scene.initialize()
+        scene.player.input_source = PlayerBot(scene)
+        return scene
+    return create
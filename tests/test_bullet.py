@@ -0,0 +1,13 @@
+import pygame
+
+from src.weapons.bullet import Bullet
+
+
+def test_slow_vertical_speed_accumulates():
+    bullet = Bullet.create((100, 100), 0.6, 1.0, pygame.Surface((8, 4)), vy=0.25)
+    start = bullet.rect.topleft
+    for _ in range(20):
+        bullet.update(1000, 1000)
+
+    assert bullet.rect.x == start[0] + 12
+    assert bullet.rect.y == start[1] + 5
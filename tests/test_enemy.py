@@ -0,0 +1,31 @@
+def _platform_right_edge(map_data, top):
+    """
+    Right end of a platform at the given height: the last column with a tile at that top.
+    """
+    columns = sorted(col for col, tiles in map_data.platforms.items() if any(tile.top == top for tile in tiles))
+    for col in columns:
+        if col + 1 not in columns:
+            return next(tile for tile in map_data.platforms[col] if tile.top == top).right
+
+
+def test_enemy_stops_at_platform_edge_when_plan_is_not_due(level_scene):
+    scene = level_scene("01.json")
+    enemy = None
+    while enemy is None:
+        scene.update()
+        enemy = next((enemy for enemy in scene.enemy_group if enemy.on_ground), None)
+
+    platform = enemy.platform
+    enemy.rect.right = _platform_right_edge(scene.map_data, enemy.platform) + enemy.rect.width // 4
+    enemy.facing_right = True
+    enemy.vx = enemy.physics.move_speed
+    enemy.knockback_x = 0
+    scene.perception.player_platform = enemy.platform
+    scene.perception.player_center = scene.map_data.width
+
+    for _ in range(30):
+        enemy.replan_due = False
+        enemy.update(perception=scene.perception)
+
+    assert enemy.on_ground and enemy.platform == platform
+    assert enemy.vx == 0
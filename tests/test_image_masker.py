@@ -0,0 +1,13 @@
+import pygame
+
+from src.utils.image_masker import ImageMasker
+
+
+def test_mask_is_dropped_with_its_image():
+    opaque = pygame.Surface((4, 4), pygame.SRCALPHA)
+    opaque.fill((0, 0, 0, 255))
+    assert ImageMasker.get_mask(opaque).count() == 16
+    del opaque
+
+    transparent = pygame.Surface((4, 4), pygame.SRCALPHA)
+    assert ImageMasker.get_mask(transparent).count() == 0
@@ -0,0 +1,32 @@
+import json
+import os
+import shutil
+
+from src.constants.paths import LEVEL_PATH
+from src.utils.asset_pack import AssetPack
+from src.utils.level_catalog import LevelCatalog
+
+
+def test_loose_level_added_after_the_pack_is_listed(tmp_path, monkeypatch):
+    levels = tmp_path / "levels"
+    levels.mkdir()
+    for name in ("01.json", "02.json"):
+        shutil.copy(os.path.join(LEVEL_PATH, name), levels / name)
+    pack_path = str(tmp_path / "assets.pack")
+    AssetPack.build(pack_path, str(tmp_path))
+    monkeypatch.setattr(AssetPack, "active", AssetPack(pack_path))
+    pack_time = AssetPack.active.mtime_ns
+
+    data = json.loads((levels / "01.json").read_text())
+    data.update(id=7, name="Added Level")
+    (levels / "07.json").write_text(json.dumps(data))
+    os.utime(levels / "07.json", ns=(pack_time + 10 ** 9, pack_time + 10 ** 9))
+    # An unchanged loose copy is older than the pack and stays packed.
+    os.utime(levels / "02.json", ns=(pack_time - 10 ** 9, pack_time - 10 ** 9))
+
+    catalog = LevelCatalog(str(levels), str(tmp_path / "level_index.json"))
+    assert [os.path.basename(entry.path) for entry in catalog.entries] == ["01.json", "02.json", "07.json"]
+    assert catalog.entries[-1].name == "Added Level"
+
+    index = json.loads((tmp_path / "level_index.json").read_text())["levels"]
+    assert len(index[str(levels / "02.json")]["signature"]) == 3
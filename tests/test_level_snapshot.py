@@ -0,0 +1,34 @@
+from src.weapons.bullet import Bullet
+
+
+def _run(scene, ticks):
+    states = []
+    for _ in range(ticks):
+        scene.update()
+        states.append(bytes(scene.save_state()))
+    return states
+
+
+def test_restore_replays_the_same_frames(level_scene):
+    scene = level_scene()
+    _run(scene, 100)
+    state = bytes(scene.save_state())
+    expected = _run(scene, 300)
+
+    scene.load_state(state)
+    assert _run(scene, 300) == expected
+
+
+def test_restore_keeps_spare_bullets_in_the_free_list(level_scene):
+    scene = level_scene()
+    state = bytes(scene.save_state())
+
+    def pooled_bullets():
+        return {*Bullet._free, *scene.player_bullets, *scene.enemy_bullets}
+
+    for _ in range(3):
+        _run(scene, 200)
+        bullets = pooled_bullets()
+        assert len(scene.player_bullets) + len(scene.enemy_bullets) > 0
+        scene.load_state(state)
+        assert pooled_bullets() >= bullets
@@ -0,0 +1,13 @@
+import numpy as np
+
+from src.rl.spaces import Box
+
+
+def test_box_samples_unbounded_dimensions():
+    rng = np.random.default_rng(0)
+    for low, high in ((-np.inf, np.inf), (0.0, np.inf), (-np.inf, 0.0), (-1.0, 1.0)):
+        space = Box(low, high, (21,))
+        sample = space.sample(rng)
+        assert sample.dtype == np.float32
+        assert np.all(np.isfinite(sample))
+        assert space.contains(sample)
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pygame
+
+from src.enums.entity_states import EntityState
+from src.server.state_delta import StateDelta
+
+
+def _entity(x, y, lives=3):
+    return SimpleNamespace(rect=pygame.Rect(x, y, 10, 10), lives=lives, facing_right=True, shooting=False,
+                           on_ground=True, state=EntityState.IDLE, alive=lambda: True)
+
+
+def _scene(entities, tick=0):
+    return SimpleNamespace(entities=entities, tick=tick, level_result=None, player_bullets=[], enemy_bullets=[])
+
+
+def test_keyframe_contains_unchanged_entities():
+    entities = [_entity(index * 10, 0) for index in range(4)]
+    delta = StateDelta()
+    delta.encode(_scene(entities, 1))
+    entities[2].rect.x += 1
+    scene = _scene(entities, 2)
+
+    assert set(StateDelta.decode(delta.encode(scene))["entities"]) == {2}
+    keyframe = StateDelta.decode(delta.keyframe(scene))
+    assert keyframe["keyframe"]
+    assert set(keyframe["entities"]) == {0, 1, 2, 3}
+    assert keyframe["entities"][2][0] == 21
+
+
+def test_large_levels_are_encoded():
+    entities = [_entity(40000 + index, -40000, 70000) for index in range(300)]
+    state = StateDelta.decode(StateDelta().encode(_scene(entities)))
+
+    assert len(state["entities"]) == 300
+    assert state["entities"][299][:3] == (40299, -40000, 0xFFFF)